@@ -0,0 +1,85 @@
+"""
+JSON 코덱 벤치마크
+
+요청 본문의 전송 크기와 직렬화/역직렬화 CPU 시간을 비교합니다.
+`baseline`은 기존 방식(`json.dumps`, `ensure_ascii=True`)입니다.
+
+    PYTHONPATH=. python benchmarks/bench_codec.py
+"""
+import base64
+import json
+import os
+import timeit
+
+from etripy.codec import JSONCodec, OrjsonCodec, orjson
+
+TEXT = "윤동주는 일제 강점기의 시인으로, 서울 연희전문학교를 졸업했다. " * 200
+
+
+class BaselineCodec(JSONCodec):
+    name = "baseline"
+
+    def dumps(self, obj):
+        return json.dumps(obj).encode("utf-8")
+
+
+def payloads():
+    return {
+        "analysis": {"argument": {"analysis_code": "srl", "text": TEXT}},
+        "coreference": {"argument": {"text": TEXT}},
+        "image(1MB)": {
+            "argument": {
+                "type": "jpg",
+                "file": base64.b64encode(os.urandom(1024 * 1024)).decode(),
+            }
+        },
+    }
+
+
+def response():
+    # 언어 분석 응답과 비슷한 모양의 큰 응답
+    sentences = [
+        {
+            "id": i,
+            "text": "윤동주는 일제 강점기의 시인이다.",
+            "morp": [
+                {
+                    "id": j,
+                    "lemma": "윤동주",
+                    "type": "NNP",
+                    "position": j * 3,
+                    "weight": 0.9,
+                }
+                for j in range(40)
+            ],
+            "NE": [{"id": 0, "text": "윤동주", "type": "PS_NAME", "begin": 0, "end": 0}],
+        }
+        for i in range(500)
+    ]
+    return {"result": 0, "return_object": {"sentence": sentences}}
+
+
+def main() -> None:
+    codecs = [BaselineCodec(), JSONCodec()]
+    if orjson is not None:
+        codecs.append(OrjsonCodec())
+
+    print(f"{'payload':<14}{'codec':<10}{'bytes':>12}{'dumps(ms)':>12}")
+    for name, payload in payloads().items():
+        for codec in codecs:
+            size = len(codec.dumps(payload))
+            seconds = min(
+                timeit.repeat(lambda: codec.dumps(payload), number=20, repeat=3)
+            )
+            print(f"{name:<14}{codec.name:<10}{size:>12,}{seconds / 20 * 1000:>12.3f}")
+
+    body = BaselineCodec().dumps(response())
+    print(f"\nresponse {len(body):,} bytes")
+    print(f"{'codec':<10}{'loads(ms)':>12}")
+    for codec in codecs[1:]:
+        seconds = min(timeit.repeat(lambda: codec.loads(body), number=20, repeat=3))
+        print(f"{codec.name:<10}{seconds / 20 * 1000:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+언어 분석 필드 선택 벤치마크
+
+모든 분석 결과가 들어 있는 큰 언어 분석(`srl`) 응답에서 `fields=("morp", "NE")`만 남길 때,
+응답 하나를 받아 들고 있는 메모리와 역직렬화 시간을 비교합니다.
+`decode_executor="process"`일 때는 프로세스 풀에서 버린 필드가 넘어오지 않으므로 메인 프로세스의 조립 시간도 비교합니다.
+
+    PYTHONPATH=. python benchmarks/bench_fields.py
+"""
+import gc
+import pickle
+import time
+import tracemalloc
+
+from etripy.codec import (
+    JSONCodec,
+    OrjsonCodec,
+    analysis_fields,
+    decode,
+    decode_pieces,
+    orjson,
+)
+
+SENTENCES = 2000
+MORPHEMES = 30
+
+
+def response() -> dict:
+    # 모든 분석 결과가 들어 있는 언어 분석 응답과 비슷한 모양의 응답
+    sentences = []
+    for i in range(SENTENCES):
+        words = MORPHEMES // 2
+        sentences.append(
+            {
+                "id": i,
+                "reserve_str": "",
+                "text": "윤동주는 일제 강점기의 시인이다.",
+                "morp": [
+                    {
+                        "id": j,
+                        "lemma": f"형태소{j}",
+                        "type": "NNG",
+                        "position": j * 3,
+                        "weight": 0.9,
+                    }
+                    for j in range(MORPHEMES)
+                ],
+                "morp_eval": [
+                    {
+                        "id": j,
+                        "result": "윤동주/NNP+는/JX",
+                        "target": "윤동주는",
+                        "word_id": j,
+                        "m_begin": j * 2,
+                        "m_end": j * 2 + 1,
+                    }
+                    for j in range(words)
+                ],
+                "WSD": [
+                    {
+                        "id": j,
+                        "text": f"형태소{j}",
+                        "type": "NNG",
+                        "scode": "01",
+                        "weight": 1,
+                        "position": j * 3,
+                        "begin": j,
+                        "end": j,
+                    }
+                    for j in range(MORPHEMES)
+                ],
+                "word": [
+                    {
+                        "id": j,
+                        "text": f"어절{j}",
+                        "type": "",
+                        "begin": j * 2,
+                        "end": j * 2 + 1,
+                    }
+                    for j in range(words)
+                ],
+                "NE": [
+                    {
+                        "id": 0,
+                        "text": "윤동주",
+                        "type": "PS_NAME",
+                        "begin": 0,
+                        "end": 0,
+                        "weight": 0.9,
+                        "common_noun": 0,
+                    }
+                ],
+                "chunk": [],
+                "dependency": [
+                    {
+                        "id": j,
+                        "text": f"어절{j}",
+                        "head": j + 1,
+                        "label": "NP_SBJ",
+                        "mod": [j - 1] if j else [],
+                        "weight": 0.8,
+                    }
+                    for j in range(words)
+                ],
+                "phrase_dependency": [
+                    {
+                        "id": j,
+                        "label": "NP",
+                        "text": f"어절{j}",
+                        "begin": j,
+                        "end": j,
+                        "key_begin": j,
+                        "head_phrase": j + 1,
+                        "sub_phrase": [],
+                        "weight": 0.7,
+                    }
+                    for j in range(words)
+                ],
+                "SRL": [
+                    {
+                        "verb": "이",
+                        "sense": 1,
+                        "word_id": words - 1,
+                        "weight": 0.6,
+                        "argument": [
+                            {
+                                "type": "ARG1",
+                                "word_id": 0,
+                                "text": "윤동주는",
+                                "weight": 0.5,
+                            }
+                        ],
+                    }
+                ],
+                "relation": [],
+                "SA": [],
+                "ZA": [],
+            }
+        )
+    return {"result": 0, "return_object": {"sentence": sentences, "entity": []}}
+
+
+def measure(func):
+    # 시간은 tracemalloc 없이 세 번 중 가장 빠른 값으로 잽니다.
+    seconds = []
+    for _ in range(3):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        seconds.append(time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return min(seconds), current, peak
+
+
+def assemble(head: bytes, pieces: list) -> dict:
+    # `EtriRequest._decode`가 메인 프로세스에서 하는 일
+    result = pickle.loads(head)
+    for piece in pieces:
+        result["return_object"]["sentence"].extend(pickle.loads(piece))
+    return result
+
+
+def main() -> None:
+    body = JSONCodec().dumps(response())
+    print(f"response {len(body) / 1e6:.1f} MB, {SENTENCES:,} sentences")
+    codecs = [JSONCodec()]
+    if orjson is not None:
+        codecs.append(OrjsonCodec())
+    print(
+        f"{'codec':<8}{'fields':<14}{'mode':<9}{'ms':>9}{'held MB':>10}{'peak MB':>10}"
+    )
+    for codec in codecs:
+        for name, fields in (
+            ("all", None),
+            ("morp, NE", analysis_fields(["morp", "NE"])),
+        ):
+            seconds, current, peak = measure(lambda: decode(codec, body, fields))
+            print(
+                f"{codec.name:<8}{name:<14}{'inline':<9}{seconds * 1000:>9.1f}"
+                f"{current / 1e6:>10.1f}{peak / 1e6:>10.1f}"
+            )
+            head, pieces = decode_pieces(codec, body, fields=fields)
+            seconds, current, peak = measure(lambda: assemble(head, pieces))
+            print(
+                f"{codec.name:<8}{name:<14}{'process':<9}{seconds * 1000:>9.1f}"
+                f"{current / 1e6:>10.1f}{peak / 1e6:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+결과 모델 메모리 벤치마크
+
+언어 분석 응답을 그대로 들고 있을 때(`AnalysisResult`), `Sentence.Morp` 등의 모델 객체까지 만들었을 때,
+`compact_sentences()`로 바꾼 뒤 원본을 버렸을 때의 메모리 사용량을 형태소 100만 개 기준으로 비교합니다.
+
+    PYTHONPATH=. python benchmarks/bench_models.py
+"""
+import gc
+import json
+import random
+import tracemalloc
+
+from etripy.model.language import AnalysisResult, compact_sentences
+
+TAGS = ["NNG", "NNP", "JKS", "JKO", "JX", "VV", "EP", "EF", "SF", "MAG", "XSV", "ETM"]
+NE_TYPES = ["PS_NAME", "LCP_CITY", "OGG_ECONOMY", "DT_YEAR", "QT_COUNT"]
+LABELS = ["NP_SBJ", "NP_OBJ", "VP", "NP_AJT", "VP_MOD", "NP"]
+VOCABULARY = [f"어휘{i}" for i in range(5000)]
+
+SENTENCES = 2500
+MORPHEMES = 40
+
+
+def body(seed: int) -> bytes:
+    # 언어 분석(`srl`) 응답과 비슷한 모양의 응답 본문
+    rng = random.Random(seed)
+    sentences = []
+    for i in range(SENTENCES):
+        words = MORPHEMES // 2
+        sentences.append(
+            {
+                "id": i,
+                "text": "윤동주는 일제 강점기의 시인이다.",
+                "morp": [
+                    {
+                        "id": j,
+                        "lemma": rng.choice(VOCABULARY),
+                        "type": rng.choice(TAGS),
+                        "position": j * 3,
+                        "weight": rng.random(),
+                    }
+                    for j in range(MORPHEMES)
+                ],
+                "word": [
+                    {
+                        "id": j,
+                        "text": rng.choice(VOCABULARY),
+                        "type": "",
+                        "begin": j * 2,
+                        "end": j * 2 + 1,
+                    }
+                    for j in range(words)
+                ],
+                "NE": [
+                    {
+                        "id": 0,
+                        "text": rng.choice(VOCABULARY),
+                        "type": rng.choice(NE_TYPES),
+                        "begin": 0,
+                        "end": 0,
+                        "weight": rng.random(),
+                        "common_noun": 0,
+                    }
+                ],
+                "dependency": [
+                    {
+                        "id": j,
+                        "text": rng.choice(VOCABULARY),
+                        "head": j + 1 if j + 1 < words else -1,
+                        "label": rng.choice(LABELS),
+                        "mod": [j - 1] if j else [],
+                        "weight": rng.random(),
+                    }
+                    for j in range(words)
+                ],
+            }
+        )
+    return json.dumps({"result": 0, "return_object": {"sentence": sentences}}).encode()
+
+
+def measure(build) -> float:
+    """`build()`가 만든 객체가 차지하는 메모리(MB)를 형태소 100만 개 기준으로 반환합니다."""
+    gc.collect()
+    tracemalloc.start()
+    kept = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size / (SENTENCES * MORPHEMES) * 1_000_000 / 1024 / 1024
+
+
+def main() -> None:
+    raw = body(0)
+
+    def result() -> AnalysisResult:
+        data = json.loads(raw)
+        return AnalysisResult(data=data, **data["return_object"])
+
+    def models() -> AnalysisResult:
+        r = result()
+        for sentence in r.Sentence:
+            sentence.Morp, sentence.Word, sentence.Ne, sentence.Dependency
+        return r
+
+    def compacted():
+        return compact_sentences(result())
+
+    print(f"{'holding':<28}{'MB / 1M morphemes':>20}")
+    for name, build in (
+        ("AnalysisResult (dict)", result),
+        ("AnalysisResult + models", models),
+        ("compact_sentences()", compacted),
+    ):
+        print(f"{name:<28}{measure(build):>20,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+말뭉치 표 벤치마크
+
+언어 분석 결과 수천 개에서 "100~5000번 문서의 NNP 형태소"와 "문서별 개체명 타입 수"를 구할 때,
+`Sentence.Morp`/`Sentence.Ne` 객체를 순회하는 방법과 `CorpusTable`의 배열 연산을 비교합니다. (`numpy` 필요)
+
+    PYTHONPATH=. python benchmarks/bench_table.py
+"""
+import random
+import time
+from collections import Counter
+
+from etripy.model.language import AnalysisResult
+from etripy.table import CorpusTable
+
+TAGS = ["NNG", "NNP", "JKS", "JKO", "JX", "VV", "EP", "EF", "SF", "MAG", "XSV", "ETM"]
+NE_TYPES = ["PS_NAME", "LCP_CITY", "OGG_ECONOMY", "DT_YEAR", "QT_COUNT"]
+VOCABULARY = [f"어휘{i}" for i in range(5000)]
+
+DOCUMENTS = 10000
+SENTENCES = 5
+MORPHEMES = 20
+
+
+def result(rng: random.Random) -> AnalysisResult:
+    sentences = []
+    for i in range(SENTENCES):
+        sentences.append(
+            {
+                "id": i,
+                "text": "윤동주는 일제 강점기의 시인이다.",
+                "morp": [
+                    {
+                        "id": j,
+                        "lemma": rng.choice(VOCABULARY),
+                        "type": rng.choice(TAGS),
+                        "position": j * 3,
+                        "weight": rng.random(),
+                    }
+                    for j in range(MORPHEMES)
+                ],
+                "word": [
+                    {
+                        "id": j,
+                        "text": rng.choice(VOCABULARY),
+                        "type": "",
+                        "begin": j * 2,
+                        "end": j * 2 + 1,
+                    }
+                    for j in range(MORPHEMES // 2)
+                ],
+                "NE": [
+                    {
+                        "id": j,
+                        "text": rng.choice(VOCABULARY),
+                        "type": rng.choice(NE_TYPES),
+                        "begin": j,
+                        "end": j,
+                        "weight": rng.random(),
+                    }
+                    for j in range(2)
+                ],
+            }
+        )
+    return AnalysisResult(data={}, sentence=sentences)
+
+
+def measure(name: str, func) -> None:
+    start = time.perf_counter()
+    func()
+    print(f"{name:<28} {(time.perf_counter() - start) * 1000:9.1f} ms")
+
+
+def main() -> None:
+    rng = random.Random(0)
+    results = [result(rng) for _ in range(DOCUMENTS)]
+    morphemes = DOCUMENTS * SENTENCES * MORPHEMES
+    print(f"documents: {DOCUMENTS:,}, morphemes: {morphemes:,}")
+
+    def loop_nnp():
+        return [
+            morp.lemma
+            for doc, result in enumerate(results)
+            if 100 <= doc <= 5000
+            for sentence in result.Sentence
+            for morp in sentence.Morp
+            if morp.type == "NNP"
+        ]
+
+    def loop_ne():
+        return Counter(
+            (doc, ne.type)
+            for doc, result in enumerate(results)
+            for sentence in result.Sentence
+            for ne in sentence.Ne
+        )
+
+    measure("loop: NNP lemmas", loop_nnp)
+    measure("loop: NE type per doc", loop_ne)
+
+    table = CorpusTable()
+    measure("CorpusTable.extend", lambda: table.extend(results))
+    measure("CorpusTable.morp (to numpy)", lambda: table.morp)
+    measure(
+        "table: NNP lemmas",
+        lambda: table.morp.where(type="NNP", doc=range(100, 5001)).decode("lemma"),
+    )
+    measure("table: NE type per doc", lambda: table.ne.count_by("doc", "type"))
+    print(f"morp columns: {table.morp.nbytes / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
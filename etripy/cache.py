@@ -0,0 +1,550 @@
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from etripy.codec import JSONCodec, default_codec
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+CACHE_TTLS: Dict[str, float] = {
+    "/VideoParse/status": 0,
+    "/WiseASR": 0,
+}
+"""기본으로 캐시하지 않는(유지 시간 0) 엔드포인트 접두사 (진행 상태 조회, 음성 인식)"""
+
+
+class ResponseCache(ABC):
+    """
+    응답 캐시의 기본 클래스입니다.\n
+    엔드포인트와 정규화한 요청 본문으로 만든 키(`JSONCodec.request_key`)로 역직렬화된 응답을 저장합니다.
+    오류 응답(`result`가 0이 아닌 응답)은 저장하지 않습니다.
+
+    #### Parameter
+    `ttl` : 기본 유지 시간(초) (None이면 만료되지 않음)\n
+    `endpoint_ttls` : 엔드포인트(또는 접두사)별 유지 시간(초) (0이면 캐시하지 않음, 예: `{"/WiseNLU": 3600}`)
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = 86400.0,
+        endpoint_ttls: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self.ttl = ttl
+        self.endpoint_ttls = dict(CACHE_TTLS)
+        self.endpoint_ttls.update(endpoint_ttls or {})
+        self.hits = 0
+        """캐시에서 찾은 횟수"""
+        self.misses = 0
+        """캐시에 없던 횟수"""
+        self.evictions = 0
+        """메모리 한도 때문에 지운 항목 수"""
+        self.expirations = 0
+        """유지 시간이 지나 지운 항목 수"""
+
+    def ttl_for(self, endpoint: str) -> Optional[float]:
+        """`endpoint`의 유지 시간(초)을 반환합니다."""
+        ttl = self.endpoint_ttls.get(endpoint)
+        if ttl is not None:
+            return ttl
+        for prefix, ttl in self.endpoint_ttls.items():
+            if endpoint.startswith(prefix):
+                return ttl
+        return self.ttl
+
+    def cacheable(self, endpoint: str, result: Any = None) -> bool:
+        """`endpoint`(와 응답 `result`)를 캐시할 수 있는지 여부를 반환합니다."""
+        if self.ttl_for(endpoint) == 0:
+            return False
+        if result is None:
+            return True
+        return isinstance(result, dict) and str(result.get("result", "0")) == "0"
+
+    @property
+    def hit_rate(self) -> float:
+        """캐시 적중률"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계(`hits`, `misses`, `evictions`, `expirations`, `hit_rate`)를 반환합니다."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hit_rate,
+        }
+
+    @abstractmethod
+    def get(self, endpoint: str, key: str) -> Optional[Any]:
+        """`key`의 응답을 반환합니다. (없거나 만료되었으면 None)"""
+        ...
+
+    @abstractmethod
+    def put(self, endpoint: str, key: str, value: Any, size: int) -> None:
+        """`key`에 응답을 저장합니다. `size`는 응답 본문의 바이트 수입니다."""
+        ...
+
+    async def aget(self, endpoint: str, key: str) -> Optional[Any]:
+        """`get`의 비동기 버전입니다. (`EtriRequest`에서 사용)"""
+        return self.get(endpoint, key)
+
+    async def aput(self, endpoint: str, key: str, value: Any, size: int) -> None:
+        """`put`의 비동기 버전입니다. (`EtriRequest`에서 사용)"""
+        self.put(endpoint, key, value, size)
+
+    @abstractmethod
+    def __contains__(self, key: str) -> bool:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """모든 항목을 지웁니다."""
+        ...
+
+
+class MemoryCache(ResponseCache):
+    """
+    메모리 LRU 응답 캐시 클래스입니다.\n
+    항목 수가 아니라 응답 본문의 바이트 수로 크기를 제한하며, 한도를 넘으면 가장 오래 사용하지 않은 항목부터 지웁니다.
+    asyncio 태스크와 여러 스레드(`etripy.sync` 클라이언트)에서 함께 사용할 수 있습니다.
+    `get`은 복사하지 않고 저장된 응답 객체를 그대로 반환하므로, 반환된 응답을 수정하면 안 됩니다.
+
+    #### Parameter
+    `max_bytes` : 전체 메모리 한도(바이트)\n
+    `ttl` : 기본 유지 시간(초) (None이면 만료되지 않음)\n
+    `endpoint_ttls` : 엔드포인트(또는 접두사)별 유지 시간(초) (0이면 캐시하지 않음, 예: `{"/WiseNLU": 3600}`)
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: Optional[float] = 86400.0,
+        endpoint_ttls: Optional[Dict[str, float]] = None,
+    ) -> None:
+        super().__init__(ttl, endpoint_ttls)
+        self.max_bytes = max_bytes
+        self.size = 0
+        """현재 저장된 응답의 바이트 수"""
+        # key -> (응답, 바이트 수, 만료 시각)
+        self._entries: "OrderedDict[str, Tuple[Any, int, Optional[float]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._expired(entry)
+
+    @staticmethod
+    def _expired(entry: Tuple[Any, int, Optional[float]]) -> bool:
+        return entry[2] is not None and entry[2] <= time.monotonic()
+
+    def _remove(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self.size -= size
+
+    def get(self, endpoint: str, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if self._expired(entry):
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, endpoint: str, key: str, value: Any, size: int) -> None:
+        ttl = self.ttl_for(endpoint)
+        if ttl == 0 or size > self.max_bytes:
+            return
+        expires = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, expires)
+            self.size += size
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def pop(self, key: str) -> Optional[Any]:
+        """`key`의 항목을 지우고 반환합니다."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._remove(key)
+            return entry[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        with self._lock:
+            stats.update(entries=len(self._entries), bytes=self.size)
+        return stats
+
+
+class DiskCache(ResponseCache):
+    """
+    SQLite 파일에 응답을 저장하는 영구 응답 캐시 클래스입니다.\n
+    응답은 zstd(`zstandard`가 없으면 zlib)로 압축해 요청 해시를 기본 키로 저장하며,
+    압축된 크기의 합이 `max_bytes`를 넘으면 가장 오래 사용하지 않은 항목부터 지웁니다.
+    WAL 모드를 사용하므로 한 호스트의 여러 프로세스가 같은 파일을 함께 사용할 수 있고,
+    자주 쓰는 항목은 앞단의 메모리 캐시(`MemoryCache`)에서 바로 반환합니다.
+    `EtriRequest`에서는 파일 입출력을 실행기(executor)에서 처리해 이벤트 루프를 막지 않습니다.
+
+    #### Parameter
+    `path` : 캐시 파일 경로\n
+    `max_bytes` : 디스크 사용량 한도(압축된 바이트)\n
+    `memory_bytes` : 앞단 메모리 캐시 한도(바이트, 0이면 사용하지 않음)\n
+    `ttl` : 기본 유지 시간(초) (None이면 만료되지 않음)\n
+    `endpoint_ttls` : 엔드포인트(또는 접두사)별 유지 시간(초) (0이면 캐시하지 않음)\n
+    `codec` : 응답을 저장할 때 사용할 JSON 코덱\n
+    `level` : 압축 수준
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS entries ("
+        " key TEXT PRIMARY KEY, endpoint TEXT NOT NULL, compression TEXT NOT NULL,"
+        " value BLOB NOT NULL, size INTEGER NOT NULL, expires REAL, accessed REAL NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)",
+        "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+        "INSERT OR IGNORE INTO meta VALUES ('bytes', 0)",
+    )
+    _TOUCH_INTERVAL = 60.0
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 1024 * 1024 * 1024,
+        memory_bytes: int = 16 * 1024 * 1024,
+        ttl: Optional[float] = None,
+        endpoint_ttls: Optional[Dict[str, float]] = None,
+        codec: Optional[JSONCodec] = None,
+        level: int = 3,
+    ) -> None:
+        super().__init__(ttl, endpoint_ttls)
+        self.path = os.path.abspath(path)
+        self.max_bytes = max_bytes
+        self.codec = codec or default_codec()
+        self.memory = (
+            MemoryCache(memory_bytes, ttl, endpoint_ttls) if memory_bytes else None
+        )
+        self.compression = "zstd" if zstandard is not None else "zlib"
+        if zstandard is not None:
+            self._compressor = zstandard.ZstdCompressor(level=level)
+        self.level = level
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection()
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        return connection if connection is not None else self._connection()
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 연결은 스레드마다 따로 엽니다. (`close`만 다른 스레드에서 호출합니다)
+        connection = sqlite3.connect(
+            self.path, timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        for statement in self._SCHEMA:
+            connection.execute(statement)
+        self._local.connection = connection
+        with self._lock:
+            self._connections.append(connection)
+        return connection
+
+    def close(self) -> None:
+        """모든 스레드의 데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        db = self._db
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            yield db
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.compression == "zstd":
+            return self._compressor.compress(data)
+        return zlib.compress(data, self.level)
+
+    @staticmethod
+    def _decompress(compression: str, data: bytes) -> Optional[bytes]:
+        if compression == "zlib":
+            return zlib.decompress(data)
+        if compression == "zstd" and zstandard is not None:
+            return zstandard.ZstdDecompressor().decompress(data)
+        return None
+
+    def _delete(self, db: sqlite3.Connection, key: str) -> None:
+        row = db.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            db.execute(
+                "UPDATE meta SET value = value - ? WHERE name = 'bytes'", (row[0],)
+            )
+
+    def _load(self, endpoint: str, key: str) -> Optional[Any]:
+        db = self._db
+        row = db.execute(
+            "SELECT compression, value, expires, accessed FROM entries WHERE key = ?",
+            (key,),
+        ).fetchone()
+        value = None
+        if row is not None:
+            compression, blob, expires, accessed = row
+            now = time.time()
+            if expires is not None and expires <= now:
+                with self._transaction() as db:
+                    self._delete(db, key)
+                with self._lock:
+                    self.expirations += 1
+            else:
+                data = self._decompress(compression, blob)
+                if data is not None:
+                    value = self.codec.loads(data)
+                    if now - accessed >= self._TOUCH_INTERVAL:
+                        # 적중할 때마다 쓰지 않도록 사용 시각은 일정 간격으로만 갱신합니다.
+                        db.execute(
+                            "UPDATE entries SET accessed = ? WHERE key = ?", (now, key)
+                        )
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        if self.memory is not None:
+            self.memory.put(endpoint, key, value, len(data))
+        return value
+
+    def _get_memory(self, endpoint: str, key: str) -> Optional[Any]:
+        if self.memory is None:
+            return None
+        value = self.memory.get(endpoint, key)
+        if value is not None:
+            with self._lock:
+                self.hits += 1
+        return value
+
+    def get(self, endpoint: str, key: str) -> Optional[Any]:
+        value = self._get_memory(endpoint, key)
+        if value is None:
+            value = self._load(endpoint, key)
+        return value
+
+    def put(self, endpoint: str, key: str, value: Any, size: int) -> None:
+        ttl = self.ttl_for(endpoint)
+        if ttl == 0:
+            return
+        if self.memory is not None:
+            self.memory.put(endpoint, key, value, size)
+        blob = self._compress(self.codec.dumps(value))
+        if len(blob) > self.max_bytes:
+            return
+        now = time.time()
+        expires = None if ttl is None else now + ttl
+        with self._transaction() as db:
+            self._delete(db, key)
+            db.execute(
+                "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, endpoint, self.compression, blob, len(blob), expires, now),
+            )
+            db.execute(
+                "UPDATE meta SET value = value + ? WHERE name = 'bytes'", (len(blob),)
+            )
+            self._evict(db)
+
+    def _evict(self, db: sqlite3.Connection) -> None:
+        (total,) = db.execute("SELECT value FROM meta WHERE name = 'bytes'").fetchone()
+        evicted = 0
+        while total > self.max_bytes:
+            rows = db.execute(
+                "SELECT key, size FROM entries ORDER BY accessed LIMIT 64"
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                total -= size
+                evicted += 1
+                if total <= self.max_bytes:
+                    break
+        if evicted:
+            db.execute("UPDATE meta SET value = ? WHERE name = 'bytes'", (total,))
+            with self._lock:
+                self.evictions += evicted
+
+    async def aget(self, endpoint: str, key: str) -> Optional[Any]:
+        value = self._get_memory(endpoint, key)
+        if value is None:
+            loop = asyncio.get_running_loop()
+            value = await loop.run_in_executor(None, self._load, endpoint, key)
+        return value
+
+    async def aput(self, endpoint: str, key: str, value: Any, size: int) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.put, endpoint, key, value, size)
+
+    def __contains__(self, key: str) -> bool:
+        if self.memory is not None and key in self.memory:
+            return True
+        row = self._db.execute(
+            "SELECT expires FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        return row is not None and (row[0] is None or row[0] > time.time())
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        """디스크에 저장된 응답의 압축된 바이트 수"""
+        return self._db.execute(
+            "SELECT value FROM meta WHERE name = 'bytes'"
+        ).fetchone()[0]
+
+    def purge_expired(self) -> int:
+        """만료된 항목을 모두 지우고 지운 개수를 반환합니다."""
+        with self._transaction() as db:
+            rows = db.execute(
+                "SELECT key FROM entries WHERE expires IS NOT NULL AND expires <= ?",
+                (time.time(),),
+            ).fetchall()
+            for (key,) in rows:
+                self._delete(db, key)
+        with self._lock:
+            self.expirations += len(rows)
+        return len(rows)
+
+    def clear(self) -> None:
+        if self.memory is not None:
+            self.memory.clear()
+        with self._transaction() as db:
+            db.execute("DELETE FROM entries")
+            db.execute("UPDATE meta SET value = 0 WHERE name = 'bytes'")
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        stats.update(entries=len(self), bytes=self.size, compression=self.compression)
+        if self.memory is not None:
+            stats["memory"] = self.memory.stats()
+        return stats
+
+
+class FileIdCache:
+    """
+    업로드한 파일의 내용(SHA-256)과 ETRI `file_id`를 연결해 두는 클래스입니다.\n
+    경로, 크기, 수정 시각이 같으면 해시를 다시 계산하지 않으며, `path`를 지정하면 JSON 파일에 저장해 다음 실행에서도 사용합니다.
+    `VideoClient`에 `file_ids`로 전달하면 `video_parse_for_path`가 같은 동영상을 다시 업로드하지 않습니다.
+
+    #### Parameter
+    `path` : 저장할 JSON 파일 경로 (None이면 메모리에만 보관)
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = os.path.abspath(path) if path else None
+        self._file_ids: Dict[str, str] = {}
+        self._stats: Dict[str, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+        if self.path and os.path.exists(self.path):
+            with open(self.path, "rb") as file:
+                data = json.loads(file.read() or b"{}")
+            self._file_ids = dict(data.get("file_ids", {}))
+            self._stats = {
+                path: tuple(stat) for path, stat in data.get("stats", {}).items()
+            }
+
+    def __len__(self) -> int:
+        return len(self._file_ids)
+
+    def digest(self, file_path: str) -> str:
+        """파일의 SHA-256 해시를 반환합니다. (경로, 크기, 수정 시각이 같으면 저장된 값 사용)"""
+        file_path = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        with self._lock:
+            cached = self._stats.get(file_path)
+        if cached is not None and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+            return cached[2]
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(chunk)
+        sha256 = digest.hexdigest()
+        with self._lock:
+            self._stats[file_path] = (stat.st_size, stat.st_mtime_ns, sha256)
+        return sha256
+
+    def get(self, file_path: str) -> Optional[str]:
+        """파일 내용에 해당하는 `file_id`를 반환합니다. (없으면 None)"""
+        sha256 = self.digest(file_path)
+        with self._lock:
+            return self._file_ids.get(sha256)
+
+    def put(self, file_path: str, file_id: str) -> None:
+        """파일 내용과 `file_id`를 연결합니다."""
+        sha256 = self.digest(file_path)
+        with self._lock:
+            self._file_ids[sha256] = file_id
+            self._save()
+
+    def discard(self, file_path: str) -> None:
+        """파일 내용에 연결된 `file_id`를 지웁니다. (서버에서 만료된 경우)"""
+        sha256 = self.digest(file_path)
+        with self._lock:
+            if self._file_ids.pop(sha256, None) is not None:
+                self._save()
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = {"file_ids": self._file_ids, "stats": self._stats}
+        temp = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp, "w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False)
+        os.replace(temp, self.path)
@@ -1,8 +1,33 @@
-from typing import Collection, Dict, List, Optional, Tuple, Union
+import asyncio
+from typing import (
+    AsyncIterator,
+    Callable,
+    Collection,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sized,
+    Tuple,
+    Union,
+)
 
+from etripy.codec import analysis_fields, project_analysis
+from etripy.document import (
+    MAX_ANALYSIS_CHARS,
+    PackPolicy,
+    chunk_text,
+    merge_analysis,
+    pack_spans,
+    pack_texts,
+    split_analysis,
+)
 from etripy.error import AnalysisException, QAException, SentencesException
 from etripy.http import EtriRequest
-from etripy.model import AnalysisCode, FileType, WikiType
+from etripy.lexicon import LexiconStore
+from etripy.limit import KeyPool
+from etripy.model import AnalysisCode, BatchItem, FileType, WikiType
 from etripy.model.language import (
     AnalysisResult,
     CoreferenceResult,
@@ -19,20 +44,36 @@ from etripy.model.language import (
     WordRelResult,
     WordResult,
 )
+from etripy.policy import Deadline
 
 
 class AnalysisClient(EtriRequest):
     """
     ETRI 언어 처리 및 분석 클라이언트 클래스입니다.
     #### access_key
-    [ETRI 포털사이트](https://aiopen.etri.re.kr/)에서 발급받은 `access_key`를 입력합니다.
+    [ETRI 포털사이트](https://aiopen.etri.re.kr/)에서 발급받은 `access_key`를 입력합니다. 여러 키를 나누어 쓰려면 `KeyPool`을 전달합니다.
+    #### lexicon
+    `wordinfo`, `homonym`, `polysemy` 응답을 저장하고 먼저 찾아볼 로컬 사전 (`LexiconStore`, 필수 X)
+    #### kwargs
+    연결 풀 등 HTTP 설정은 `EtriRequest`의 인자를 참조하십시오.
     """
 
-    def __init__(self, access_key: str) -> None:
-        super().__init__(access_key=access_key)
+    def __init__(
+        self,
+        access_key: Union[str, KeyPool],
+        lexicon: Optional[LexiconStore] = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(access_key=access_key, **kwargs)
+        self.lexicon = lexicon
 
     async def analysis(
-        self, text: str, analysis_code: Union[AnalysisCode, str], spoken: bool = False
+        self,
+        text: str,
+        analysis_code: Union[AnalysisCode, str],
+        spoken: bool = False,
+        deadline: Union[None, float, Deadline] = None,
+        fields: Union[None, str, Iterable[str]] = None,
     ) -> Optional[AnalysisResult]:
         """
         ### - 언어 분석
@@ -40,12 +81,16 @@ class AnalysisClient(EtriRequest):
 
         #### Parameter
         `analysis_code` : 요청할 분석 코드 (AnalysisCode 클래스 사용 권장)\n
-        `text` : 분석할 자연어 문장으로서 UTF-8 인코딩된 텍스트만 지원
+        `text` : 분석할 자연어 문장으로서 UTF-8 인코딩된 텍스트만 지원\n
+        `deadline` : 호출 제한 시간(초) 또는 `Deadline` 객체로, 대기열과 재시도 시간을 모두 포함합니다. (필수 X)\n
+        `fields` : 남길 문장 필드 이름 목록으로, 나머지 필드(`phrase_dependency`, `SRL`, `ZA` 등)는 응답을 역직렬화할 때 버립니다. (`ANALYSIS_FIELDS` 참조, `id`와 `text`는 항상 포함, 필수 X)
         """
         data = {
             "argument": {"analysis_code": analysis_code, "text": text},
         }
-        result = await self.get_analysis_data(data=data, spoken=spoken)
+        result = await self.get_analysis_data(
+            data=data, spoken=spoken, deadline=deadline, fields=analysis_fields(fields)
+        )
         try:
             if result["return_object"] == {}:
                 return None
@@ -54,20 +99,247 @@ class AnalysisClient(EtriRequest):
                 raise AnalysisException(result["reason"])
         return AnalysisResult(data=result, **result["return_object"])
 
-    async def paraphrase(self, *sentences: Tuple[str]) -> Optional[ParaphraseResult]:
+    async def analysis_many(
+        self,
+        texts: Iterable[str],
+        analysis_code: Union[AnalysisCode, str],
+        spoken: bool = False,
+        concurrency: int = 8,
+        ordered: bool = True,
+        progress: Optional[Callable[[int, Optional[int]], None]] = None,
+        deadline: Union[None, float, Deadline] = None,
+        pack: Union[bool, PackPolicy] = False,
+        fields: Union[None, str, Iterable[str]] = None,
+    ) -> List[BatchItem]:
+        """
+        ### - 언어 분석 (일괄 처리)
+        여러 텍스트를 최대 `concurrency`개씩 동시에 분석합니다.
+        항목별 오류는 일괄 처리를 중단하지 않고 해당 `BatchItem.error`에 담깁니다.
+
+        #### Parameter
+        `texts` : 분석할 텍스트 목록\n
+        `analysis_code` : 요청할 분석 코드 (AnalysisCode 클래스 사용 권장)\n
+        `concurrency` : 동시에 보낼 요청 수\n
+        `ordered` : True면 입력 순서대로, False면 끝난 순서대로 반환합니다.\n
+        `progress` : 항목이 끝날 때마다 `(완료 수, 전체 수)`로 호출할 함수 (전체 수를 알 수 없으면 None, 필수 X)\n
+        `deadline` : 일괄 처리 전체의 호출 제한 시간(초) 또는 `Deadline` 객체 (필수 X)\n
+        `pack` : 짧은 텍스트 여러 개를 요청 하나로 묶어 보낼지 여부 (True 또는 묶음 크기를 정하는 `PackPolicy`)\n
+        `fields` : 남길 문장 필드 이름 목록 (`analysis` 참조, 필수 X)
+        """
+        items = [
+            item
+            async for item in self.analysis_stream(
+                texts,
+                analysis_code,
+                spoken=spoken,
+                concurrency=concurrency,
+                progress=progress,
+                deadline=deadline,
+                pack=pack,
+                fields=fields,
+            )
+        ]
+        if ordered:
+            items.sort(key=lambda item: item.index)
+        return items
+
+    async def analysis_stream(
+        self,
+        texts: Iterable[str],
+        analysis_code: Union[AnalysisCode, str],
+        spoken: bool = False,
+        concurrency: int = 8,
+        progress: Optional[Callable[[int, Optional[int]], None]] = None,
+        deadline: Union[None, float, Deadline] = None,
+        pack: Union[bool, PackPolicy] = False,
+        fields: Union[None, str, Iterable[str]] = None,
+    ) -> AsyncIterator[BatchItem]:
+        """
+        ### - 언어 분석 (스트리밍)
+        `analysis_many`와 같지만, 끝난 항목부터 바로 `BatchItem`으로 내보냅니다.
+        `texts`는 필요한 만큼만 읽으므로 큰 입력도 메모리에 모두 올리지 않습니다.
+
+        #### Parameter
+        `texts` : 분석할 텍스트 목록\n
+        `analysis_code` : 요청할 분석 코드 (AnalysisCode 클래스 사용 권장)\n
+        `concurrency` : 동시에 보낼 요청 수\n
+        `progress` : 항목이 끝날 때마다 `(완료 수, 전체 수)`로 호출할 함수 (필수 X)\n
+        `deadline` : 일괄 처리 전체의 호출 제한 시간(초) 또는 `Deadline` 객체 (필수 X)\n
+        `pack` : 짧은 텍스트 여러 개를 요청 하나로 묶어 보낼지 여부 (True 또는 묶음 크기를 정하는 `PackPolicy`)\n
+        `fields` : 남길 문장 필드 이름 목록 (`analysis` 참조, 필수 X)
+        """
+        deadline = Deadline.of(deadline)
+        fields = analysis_fields(fields)
+        total = len(texts) if isinstance(texts, Sized) else None
+        policy = PackPolicy() if pack is True else pack or None
+        if policy is None:
+            batches = ([pair] for pair in enumerate(texts))
+        else:
+            batches = pack_texts(enumerate(texts), policy)
+        # 소비하는 쪽이 느리면 작업자도 기다리도록 대기열 크기를 제한합니다.
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, concurrency))
+
+        async def worker() -> None:
+            cancelled = False
+            try:
+                for batch in batches:
+                    for item in await self._analysis_batch(
+                        batch, analysis_code, spoken, policy, deadline, fields
+                    ):
+                        await queue.put(item)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            finally:
+                # 스트림을 닫아 취소되었으면 종료 신호를 꺼낼 쪽이 없으므로 기다리지 않습니다.
+                if not cancelled:
+                    await queue.put(None)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(max(1, concurrency))]
+        finished = done = 0
+        try:
+            while finished < len(workers):
+                item = await queue.get()
+                if item is None:
+                    finished += 1
+                    continue
+                done += 1
+                if progress is not None:
+                    progress(done, total)
+                yield item
+            # 입력(`texts`)을 읽다가 발생한 오류는 그대로 전달합니다.
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+
+    async def _analysis_batch(
+        self,
+        batch: List[Tuple[int, str]],
+        analysis_code: Union[AnalysisCode, str],
+        spoken: bool,
+        policy: Optional[PackPolicy],
+        deadline: Optional[Deadline],
+        fields: Optional[FrozenSet[str]],
+    ) -> List[BatchItem]:
+        if len(batch) > 1:
+            packed, spans = pack_spans([text for _, text in batch])
+            try:
+                with policy.timed():
+                    # 묶음을 나눌 때 형태소의 position이 필요하므로 `morp`는 받아 둡니다.
+                    result = await self.analysis(
+                        packed,
+                        analysis_code,
+                        spoken=spoken,
+                        deadline=deadline,
+                        fields=None if fields is None else fields | {"morp"},
+                    )
+            except AnalysisException:
+                # 묶음이 거절되면 텍스트별로 다시 보냅니다.
+                pass
+            except Exception as e:
+                return [
+                    BatchItem(index=index, input=text, error=e) for index, text in batch
+                ]
+            else:
+                if result is None:
+                    return [BatchItem(index=index, input=text) for index, text in batch]
+                try:
+                    parts = split_analysis(result.data, spans)
+                except ValueError:
+                    # 응답의 문장을 텍스트별로 나눌 수 없으면 텍스트별로 다시 보냅니다.
+                    pass
+                else:
+                    return [
+                        BatchItem(
+                            index=index,
+                            input=text,
+                            result=AnalysisResult(data=data, **data["return_object"]),
+                        )
+                        for (index, text), data in zip(
+                            batch, (project_analysis(data, fields) for data in parts)
+                        )
+                    ]
+        items = []
+        for index, text in batch:
+            try:
+                result = await self.analysis(
+                    text, analysis_code, spoken=spoken, deadline=deadline, fields=fields
+                )
+            except Exception as e:
+                items.append(BatchItem(index=index, input=text, error=e))
+            else:
+                items.append(BatchItem(index=index, input=text, result=result))
+        return items
+
+    async def analysis_document(
+        self,
+        text: str,
+        analysis_code: Union[AnalysisCode, str],
+        spoken: bool = False,
+        max_chars: int = MAX_ANALYSIS_CHARS,
+        concurrency: int = 4,
+        deadline: Union[None, float, Deadline] = None,
+        fields: Union[None, str, Iterable[str]] = None,
+    ) -> Optional[AnalysisResult]:
+        """
+        ### - 언어 분석 (긴 문서)
+        요청 크기 제한을 넘는 긴 문서를 문장 경계에서 `max_chars`글자 이하로 나누어 동시에 분석하고,
+        결과를 하나의 `AnalysisResult`로 합칩니다. 문장/형태소/어절 ID와 byte `position`은 문서 전체 기준으로 다시 매겨집니다.
+
+        #### Parameter
+        `text` : 분석할 문서로서 UTF-8 인코딩된 텍스트만 지원\n
+        `analysis_code` : 요청할 분석 코드 (AnalysisCode 클래스 사용 권장)\n
+        `max_chars` : 조각 하나의 최대 글자 수\n
+        `concurrency` : 동시에 보낼 요청 수\n
+        `deadline` : 문서 전체의 호출 제한 시간(초) 또는 `Deadline` 객체 (필수 X)\n
+        `fields` : 남길 문장 필드 이름 목록 (`analysis` 참조, 필수 X)
+        """
+        chunks = chunk_text(text, max_chars)
+        if len(chunks) <= 1:
+            return await self.analysis(
+                text, analysis_code, spoken=spoken, deadline=deadline, fields=fields
+            )
+        items = await self.analysis_many(
+            [chunk for _, chunk in chunks],
+            analysis_code,
+            spoken=spoken,
+            concurrency=concurrency,
+            deadline=deadline,
+            fields=fields,
+        )
+        for item in items:
+            if not item.ok:
+                raise item.error
+        result = merge_analysis(
+            [
+                (offset, item.result.data if item.result is not None else None)
+                for (offset, _), item in zip(chunks, items)
+            ]
+        )
+        if result is None:
+            return None
+        return AnalysisResult(data=result, **result["return_object"])
+
+    async def paraphrase(
+        self, *sentences: Tuple[str], deadline: Union[None, float, Deadline] = None
+    ) -> Optional[ParaphraseResult]:
         """
         ### - 문장 패러프레이즈 인식
         문장 패러프레이즈 인식 API는 두 개의 문장이 동등한 의미를 가지는지 여부를 판별합니다.
 
         #### Parameter
-        `sentences` : 분석할려는 문장에 대한 텍스트 (두 문장만 입력해주세요.)
+        `sentences` : 분석할려는 문장에 대한 텍스트 (두 문장만 입력해주세요.)\n
+        `deadline` : 호출 제한 시간(초) 또는 `Deadline` 객체로, 대기열과 재시도 시간을 모두 포함합니다. (필수 X)
         """
         if len(sentences) != 2:
             raise SentencesException(f"두 문장만 입력해주세요.\n현재 입력한 문장 수 : {len(sentences)}")
         data = {
             "argument": {"sentence1": sentences[0], "sentence2": sentences[1]},
         }
-        result = await self.request(method="POST", endpoint="/ParaphraseQA", data=data)
+        result = await self.request(
+            method="POST", endpoint="/ParaphraseQA", data=data, deadline=deadline
+        )
         try:
             if result["return_object"] == {}:
                 return None
@@ -76,18 +348,29 @@ class AnalysisClient(EtriRequest):
                 raise AnalysisException(result["reason"])
         return ParaphraseResult(data=result, **result["return_object"])
 
-    async def wordinfo(self, word: str) -> Optional[WordResult]:
+    async def wordinfo(
+        self, word: str, deadline: Union[None, float, Deadline] = None
+    ) -> Optional[WordResult]:
         """
         ### - 어휘 정보
         다양한 어휘지식을 통합한 WiseWordNet 어휘 지식베이스에 기반하여 어휘의 정보를 분석하는 기술로서 입력된 어휘에 대한 관련 제공합니다.
 
         #### Parameter
-        `word` : 분석할 어휘 Text 로서 UTF-8 인코딩된 텍스트만 지원
+        `word` : 분석할 어휘 Text 로서 UTF-8 인코딩된 텍스트만 지원\n
+        `deadline` : 호출 제한 시간(초) 또는 `Deadline` 객체로, 대기열과 재시도 시간을 모두 포함합니다. (필수 X)
         """
         data = {
             "argument": {"word": word},
         }
-        result = await self.request(method="POST", endpoint="/WiseWWN/Word", data=data)
+        result = None
+        if self.lexicon is not None:
+            result = await self.lexicon.aget("word", word)
+        if result is None:
+            result = await self.request(
+                method="POST", endpoint="/WiseWWN/Word", data=data, deadline=deadline
+            )
+            if self.lexicon is not None:
+                await self.lexicon.aput("word", word, result)
         try:
             if result["return_object"] == {}:
                 return None
@@ -96,20 +379,29 @@ class AnalysisClient(EtriRequest):
                 raise AnalysisException(result["reason"])
         return WordResult(data=result)
 
-    async def homonym(self, word: str) -> Optional[HomonymResult]:
+    async def homonym(
+        self, word: str, deadline: Union[None, float, Deadline] = None
+    ) -> Optional[HomonymResult]:
         """
         ### - 동음이의어 정보
         국립국어원의 표준국어대사전에 등재된 어휘의 동음이의어(소리는 같으나 뜻이 다른 단어) 사전 정보를 조회하는 API로 입력된 어휘의 동음이의어 정보를 제공합니다.
 
         #### Parameter
-        `word` : 동음이의어를 조회할 어휘 Text 로서 UTF-8 인코딩된 텍스트만 지원
+        `word` : 동음이의어를 조회할 어휘 Text 로서 UTF-8 인코딩된 텍스트만 지원\n
+        `deadline` : 호출 제한 시간(초) 또는 `Deadline` 객체로, 대기열과 재시도 시간을 모두 포함합니다. (필수 X)
         """
         data = {
             "argument": {"word": word},
         }
-        result = await self.request(
-            method="POST", endpoint="/WiseWWN/Homonym", data=data
-        )
+        result = None
+        if self.lexicon is not None:
+            result = await self.lexicon.aget("homonym", word)
+        if result is None:
+            result = await self.request(
+                method="POST", endpoint="/WiseWWN/Homonym", data=data, deadline=deadline
+            )
+            if self.lexicon is not None:
+                await self.lexicon.aput("homonym", word, result)
         try:
             if result["return_object"] == {}:
                 return None
@@ -119,7 +411,10 @@ class AnalysisClient(EtriRequest):
         return HomonymResult(data=result, **result["return_object"])
 
     async def polysemy(
-        self, word: str, homonym_code: Optional[str] = None
+        self,
+        word: str,
+        homonym_code: Optional[str] = None,
+        deadline: Union[None, float, Deadline] = None,
     ) -> Optional[PolysemyResult]:
         """
         ### - 다의어 정보
@@ -127,7 +422,8 @@ class AnalysisClient(EtriRequest):
 
         #### Parameter
         `word` : 다의어를 조회할 어휘 Text 로서 UTF-8 인코딩된 텍스트만 지원\n
-        `homonym_code` : 다의어를 조회할 어휘의 동음이의어 코드 (필수 X)
+        `homonym_code` : 다의어를 조회할 어휘의 동음이의어 코드 (필수 X)\n
+        `deadline` : 호출 제한 시간(초) 또는 `Deadline` 객체로, 대기열과 재시도 시간을 모두 포함합니다. (필수 X)
         """
         if homonym_code:
             data = {
@@ -139,9 +435,20 @@ class AnalysisClient(EtriRequest):
                 "request_id": "reserved field",
                 "argument": {"word": word},
             }
-        result = await self.request(
-            method="POST", endpoint="/WiseWWN/Polysemy", data=data
-        )
+        result = None
+        if self.lexicon is not None:
+            result = await self.lexicon.aget("polysemy", word, homonym_code)
+        if result is None:
+            result = await self.request(
+                method="POST",
+                endpoint="/WiseWWN/Polysemy",
+                data=data,
+                deadline=deadline,
+            )
+            if self.lexicon is not None:
+                await self.lexicon.aput(
+                    "polysemy", word, result, homonym_code=homonym_code
+                )
         try:
             if result["return_object"] == {}:
                 return None
@@ -156,6 +463,7 @@ class AnalysisClient(EtriRequest):
         second_word: str,
         first_sense_id: Optional[str] = None,
         second_sense_id: Optional[str] = None,
+        deadline: Union[None, float, Deadline] = None,
     ) -> Optional[WordRelResult]:
         """
         ### - 어휘 간 유사도 분석
@@ -166,6 +474,7 @@ class AnalysisClient(EtriRequest):
         `first_sense_id` : 첫 번째 어휘의 의미 코드 (필수 X)\n
         `second_word` : 비교 분석 대상 어휘 Text 로서 UTF-8 인코딩된 텍스트만 지원\n
         `second_sense_id` : 두 번째 어휘의 의미 코드 (필수 X)\n
+        `deadline` : 호출 제한 시간(초) 또는 `Deadline` 객체로, 대기열과 재시도 시간을 모두 포함합니다. (필수 X)
         """
         data = {
             "argument": {"first_word": first_word, "second_word": second_word},
@@ -175,7 +484,7 @@ class AnalysisClient(EtriRequest):
         if second_sense_id:
             data["argument"]["second_sense_id"] = second_sense_id
         result = await self.request(
-            method="POST", endpoint="/WiseWWN/WordRel", data=data
+            method="POST", endpoint="/WiseWWN/WordRel", data=data, deadline=deadline
         )
         try:
             if result["return_object"] == {}:
@@ -185,18 +494,23 @@ class AnalysisClient(EtriRequest):
                 raise AnalysisException(result["reason"])
         return WordRelResult(data=result)
 
-    async def nelinking(self, contents: str) -> Optional[List[NELinkingResult]]:
+    async def nelinking(
+        self, contents: str, deadline: Union[None, float, Deadline] = None
+    ) -> Optional[List[NELinkingResult]]:
         """
         ### - 개체 연결(NE Linking)
         개체 연결(entity linking) API는 문장 내에서 인식된 개체 멘션(entity mention)을 지식베이스의 개체(entity)와 연결하는 기술을 제공합니다.
 
         #### Parameter
-        `contents` : 분석할 문단
+        `contents` : 분석할 문단\n
+        `deadline` : 호출 제한 시간(초) 또는 `Deadline` 객체로, 대기열과 재시도 시간을 모두 포함합니다. (필수 X)
         """
         data = {
             "argument": {"contents": contents},
         }
-        result = await self.request(method="POST", endpoint="/NELinking", data=data)
+        result = await self.request(
+            method="POST", endpoint="/NELinking", data=data, deadline=deadline
+        )
         try:
             if result["return_object"] == {}:
                 return None
@@ -208,18 +522,23 @@ class AnalysisClient(EtriRequest):
             for result_ in result["return_object"]
         ]
 
-    async def coreference(self, text: str) -> Optional[CoreferenceResult]:
+    async def coreference(
+        self, text: str, deadline: Union[None, float, Deadline] = None
+    ) -> Optional[CoreferenceResult]:
         """
         ### - 상호참조 해결
         상호참조 해결(coreference resolution) API는 어떤 개체에 대한 여러 표현들이 이루고 있는 참조관계를 밝히는 기술을 제공합니다.
 
         #### Parameter
-        `text` : 분석할 문단
+        `text` : 분석할 문단\n
+        `deadline` : 호출 제한 시간(초) 또는 `Deadline` 객체로, 대기열과 재시도 시간을 모두 포함합니다. (필수 X)
         """
         data = {
             "argument": {"text": text},
         }
-        result = await self.request(method="POST", endpoint="/Coreference", data=data)
+        result = await self.request(
+            method="POST", endpoint="/Coreference", data=data, deadline=deadline
+        )
         try:
             if result["return_object"] == {}:
                 return None
@@ -235,24 +554,31 @@ class QAClient(EtriRequest):
     """
     ETRI 질의응답 클라이언트 클래스입니다.
     #### access_key
-    [ETRI 포털사이트](https://aiopen.etri.re.kr/)에서 발급받은 `access_key`를 입력합니다.
+    [ETRI 포털사이트](https://aiopen.etri.re.kr/)에서 발급받은 `access_key`를 입력합니다. 여러 키를 나누어 쓰려면 `KeyPool`을 전달합니다.
+    #### kwargs
+    연결 풀 등 HTTP 설정은 `EtriRequest`의 인자를 참조하십시오.
     """
 
-    def __init__(self, access_key: str) -> None:
-        super().__init__(access_key=access_key)
+    def __init__(self, access_key: Union[str, KeyPool], **kwargs) -> None:
+        super().__init__(access_key=access_key, **kwargs)
 
-    async def qanal(self, text: str) -> Optional[WiseQAnalResult]:
+    async def qanal(
+        self, text: str, deadline: Union[None, float, Deadline] = None
+    ) -> Optional[WiseQAnalResult]:
         """
         ### - 질문분석
         자연어 질문을 분석하여 의미를 이해하고 구조화하는 기술을 제공합니다.
 
         #### Parameter
-        `text` : 분석할 질문 Text 로서 UTF-8 인코딩된 텍스트만 지원합니다.
+        `text` : 분석할 질문 Text 로서 UTF-8 인코딩된 텍스트만 지원합니다.\n
+        `deadline` : 호출 제한 시간(초) 또는 `Deadline` 객체로, 대기열과 재시도 시간을 모두 포함합니다. (필수 X)
         """
         data = {
             "argument": {"text": text},
         }
-        result = await self.request(method="POST", endpoint="/WiseQAnal", data=data)
+        result = await self.request(
+            method="POST", endpoint="/WiseQAnal", data=data, deadline=deadline
+        )
         try:
             if result["return_object"] == {}:
                 return None
@@ -261,19 +587,24 @@ class QAClient(EtriRequest):
                 raise QAException(result["reason"])
         return WiseQAnalResult(data=result)
 
-    async def mrcservlet(self, question: str, passage: str) -> Optional[MRCResult]:
+    async def mrcservlet(
+        self, question: str, passage: str, deadline: Union[None, float, Deadline] = None
+    ) -> Optional[MRCResult]:
         """
         ### - 기계독해
         자연어로 쓰여진 단락과 사용자 질문이 주어졌을 때, 딥러닝 기술을 이용하여 단락 중 정답에 해당하는 영역을 찾는 기술을 제공합니다.
 
         #### Parameter
         `question` : 질문하고자 하는 Text 로서 UTF-8 인코딩된 텍스트만 지원\n
-        `passage` : 질문의 답이 포함된 Text 로서 UTF-8 인코딩된 텍스트만 지원
+        `passage` : 질문의 답이 포함된 Text 로서 UTF-8 인코딩된 텍스트만 지원\n
+        `deadline` : 호출 제한 시간(초) 또는 `Deadline` 객체로, 대기열과 재시도 시간을 모두 포함합니다. (필수 X)
         """
         data = {
             "argument": {"passage": passage, "question": question},
         }
-        result = await self.request(method="POST", endpoint="/MRCServlet", data=data)
+        result = await self.request(
+            method="POST", endpoint="/MRCServlet", data=data, deadline=deadline
+        )
         try:
             if result["return_object"] == {}:
                 return None
@@ -283,7 +614,10 @@ class QAClient(EtriRequest):
         return MRCResult(data=result["return_object"]["MRCInfo"])
 
     async def wiki(
-        self, type: Union[WikiType, str], question: str
+        self,
+        type: Union[WikiType, str],
+        question: str,
+        deadline: Union[None, float, Deadline] = None,
     ) -> Optional[WiKiResult]:
         """
         ### - 위키백과 QA
@@ -291,12 +625,15 @@ class QAClient(EtriRequest):
 
         #### Parameter
         `question` : 질문하고자 하는 Text 로서 UTF-8 인코딩된 텍스트만 지원\n
-        `type` : 질문 응답 엔진의 종류 로서 UTF-8 인코딩된 텍스트만 지원 (WikiType 클래스 사용 추천)
+        `type` : 질문 응답 엔진의 종류 로서 UTF-8 인코딩된 텍스트만 지원 (WikiType 클래스 사용 추천)\n
+        `deadline` : 호출 제한 시간(초) 또는 `Deadline` 객체로, 대기열과 재시도 시간을 모두 포함합니다. (필수 X)
         """
         data = {
             "argument": {"type": type, "question": question},
         }
-        result = await self.request(method="POST", endpoint="/WikiQA", data=data)
+        result = await self.request(
+            method="POST", endpoint="/WikiQA", data=data, deadline=deadline
+        )
         try:
             if result["return_object"] == {}:
                 return None
@@ -305,18 +642,23 @@ class QAClient(EtriRequest):
                 raise QAException(result["reason"])
         return WiKiResult(data=result)
 
-    async def legal(self, question: str) -> Optional[LegalResult]:
+    async def legal(
+        self, question: str, deadline: Union[None, float, Deadline] = None
+    ) -> Optional[LegalResult]:
         """
         ### - 법률 QA
         자연어로 기술된 질문의 의미를 분석하여, 법령문서에서 조 내용을 검색하고 정답을 추론하여 제공합니다.
 
         #### Parameter
         `question` : 질문하고자 하는 Text 로서 UTF-8 인코딩된 텍스트만 지원\n
+        `deadline` : 호출 제한 시간(초) 또는 `Deadline` 객체로, 대기열과 재시도 시간을 모두 포함합니다. (필수 X)
         """
         data = {
             "argument": {"question": question},
         }
-        result = await self.request(method="POST", endpoint="/LegalQA", data=data)
+        result = await self.request(
+            method="POST", endpoint="/LegalQA", data=data, deadline=deadline
+        )
         try:
             if result["return_object"] == {}:
                 return None
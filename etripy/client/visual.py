@@ -1,8 +1,11 @@
+import asyncio
 import base64
-from typing import Optional
+from typing import Optional, Union
 
+from etripy.cache import FileIdCache
 from etripy.error import VisualImageException, VisualVideoException
 from etripy.http import EtriRequest
+from etripy.limit import KeyPool
 from etripy.model.visual.image import (
     FaceDeIDResult,
     HumanParsingResult,
@@ -10,20 +13,36 @@ from etripy.model.visual.image import (
     ObjectDetectResult,
 )
 from etripy.model.visual.video import VideoParseResult
+from etripy.policy import Deadline
+
+
+def _read_base64(file_path: str) -> str:
+    with open(file_path, "rb") as file:
+        return base64.b64encode(file.read()).decode("utf8")
 
 
 class ImageClient(EtriRequest):
     """
     ETRI 시각지능 이미지 클라이언트 클래스입니다.
     #### access_key
-    [ETRI 포털사이트](https://aiopen.etri.re.kr/)에서 발급받은 `access_key`를 입력합니다.
+    [ETRI 포털사이트](https://aiopen.etri.re.kr/)에서 발급받은 `access_key`를 입력합니다. 여러 키를 나누어 쓰려면 `KeyPool`을 전달합니다.
+    #### kwargs
+    연결 풀 등 HTTP 설정은 `EtriRequest`의 인자를 참조하십시오.
     """
 
-    def __init__(self, access_key: str) -> None:
-        super().__init__(access_key=access_key)
+    def __init__(self, access_key: Union[str, KeyPool], **kwargs) -> None:
+        super().__init__(access_key=access_key, **kwargs)
+
+    async def _encode(self, file_path: str) -> str:
+        """이미지 파일을 읽어 base64로 인코딩합니다. (이벤트 루프를 막지 않도록 실행기에서 처리)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, _read_base64, file_path)
 
     async def object_detect(
-        self, file_path: str, file_type: str = "auto"
+        self,
+        file_path: str,
+        file_type: str = "auto",
+        deadline: Union[None, float, Deadline] = None,
     ) -> Optional[list[ObjectDetectResult]]:
         """
         ### - 객체검출 API
@@ -32,17 +51,18 @@ class ImageClient(EtriRequest):
 
         #### Parameter\n
         `file_path` : 객체검출 하고자 하는 이미지의 경로.\n
-        `file_type` : 이미지 파일의 확장자
+        `file_type` : 이미지 파일의 확장자\n
+        `deadline` : 호출 제한 시간(초) 또는 `Deadline` 객체로, 대기열과 재시도 시간을 모두 포함합니다. (필수 X)
         """
         if file_type == "auto":
             file_type = file_path.split(".")[-1]
 
-        file = open(file_path, "rb")
-        imageContents = base64.b64encode(file.read()).decode("utf8")
-        file.close()
+        imageContents = await self._encode(file_path)
 
         data = {"argument": {"type": file_type, "file": imageContents}}
-        result = await self.request(method="POST", endpoint="/ObjectDetect", data=data)
+        result = await self.request(
+            method="POST", endpoint="/ObjectDetect", data=data, deadline=deadline
+        )
         try:
             if result["return_object"] == {}:
                 return None
@@ -54,7 +74,10 @@ class ImageClient(EtriRequest):
         ]
 
     async def human_parsing(
-        self, file_path: str, file_type: str = "auto"
+        self,
+        file_path: str,
+        file_type: str = "auto",
+        deadline: Union[None, float, Deadline] = None,
     ) -> Optional[list[HumanParsingResult]]:
         """
         ### - 사람속성 검출 API
@@ -63,17 +86,18 @@ class ImageClient(EtriRequest):
 
         #### Parameter\n
         `file_path` : 사람속성 검출 하고자 하는 이미지의 경로.\n
-        `file_type` : 이미지 파일의 확장자
+        `file_type` : 이미지 파일의 확장자\n
+        `deadline` : 호출 제한 시간(초) 또는 `Deadline` 객체로, 대기열과 재시도 시간을 모두 포함합니다. (필수 X)
         """
         if file_type == "auto":
             file_type = file_path.split(".")[-1]
 
-        file = open(file_path, "rb")
-        imageContents = base64.b64encode(file.read()).decode("utf8")
-        file.close()
+        imageContents = await self._encode(file_path)
 
         data = {"argument": {"type": file_type, "file": imageContents}}
-        result = await self.request(method="POST", endpoint="/HumanParsing", data=data)
+        result = await self.request(
+            method="POST", endpoint="/HumanParsing", data=data, deadline=deadline
+        )
         try:
             if result["return_object"] == {}:
                 return None
@@ -84,21 +108,24 @@ class ImageClient(EtriRequest):
         keys = list(result["return_object"].keys())
         return [ObjectDetectResult(data=result["return_object"][key]) for key in keys]
 
-    async def face_deid(self, file_path: str) -> Optional[list[FaceDeIDResult]]:
+    async def face_deid(
+        self, file_path: str, deadline: Union[None, float, Deadline] = None
+    ) -> Optional[list[FaceDeIDResult]]:
         """
         ### - 얼굴 비식별화 API
         영상 내에 존재하는 얼굴 영역을 자동으로 검출하고 얼굴 영역 영상처리를 수행하여 개인 정보인 얼굴을 비식별화 처리를 하게 됩니다.\n
         본 기술은 타인이 포함된 영상을 외부에 공유 시 개인 정보를 보호할 수 있는 목적으로 활용될 수 있으며, 모든 얼굴이 아닌 특정 얼굴을 제외한 비식별화 용도로 응용될 수 있습니다.
 
         #### Parameter\n
-        `file_path` : 얼굴 비식별화를 적용하고자 하는 이미지의 경로.
+        `file_path` : 얼굴 비식별화를 적용하고자 하는 이미지의 경로.\n
+        `deadline` : 호출 제한 시간(초) 또는 `Deadline` 객체로, 대기열과 재시도 시간을 모두 포함합니다. (필수 X)
         """
-        file = open(file_path, "rb")
-        imageContents = base64.b64encode(file.read()).decode("utf8")
-        file.close()
+        imageContents = await self._encode(file_path)
 
         data = {"argument": {"file": imageContents, "type": "1"}}
-        result = await self.request(method="POST", endpoint="/FaceDeID", data=data)
+        result = await self.request(
+            method="POST", endpoint="/FaceDeID", data=data, deadline=deadline
+        )
         try:
             if result["return_object"] == {}:
                 return None
@@ -110,26 +137,30 @@ class ImageClient(EtriRequest):
         ]
 
     async def human_status(
-        self, file_path: str, file_type: str = "auto"
+        self,
+        file_path: str,
+        file_type: str = "auto",
+        deadline: Union[None, float, Deadline] = None,
     ) -> Optional[list[HumanStatusResult]]:
         """
         ### - 사람 상태 이해 API
-        영상 내에 존재하는 모든 사람 영역을 자동으로 검출하고 해당 사람의 상태를 판단하여 사용자에게 그 결과를 출력해주게 됩니다. 
-        본 기술은 도심에서 주취, 기절 등과 같이 쓰러져 도움이 필요한 사람을 자동으로 검출하여 위험 상황 발생 전에 선제적으로 대응할 수 있는 시스템 개발에 사용 될 수 있습니다. 
+        영상 내에 존재하는 모든 사람 영역을 자동으로 검출하고 해당 사람의 상태를 판단하여 사용자에게 그 결과를 출력해주게 됩니다.
+        본 기술은 도심에서 주취, 기절 등과 같이 쓰러져 도움이 필요한 사람을 자동으로 검출하여 위험 상황 발생 전에 선제적으로 대응할 수 있는 시스템 개발에 사용 될 수 있습니다.
 
         #### Parameter\n
         `file_path` : 사람 상태 이해를 수행하고자 하는 이미지의 경로.\n
-        `file_type` : 이미지 파일의 확장자
+        `file_type` : 이미지 파일의 확장자\n
+        `deadline` : 호출 제한 시간(초) 또는 `Deadline` 객체로, 대기열과 재시도 시간을 모두 포함합니다. (필수 X)
         """
         if file_type == "auto":
             file_type = file_path.split(".")[-1]
 
-        file = open(file_path, "rb")
-        imageContents = base64.b64encode(file.read()).decode("utf8")
-        file.close()
+        imageContents = await self._encode(file_path)
 
         data = {"argument": {"type": file_type, "file": imageContents}}
-        result = await self.request(method="POST", endpoint="/HumanStatus", data=data)
+        result = await self.request(
+            method="POST", endpoint="/HumanStatus", data=data, deadline=deadline
+        )
         try:
             if result["return_object"] == {}:
                 return None
@@ -149,20 +180,33 @@ class VideoClient(EtriRequest):
     동영상의 영상 길이는 최소 5초 이상되어야 합니다.\n
     동영상의 영상 길이는 최대 5분 미만이어야 합니다.\n
     #### access_key
-    [ETRI 포털사이트](https://aiopen.etri.re.kr/)에서 발급받은 `access_key`를 입력합니다.
+    [ETRI 포털사이트](https://aiopen.etri.re.kr/)에서 발급받은 `access_key`를 입력합니다. 여러 키를 나누어 쓰려면 `KeyPool`을 전달합니다.
+    #### file_ids
+    업로드한 동영상의 `file_id`를 파일 내용별로 기억해 `video_parse_for_path`에서 다시 사용할 캐시 (`FileIdCache`, 필수 X)
+    #### kwargs
+    연결 풀 등 HTTP 설정은 `EtriRequest`의 인자를 참조하십시오.
     """
 
-    def __init__(self, access_key: str) -> None:
-        super().__init__(access_key=access_key)
-
-    async def video_upload(self, video_path: str) -> str:
+    def __init__(
+        self,
+        access_key: Union[str, KeyPool],
+        file_ids: Optional[FileIdCache] = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(access_key=access_key, **kwargs)
+        self.file_ids = file_ids
+
+    async def video_upload(
+        self, video_path: str, deadline: Union[None, float, Deadline] = None
+    ) -> str:
         """
         비디오를 서버에 등록하여, 비디오 파일 ID를 반환합니다.
 
         #### Parameter\n
-        `video_path` : API 사용 요청 시 분석을 위해 전달할 비디오 파일 경로
+        `video_path` : API 사용 요청 시 분석을 위해 전달할 비디오 파일 경로\n
+        `deadline` : 호출 제한 시간(초) 또는 `Deadline` 객체로, 대기열과 재시도 시간을 모두 포함합니다. (필수 X)
         """
-        result = await self.file_upload(upload_file_path=video_path)
+        result = await self.file_upload(upload_file_path=video_path, deadline=deadline)
         try:
             if result["return_object"] == {}:
                 return None
@@ -172,18 +216,21 @@ class VideoClient(EtriRequest):
 
         return result["return_object"]["file_id"]
 
-    async def video_parse(self, file_id: str) -> list[VideoParseResult]:
+    async def video_parse(
+        self, file_id: str, deadline: Union[None, float, Deadline] = None
+    ) -> list[VideoParseResult]:
         """
         ### - 장면 분할 API
         동영상에서 장면이 변화하는 시점을 탐지하여, 동영상을 썸네일로 요약하거나 편집을 용이하게 하는 포인트를 제공합니다.
         동영상의 각 프레임의 특성 추출 후 특성이 시간적으로 크게 변화하는 시점을 탐지하여 출력합니다.
 
         #### Parameter\n
-        `file_id` : 장면분할처리를 위한 file의 ID
+        `file_id` : 장면분할처리를 위한 file의 ID\n
+        `deadline` : 호출 제한 시간(초) 또는 `Deadline` 객체로, 대기열과 재시도 시간을 모두 포함합니다. (필수 X)
         """
         data = {"argument": {"file_id": file_id}}
         result = await self.request(
-            method="POST", endpoint="/VideoParse/status", data=data
+            method="POST", endpoint="/VideoParse/status", data=data, deadline=deadline
         )
         try:
             if result["return_object"] == {}:
@@ -196,28 +243,33 @@ class VideoClient(EtriRequest):
             VideoParseResult(**data_) for data_ in result["return_object"]["result"]
         ]
 
-    async def video_parse_for_path(self, file_path: str) -> list[VideoParseResult]:
+    async def video_parse_for_path(
+        self, file_path: str, deadline: Union[None, float, Deadline] = None
+    ) -> list[VideoParseResult]:
         """
         ### - 장면 분할 API
         동영상에서 장면이 변화하는 시점을 탐지하여, 동영상을 썸네일로 요약하거나 편집을 용이하게 하는 포인트를 제공합니다.
         동영상의 각 프레임의 특성 추출 후 특성이 시간적으로 크게 변화하는 시점을 탐지하여 출력합니다.\n
 
-        같은 동영상을 자주 분석하는 경우 가급적 `video_parse`를 사용하십시오.
+        `file_ids`를 지정하면 이미 업로드한 동영상은 저장된 `file_id`를 다시 사용하고,
+        서버에서 `file_id`가 만료된 경우에만 다시 업로드합니다.
 
         #### Parameter\n
-        `file_path` : API 사용 요청 시 분석을 위해 전달할 비디오 파일 경로
+        `file_path` : API 사용 요청 시 분석을 위해 전달할 비디오 파일 경로\n
+        `deadline` : 호출 제한 시간(초) 또는 `Deadline` 객체로, 대기열과 재시도 시간을 모두 포함합니다. (필수 X)
         """
-        data = {"argument": {"file_id": await self.video_upload(video_path=file_path)}}
-        result = await self.request(
-            method="POST", endpoint="/VideoParse/status", data=data
-        )
-        try:
-            if result["return_object"] == {}:
-                return None
-        except KeyError:
-            if result["result"] != "0":
-                raise VisualVideoException(result["reason"])
-
-        return [
-            VideoParseResult(**data_) for data_ in result["return_object"]["result"]
-        ]
+        deadline = Deadline.of(deadline)
+        if self.file_ids is not None:
+            loop = asyncio.get_running_loop()
+            # 큰 파일의 해시 계산이 이벤트 루프를 막지 않도록 실행기에서 처리합니다.
+            file_id = await loop.run_in_executor(None, self.file_ids.get, file_path)
+            if file_id is not None:
+                try:
+                    return await self.video_parse(file_id, deadline=deadline)
+                except VisualVideoException:
+                    # 서버에서 만료된 file_id는 지우고 한 번 다시 업로드합니다.
+                    await loop.run_in_executor(None, self.file_ids.discard, file_path)
+        file_id = await self.video_upload(video_path=file_path, deadline=deadline)
+        if self.file_ids is not None and file_id is not None:
+            await loop.run_in_executor(None, self.file_ids.put, file_path, file_id)
+        return await self.video_parse(file_id, deadline=deadline)
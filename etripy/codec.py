@@ -0,0 +1,163 @@
+import hashlib
+import json
+import pickle
+from typing import Any, Collection, FrozenSet, Iterable, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+DECODE_THRESHOLD = 1 << 20
+"""클라이언트의 `decode_executor`에서 역직렬화할 응답의 기본 최소 크기(byte)"""
+
+ANALYSIS_FIELDS = (
+    "id",
+    "reserve_str",
+    "text",
+    "morp",
+    "morp_eval",
+    "WSD",
+    "word",
+    "NE",
+    "NE_Link",
+    "chunk",
+    "dependency",
+    "phrase_dependency",
+    "SRL",
+    "relation",
+    "SA",
+    "ZA",
+)
+"""언어 분석 결과 문장(`sentence`)의 필드 이름"""
+
+_ALWAYS_FIELDS = frozenset(("id", "text"))
+
+
+class JSONCodec:
+    """
+    요청 본문을 직렬화하고 응답 본문을 역직렬화하는 기본 JSON 코덱입니다.\n
+    표준 라이브러리 `json`을 사용하며, 한글을 `\\uXXXX`로 바꾸지 않고 UTF-8 그대로 보냅니다.
+    다른 코덱을 사용하려면 이 클래스를 상속해 `dumps`와 `loads`를 구현하십시오.
+    """
+
+    name: str = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """`obj`를 UTF-8 JSON 바이트로 직렬화합니다."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """JSON 바이트(또는 문자열)를 역직렬화합니다."""
+        return json.loads(data)
+
+    def canonical(self, obj: Any) -> bytes:
+        """키를 정렬해 같은 내용이면 항상 같은 바이트가 되도록 직렬화합니다."""
+        return json.dumps(
+            obj, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+        ).encode("utf-8")
+
+    def request_key(self, endpoint: str, data: Any) -> str:
+        """엔드포인트와 요청 본문으로 같은 요청을 식별하는 키를 만듭니다."""
+        digest = hashlib.sha256(endpoint.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(self.canonical(data))
+        return digest.hexdigest()
+
+
+class OrjsonCodec(JSONCodec):
+    """`orjson`을 사용하는 JSON 코덱입니다. (`pip install orjson` 필요)"""
+
+    name: str = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires the 'orjson' package")
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+    def canonical(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+
+
+def default_codec() -> JSONCodec:
+    """`orjson`이 설치되어 있으면 `OrjsonCodec`, 아니면 `JSONCodec`을 반환합니다."""
+    if orjson is not None:
+        return OrjsonCodec()
+    return JSONCodec()
+
+
+def analysis_fields(
+    fields: Union[None, str, Iterable[str]]
+) -> Optional[FrozenSet[str]]:
+    """
+    언어 분석 결과에서 남길 문장 필드를 검사해 집합으로 반환합니다. (`None`이면 모든 필드)\n
+    `id`와 `text`는 항상 남기며, `ANALYSIS_FIELDS`에 없는 이름이면 `ValueError`가 발생합니다.
+    """
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = (fields,)
+    fields = frozenset(fields)
+    unknown = fields.difference(ANALYSIS_FIELDS)
+    if unknown:
+        raise ValueError(f"unknown analysis fields: {', '.join(sorted(unknown))}")
+    return fields | _ALWAYS_FIELDS
+
+
+def project_analysis(result: Any, fields: Optional[Collection[str]]) -> Any:
+    """
+    언어 분석 응답의 각 문장(`return_object.sentence`)에서 `fields`에 있는 필드만 남깁니다.\n
+    원래 응답은 바꾸지 않고 새 dict를 만들며, `fields`가 `None`이거나 언어 분석 응답이 아니면 그대로 반환합니다.
+    """
+    if fields is None or not isinstance(result, dict):
+        return result
+    return_object = result.get("return_object")
+    if not isinstance(return_object, dict):
+        return result
+    sentences = return_object.get("sentence")
+    if not isinstance(sentences, list):
+        return result
+    sentences = [
+        {key: value for key, value in sentence.items() if key in fields}
+        for sentence in sentences
+    ]
+    return dict(result, return_object=dict(return_object, sentence=sentences))
+
+
+def decode(
+    codec: JSONCodec, body: bytes, fields: Optional[Collection[str]] = None
+) -> Any:
+    """응답 본문을 역직렬화하고 `project_analysis`로 `fields`만 남깁니다. (실행기에서 실행)"""
+    return project_analysis(codec.loads(body), fields)
+
+
+def decode_pieces(
+    codec: JSONCodec,
+    body: bytes,
+    piece_size: int = 64,
+    fields: Optional[Collection[str]] = None,
+) -> Tuple[bytes, List[bytes]]:
+    """
+    응답 본문을 역직렬화한 뒤, `return_object.sentence` 목록을 `piece_size`개씩 나누어 pickle한 조각과
+    나머지 부분의 pickle을 반환합니다. 프로세스 풀에서 실행하며, 받는 쪽은 조각마다 이벤트 루프에 양보하며 다시 조립합니다.
+    `fields`가 있으면 pickle하기 전에 `project_analysis`로 나머지 필드를 버리므로, 버린 필드는 받는 쪽으로 오지 않습니다.
+    """
+    result = decode(codec, body, fields)
+    sentences = None
+    if isinstance(result, dict) and isinstance(result.get("return_object"), dict):
+        sentences = result["return_object"].get("sentence")
+    if not isinstance(sentences, list):
+        return pickle.dumps(result, pickle.HIGHEST_PROTOCOL), []
+    result["return_object"]["sentence"] = []
+    pieces = [
+        pickle.dumps(sentences[start : start + piece_size], pickle.HIGHEST_PROTOCOL)
+        for start in range(0, len(sentences), piece_size)
+    ]
+    return pickle.dumps(result, pickle.HIGHEST_PROTOCOL), pieces
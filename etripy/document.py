@@ -0,0 +1,334 @@
+import bisect
+import copy
+import re
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+MAX_ANALYSIS_CHARS = 10000
+"""언어 분석(`/WiseNLU`, `/WiseNLU_spoken`) 요청 한 번에 보낼 텍스트의 최대 글자 수"""
+
+PACK_SEPARATOR = "\n\n"
+"""여러 텍스트를 요청 하나로 묶을 때 텍스트 사이에 넣는 경계 문자열"""
+
+_SENTENCE_END = re.compile(r"[.!?。？！…]+[\"'”’)\]」』]*\s+|\n\s*")
+_SPACE = re.compile(r"\s")
+
+# 문장 안에서 같은 ID 공간을 가리키는 필드입니다. (`(목록, 필드, ID 공간)`)
+_ID_FIELDS = (
+    ("morp", "id", "morp"),
+    ("morp_eval", "id", "morp_eval"),
+    ("morp_eval", "word_id", "word"),
+    ("morp_eval", "m_begin", "morp"),
+    ("morp_eval", "m_end", "morp"),
+    ("WSD", "id", "WSD"),
+    ("WSD", "begin", "morp"),
+    ("WSD", "end", "morp"),
+    ("word", "id", "word"),
+    ("word", "begin", "morp"),
+    ("word", "end", "morp"),
+    ("NE", "id", "NE"),
+    ("NE", "begin", "morp"),
+    ("NE", "end", "morp"),
+    ("dependency", "id", "word"),
+    ("dependency", "head", "word"),
+    ("dependency", "mod", "word"),
+    ("SRL", "word_id", "word"),
+)
+_ID_SPACES = ("morp", "morp_eval", "WSD", "word", "NE")
+_POSITION_FIELDS = ("morp", "WSD")
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    텍스트를 문장 단위로 나눕니다.\n
+    문장 부호(`.`, `!`, `?` 등) 뒤의 공백과 줄바꿈을 경계로 나누며, 공백은 앞 문장에 붙여 두므로
+    나눈 문장을 모두 이어 붙이면 원래 텍스트와 같습니다.
+    """
+    sentences, start = [], 0
+    for match in _SENTENCE_END.finditer(text):
+        sentences.append(text[start : match.end()])
+        start = match.end()
+    if start < len(text):
+        sentences.append(text[start:])
+    return sentences
+
+
+def _split_long(sentence: str, max_chars: int) -> Iterable[str]:
+    # 한 문장이 너무 길면 제한 안쪽의 마지막 공백에서, 공백이 없으면 제한 길이에서 자릅니다.
+    while len(sentence) > max_chars:
+        cut = max(
+            (match.end() for match in _SPACE.finditer(sentence, 0, max_chars)),
+            default=max_chars,
+        )
+        yield sentence[:cut]
+        sentence = sentence[cut:]
+    if sentence:
+        yield sentence
+
+
+def chunk_text(text: str, max_chars: int = MAX_ANALYSIS_CHARS) -> List[Tuple[int, str]]:
+    """
+    텍스트를 문장 경계에서 `max_chars`글자 이하의 조각으로 나눕니다.\n
+    각 조각은 원래 텍스트를 그대로 자른 것이며, `(UTF-8 byte 시작 위치, 조각)` 목록을 반환합니다.
+    """
+    if max_chars <= 0:
+        raise ValueError("max_chars must be positive")
+    chunks: List[Tuple[int, str]] = []
+    current: List[str] = []
+    size = offset = 0
+
+    def flush() -> None:
+        nonlocal size, offset
+        if current:
+            chunk = "".join(current)
+            chunks.append((offset, chunk))
+            offset += len(chunk.encode("utf-8"))
+            current.clear()
+            size = 0
+
+    for sentence in split_sentences(text):
+        for piece in _split_long(sentence, max_chars):
+            if size + len(piece) > max_chars:
+                flush()
+            current.append(piece)
+            size += len(piece)
+    flush()
+    return chunks
+
+
+class PackPolicy:
+    """
+    짧은 텍스트 여러 개를 요청 하나로 묶을 때 묶음 크기를 정하는 정책 클래스입니다.\n
+    응답 시간이 `target_latency`보다 짧으면 묶음 크기를 `step`글자씩 늘리고,
+    길어지거나 실패하면 절반으로 줄입니다. (AIMD) 여러 일괄 처리가 공유할 수 있습니다.
+
+    #### Parameter
+    `target_latency` : 묶음 요청 한 번의 목표 응답 시간(초)\n
+    `min_chars` : 묶음의 최소 글자 수\n
+    `max_chars` : 묶음의 최대 글자 수 (서버 요청 크기 제한)\n
+    `initial_chars` : 처음 묶음 글자 수 (None이면 `max_chars`의 1/4)\n
+    `step` : 응답이 빠를 때 늘릴 글자 수 (None이면 `max_chars`의 1/10)
+    """
+
+    def __init__(
+        self,
+        target_latency: float = 2.0,
+        min_chars: int = 500,
+        max_chars: int = MAX_ANALYSIS_CHARS,
+        initial_chars: Optional[int] = None,
+        step: Optional[int] = None,
+    ) -> None:
+        if not 0 < min_chars <= max_chars:
+            raise ValueError("min_chars must be positive and not exceed max_chars")
+        self.target_latency = target_latency
+        self.min_chars = min_chars
+        self.max_chars = max_chars
+        self.step = step or max(1, max_chars // 10)
+        self._size = float(
+            min(max(initial_chars or max_chars // 4, min_chars), max_chars)
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """현재 묶음 글자 수"""
+        return int(self._size)
+
+    def record(self, latency: Optional[float]) -> None:
+        """묶음 요청의 응답 시간(초)을 기록합니다. 실패한 요청은 None을 전달합니다."""
+        with self._lock:
+            if latency is None or latency > self.target_latency:
+                self._size = max(self.min_chars, self._size / 2)
+            else:
+                self._size = min(self.max_chars, self._size + self.step)
+
+    def timed(self) -> "_Timer":
+        """`with` 블록의 실행 시간을 기록합니다. (예외가 발생하면 실패로 기록)"""
+        return _Timer(self)
+
+
+class _Timer:
+    def __init__(self, policy: PackPolicy) -> None:
+        self.policy = policy
+
+    def __enter__(self) -> None:
+        self.started = time.monotonic()
+
+    def __exit__(self, exc_type, *args) -> None:
+        if exc_type is None:
+            self.policy.record(time.monotonic() - self.started)
+        else:
+            self.policy.record(None)
+
+
+def pack_texts(
+    inputs: Iterator[Tuple[int, str]], policy: PackPolicy
+) -> Iterator[List[Tuple[int, str]]]:
+    """
+    `(순서, 텍스트)`를 `PACK_SEPARATOR`로 이었을 때 `policy.size`글자를 넘지 않도록 묶어 내보냅니다.\n
+    묶음 크기는 묶음을 만들 때마다 `policy`에서 다시 읽으며, 크기보다 긴 텍스트는 혼자 묶입니다.
+    `inputs`는 필요한 만큼만 읽습니다.
+    """
+    pending: Optional[Tuple[int, str]] = None
+    while True:
+        batch: List[Tuple[int, str]] = []
+        size, limit = 0, policy.size
+        if pending is not None:
+            batch.append(pending)
+            size, pending = len(pending[1]), None
+        for pair in inputs:
+            if batch and size + len(PACK_SEPARATOR) + len(pair[1]) > limit:
+                pending = pair
+                break
+            size += len(pair[1]) + (len(PACK_SEPARATOR) if batch else 0)
+            batch.append(pair)
+        if not batch:
+            return
+        yield batch
+
+
+def pack_spans(texts: List[str]) -> Tuple[str, List[Tuple[int, int]]]:
+    """텍스트를 `PACK_SEPARATOR`로 이어 붙이고, 각 텍스트의 `(UTF-8 byte 시작, 끝)` 목록과 함께 반환합니다."""
+    spans, offset = [], 0
+    separator = len(PACK_SEPARATOR.encode("utf-8"))
+    for text in texts:
+        size = len(text.encode("utf-8"))
+        spans.append((offset, offset + size))
+        offset += size + separator
+    return PACK_SEPARATOR.join(texts), spans
+
+
+def _document_scoped(sentences: List[Dict[str, Any]], space: str) -> Optional[bool]:
+    # 두 번째 문장부터 ID가 0이 아닌 값으로 시작하면 문서 전체에서 이어지는 ID로 봅니다.
+    # (두 번째 문장부터 항목이 없어 알 수 없으면 None)
+    for sentence in sentences[1:]:
+        items = sentence.get(space)
+        if items:
+            return items[0].get("id", 0) != 0
+    return None
+
+
+def _shift(value: Any, offset: int) -> Any:
+    if isinstance(value, list):
+        return [_shift(item, offset) for item in value]
+    if isinstance(value, int) and value >= 0:
+        return value + offset
+    return value
+
+
+def _rebase(sentence: Dict[str, Any], position: int, offsets: Dict[str, int]) -> None:
+    # 문장 하나의 byte `position`과 ID를 주어진 만큼 옮깁니다.
+    for name in _POSITION_FIELDS:
+        for item in sentence.get(name) or []:
+            if isinstance(item.get("position"), int):
+                item["position"] += position
+    for name, key, space in _ID_FIELDS:
+        if not offsets[space]:
+            continue
+        for item in sentence.get(name) or []:
+            if key in item:
+                item[key] = _shift(item[key], offsets[space])
+    if offsets["word"]:
+        for srl in sentence.get("SRL") or []:
+            for argument in srl.get("argument") or []:
+                if "word_id" in argument:
+                    argument["word_id"] = _shift(argument["word_id"], offsets["word"])
+
+
+def merge_analysis(
+    results: List[Tuple[int, Optional[Dict[str, Any]]]]
+) -> Optional[Dict[str, Any]]:
+    """
+    조각별 언어 분석 응답을 하나의 응답으로 합칩니다.\n
+    `results`는 `(조각의 UTF-8 byte 시작 위치, 응답)` 목록이며, 문장 ID와 형태소/어절 등의 ID,
+    byte `position`을 문서 전체 기준으로 다시 매깁니다. 응답은 수정하지 않고 복사합니다.
+    """
+    results = [
+        (offset, copy.deepcopy(result))
+        for offset, result in results
+        if result and result.get("return_object")
+    ]
+    # ID 범위는 조각마다 정하지 않고, 알 수 있는 첫 조각을 기준으로 문서 전체에 한 번 정합니다.
+    scoped = dict.fromkeys(_ID_SPACES, False)
+    for space in _ID_SPACES:
+        for _, result in results:
+            sentences = result["return_object"].get("sentence") or []
+            decided = _document_scoped(sentences, space)
+            if decided is not None:
+                scoped[space] = decided
+                break
+    merged: Optional[Dict[str, Any]] = None
+    sentence_count = 0
+    counts = dict.fromkeys(_ID_SPACES, 0)
+    for offset, result in results:
+        sentences = result["return_object"].get("sentence") or []
+        offsets = {space: counts[space] if scoped[space] else 0 for space in _ID_SPACES}
+        for sentence in sentences:
+            if isinstance(sentence.get("id"), int):
+                sentence["id"] += sentence_count
+            _rebase(sentence, offset, offsets)
+        for space in _ID_SPACES:
+            counts[space] += sum(len(item.get(space) or []) for item in sentences)
+        sentence_count += len(sentences)
+        if merged is None:
+            merged = result
+            continue
+        target = merged["return_object"]
+        target.setdefault("sentence", []).extend(sentences)
+        for key in ("entity", "paragraphInfo"):
+            if result["return_object"].get(key):
+                target[key] = (target.get(key) or []) + result["return_object"][key]
+    return merged
+
+
+def _sentence_position(sentence: Dict[str, Any]) -> Optional[int]:
+    for name in _POSITION_FIELDS:
+        for item in sentence.get(name) or []:
+            if isinstance(item.get("position"), int):
+                return item["position"]
+    return None
+
+
+def split_analysis(
+    result: Dict[str, Any], spans: List[Tuple[int, int]]
+) -> List[Dict[str, Any]]:
+    """
+    여러 텍스트를 `PACK_SEPARATOR`로 이어 붙여 분석한 응답을 텍스트별 응답으로 나눕니다.\n
+    `spans`는 이어 붙인 텍스트에서 각 텍스트가 차지하는 `(UTF-8 byte 시작, 끝)` 목록이며,
+    문장은 첫 형태소의 `position`으로 나누고 ID와 `position`은 각 텍스트 기준으로 다시 매깁니다.
+    문장이 어느 텍스트에도 속하지 않거나(경계 문자열에 걸친 경우) 문장을 하나도 받지 못한 텍스트가 있으면
+    `ValueError`가 발생합니다. (텍스트별로 다시 요청하십시오.)
+    """
+    sentences = (result.get("return_object") or {}).get("sentence") or []
+    starts = [start for start, _ in spans]
+    groups: List[List[Dict[str, Any]]] = [[] for _ in spans]
+    index = 0
+    for sentence in sentences:
+        position = _sentence_position(sentence)
+        if position is not None:
+            index = bisect.bisect_right(starts, position) - 1
+            if index < 0 or position >= spans[index][1]:
+                raise ValueError(f"Sentence at byte {position} is outside every text")
+        groups[index].append(sentence)
+    if not all(groups):
+        raise ValueError("Some texts did not get any sentence")
+    scoped = {space: bool(_document_scoped(sentences, space)) for space in _ID_SPACES}
+    counts = dict.fromkeys(_ID_SPACES, 0)
+    results = []
+    for (start, _), group in zip(spans, groups):
+        group = copy.deepcopy(group)
+        offsets = {
+            space: -counts[space] if scoped[space] else 0 for space in _ID_SPACES
+        }
+        for number, sentence in enumerate(group):
+            if "id" in sentence:
+                sentence["id"] = number
+            _rebase(sentence, -start, offsets)
+        for space in _ID_SPACES:
+            counts[space] += sum(len(item.get(space) or []) for item in group)
+        return_object = dict(result["return_object"], sentence=group)
+        if "entity" in return_object:
+            return_object["entity"] = []
+        results.append(dict(result, return_object=return_object))
+    return results
@@ -1,5 +1,71 @@
+from typing import Optional
+
+
 class HTTPException(Exception):
-    pass
+    status: Optional[int] = None
+    """HTTP 상태 코드 (응답을 받지 못한 경우 None)"""
+    retryable: bool = False
+    """다시 요청하면 성공할 수 있는 오류인지 여부"""
+
+
+class HTTPStatusException(HTTPException):
+    """200이 아닌 HTTP 상태 코드를 받았을 때 발생합니다."""
+
+    def __init__(self, status: int, text: str = "") -> None:
+        self.status = status
+        self.text = text
+        super().__init__(f"Error Code {status} : {text}")
+
+    @classmethod
+    def from_status(cls, status: int, text: str = "") -> "HTTPStatusException":
+        """상태 코드에 맞는 예외 객체를 생성합니다."""
+        if status == 429:
+            return HTTPTooManyRequestsException(status, text)
+        if 400 <= status < 500:
+            return HTTPClientException(status, text)
+        if status >= 500:
+            return HTTPServerException(status, text)
+        return cls(status, text)
+
+
+class HTTPClientException(HTTPStatusException):
+    """4xx 응답 (다시 요청하지 않습니다)"""
+
+
+class HTTPTooManyRequestsException(HTTPClientException):
+    """429 응답 (다시 요청할 수 있습니다)"""
+
+    retryable = True
+
+
+class HTTPServerException(HTTPStatusException):
+    """5xx 응답 (다시 요청할 수 있습니다)"""
+
+    retryable = True
+
+
+class HTTPConnectionException(HTTPException):
+    """연결 실패, 연결 끊김 등 전송 오류 (다시 요청할 수 있습니다)"""
+
+    retryable = True
+
+
+class HTTPTimeoutException(HTTPException):
+    """응답 시간 초과 (다시 요청할 수 있습니다)"""
+
+    retryable = True
+
+
+class DeadlineExceededException(HTTPException):
+    """호출 마감 시각(`deadline`)이 지났을 때 발생합니다. (다시 요청하지 않습니다)"""
+
+
+class CircuitOpenException(HTTPException):
+    """엔드포인트의 서킷 브레이커가 열려 있어 요청을 보내지 않았을 때 발생합니다."""
+
+
+class KeyPoolExhaustedException(HTTPException):
+    """`KeyPool`의 모든 `access_key`가 하루 사용량을 소진했을 때 발생합니다."""
 
 
 class SentencesException(Exception):
@@ -1,63 +1,563 @@
+import asyncio
+import functools
 import json
 import os
-from typing import Any, Dict, Union
+import pickle
+import time
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ContextManager,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import aiohttp
-from etripy.error import HTTPException
+from aiohttp.client import DEFAULT_TIMEOUT
+from etripy.cache import ResponseCache
+from etripy.codec import (
+    DECODE_THRESHOLD,
+    JSONCodec,
+    decode,
+    decode_pieces,
+    default_codec,
+    project_analysis,
+)
+from etripy.error import (
+    DeadlineExceededException,
+    HTTPConnectionException,
+    HTTPException,
+    HTTPStatusException,
+    HTTPTimeoutException,
+    KeyPoolExhaustedException,
+)
+from etripy.limit import ConcurrencyLimiter, KeyPool, RateLimiter
 from etripy.model import FileType
+from etripy.policy import CircuitBreaker, Deadline, HedgePolicy, RetryPolicy
+
+
+def _read_bytes(file_path: str) -> bytes:
+    with open(file_path, "rb") as file:
+        return file.read()
 
 
 class EtriRequest:
+    """
+    ETRI 오픈 API 비동기 HTTP 클래스입니다.\n
+    클라이언트는 하나의 세션(연결 풀)을 계속 재사용하므로 `async with` 또는 `aclose()`로 닫아주세요.
+
+    #### Parameter
+    `access_key` : ETRI 포털사이트에서 발급받은 키 (여러 키를 나누어 쓰려면 `KeyPool`)\n
+    `limit_per_host` : 호스트당 최대 동시 연결 수 (0이면 제한 없음)\n
+    `keepalive_timeout` : 유휴 연결을 유지할 시간(초)\n
+    `ttl_dns_cache` : DNS 조회 결과를 캐시할 시간(초)\n
+    `max_concurrency` : 같은 `access_key`를 쓰는 모든 클라이언트의 전체 동시 요청 수 제한\n
+    `endpoint_concurrency` : 엔드포인트별 동시 요청 수 제한 (예: `{"/WiseNLU": 8}`)\n
+    `rate_limiter` : 호출 속도 제한기 (`RateLimiter`, 여러 클라이언트가 공유할 수 있음)\n
+    `retry` : 일시적인 오류를 다시 요청하는 정책 (`RetryPolicy`, None이면 다시 요청하지 않음)\n
+    `connect_timeout` : 연결 시간 제한(초)\n
+    `read_timeout` : 응답 데이터를 읽는 시간 제한(초)\n
+    `total_timeout` : 요청 한 번의 전체 시간 제한(초, 기본값 300)\n
+    `hedge` : 느린 응답에 대비해 같은 요청을 한 번 더 보내는 정책 (`HedgePolicy`)\n
+    `breaker` : 엔드포인트별 서킷 브레이커 (`CircuitBreaker`)\n
+    `codec` : 요청/응답 본문 JSON 코덱 (기본값은 `orjson`이 설치되어 있으면 `OrjsonCodec`, 아니면 `JSONCodec`)\n
+    `coalesce` : 엔드포인트와 본문이 같은 요청이 이미 진행 중이면 새로 보내지 않고 그 응답을 함께 받을지 여부\n
+    `cache` : 응답 캐시 (`MemoryCache`, `DiskCache`, 여러 클라이언트가 공유할 수 있음)\n
+    `decode_executor` : 큰 응답을 이벤트 루프 밖에서 역직렬화할 실행기 (`"process"`면 CPU 코어 수만큼의 프로세스 풀을 만들어 사용)\n
+    `decode_threshold` : 이 크기(byte) 이상의 응답만 `decode_executor`에서 역직렬화합니다.
+    """
+
     base_url: str = "http://aiopen.etri.re.kr:8000"
 
-    def __init__(self, access_key: str) -> None:
+    def __init__(
+        self,
+        access_key: Union[str, KeyPool],
+        limit_per_host: int = 100,
+        keepalive_timeout: float = 30.0,
+        ttl_dns_cache: Optional[int] = 300,
+        max_concurrency: Optional[int] = None,
+        endpoint_concurrency: Optional[Dict[str, int]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        total_timeout: Optional[float] = None,
+        hedge: Optional[HedgePolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        codec: Optional[JSONCodec] = None,
+        coalesce: bool = False,
+        cache: Optional[ResponseCache] = None,
+        decode_executor: Union[None, str, Executor] = None,
+        decode_threshold: int = DECODE_THRESHOLD,
+    ) -> None:
+        if isinstance(decode_executor, str) and decode_executor != "process":
+            raise ValueError(f"Unknown decode executor : {decode_executor}")
         self.access_key = access_key
+        self.key_pool = access_key if isinstance(access_key, KeyPool) else None
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.limiter = ConcurrencyLimiter.shared(
+            access_key, max_concurrency, endpoint_concurrency
+        )
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.hedge = hedge
+        self.breaker = breaker
+        self.codec = codec or default_codec()
+        self.coalesce = coalesce
+        self.cache = cache
+        self.decode_executor = decode_executor
+        self.decode_threshold = decode_threshold
+        self._decoder: Optional[Executor] = None
+        self.coalesced = 0
+        """진행 중인 같은 요청의 응답을 함께 받은 호출 수"""
+        # 진행 중인 요청의 Task는 이벤트 루프에 묶이므로 루프마다 따로 보관합니다.
+        self._inflight = weakref.WeakKeyDictionary()
+        # 전달하지 않은 시간 제한은 aiohttp 기본값(전체 300초, 소켓 연결 30초)을 그대로 사용합니다.
+        self.timeout = aiohttp.ClientTimeout(
+            total=DEFAULT_TIMEOUT.total if total_timeout is None else total_timeout,
+            connect=connect_timeout,
+            sock_read=read_timeout,
+            sock_connect=DEFAULT_TIMEOUT.sock_connect,
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """현재 이벤트 루프에서 사용할 세션을 반환합니다. (없으면 생성)"""
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session_loop is not loop
+        ):
+            self._discard_session()
+            connector = aiohttp.TCPConnector(
+                limit=0,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.ttl_dns_cache,
+                use_dns_cache=self.ttl_dns_cache is not None,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=self.timeout
+            )
+            self._session_loop = loop
+        return self._session
+
+    def _discard_session(self) -> None:
+        """
+        현재 세션을 버리고, 연결 풀이 남지 않도록 세션을 만든 이벤트 루프에서 닫습니다.\n
+        세션을 만든 루프가 이미 닫혔으면 정리할 연결이 없으므로 현재 루프에서 닫습니다.
+        """
+        session, loop = self._session, self._session_loop
+        self._session = self._session_loop = None
+        if session is None or session.closed:
+            return
+        if loop is None or loop.is_closed():
+            asyncio.get_running_loop().create_task(session.close())
+        elif loop.is_running():
+            # 다른 스레드에서 실행 중인 루프입니다.
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        else:
+            loop.create_task(session.close())
+
+    @property
+    def decoder(self) -> Optional[Executor]:
+        """큰 응답을 역직렬화할 실행기를 반환합니다. (`"process"`면 처음 사용할 때 생성)"""
+        if self.decode_executor != "process":
+            return self.decode_executor
+        if self._decoder is None:
+            self._decoder = ProcessPoolExecutor()
+        return self._decoder
+
+    async def aclose(self) -> None:
+        """세션과 연결 풀, 직접 만든 프로세스 풀을 닫습니다."""
+        decoder, self._decoder = self._decoder, None
+        if decoder is not None:
+            decoder.shutdown(wait=False, cancel_futures=True)
+        loop = self._session_loop
+        if loop is None or loop.is_closed() or loop is asyncio.get_running_loop():
+            session, self._session = self._session, None
+            self._session_loop = None
+            if session is not None and not session.closed:
+                await session.close()
+        else:
+            self._discard_session()
 
     async def request(
-        self, method: str, endpoint: str, data: Dict[str, Any]
+        self,
+        method: str,
+        endpoint: str,
+        data: Dict[str, Any],
+        deadline: Union[None, float, Deadline] = None,
+        fields: Optional[FrozenSet[str]] = None,
     ) -> Dict[str, Any]:
-        headers = {
-            "Content-Type": "application/json; charset=UTF-8",
-            "Authorization": self.access_key,
-        }
-
+        headers = {"Content-Type": "application/json; charset=UTF-8"}
         url = self.base_url + endpoint
-        async with aiohttp.ClientSession(headers=headers) as session:
-            async with session.request(method, url=url, json=data) as response:
-                rescode = response.status
-                if rescode == 200:
-                    return await response.json()
-                else:
-                    text_data = await response.text()
-                    raise HTTPException(f"Error Code {rescode} : {text_data}")
-
-    async def request_file_upload(self, data: aiohttp.FormData) -> Dict[str, Any]:
-        headers = {
-            "Authorization": self.access_key,
-        }
+        deadline = Deadline.of(deadline)
+
+        cache = self.cache
+        if cache is not None and not cache.cacheable(endpoint):
+            cache = None
+        key = None
+        if cache is not None or self.coalesce:
+            # 일부 필드만 남긴 응답은 전체 응답과 따로 저장하고 공유합니다.
+            key = self.codec.request_key(
+                endpoint, data if fields is None else dict(data, fields=sorted(fields))
+            )
+        if cache is not None:
+            result = await cache.aget(endpoint, key)
+            if result is not None:
+                return result
+
+        async def send(deadline: Optional[Deadline]) -> Dict[str, Any]:
+            # 캐시 항목의 크기로 쓰도록 `_request_once`가 받은 응답 본문의 바이트 수를 담습니다.
+            sizes: List[int] = []
+            result = await self._send(
+                endpoint,
+                method,
+                url,
+                deadline,
+                headers=headers,
+                data=self.codec.dumps(data),
+                fields=fields,
+                sizes=sizes,
+            )
+            if cache is not None and cache.cacheable(endpoint, result):
+                await cache.aput(endpoint, key, result, sizes[-1])
+            return result
+
+        if self.coalesce:
+            return await self._coalesced(key, send, deadline, endpoint)
+        return await send(deadline)
+
+    async def _coalesced(
+        self,
+        key: str,
+        send: Callable[[Optional[Deadline]], Awaitable[Dict[str, Any]]],
+        deadline: Optional[Deadline],
+        endpoint: str,
+    ) -> Dict[str, Any]:
+        """
+        같은 `key`의 요청이 진행 중이면 그 응답을 기다리고, 없으면 새로 보냅니다.\n
+        실제 요청은 제한 시간 없이 보내고, 각 호출의 `deadline`은 응답을 기다리는 시간에만 적용합니다.
+        호출한 쪽이 취소되어도 다른 호출을 위해 계속 진행되며, 기다리는 호출이 모두 떠나면 요청을 취소합니다.
+        """
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.get(loop)
+        if inflight is None:
+            inflight = self._inflight[loop] = {}
+        shared = inflight.get(key)
+        if shared is None:
+
+            def done(task: asyncio.Task) -> None:
+                if inflight.get(key) is shared:
+                    inflight.pop(key)
+                if not task.cancelled():
+                    # 기다리던 호출이 모두 취소되어도 'exception was never retrieved' 경고가 나지 않게 합니다.
+                    task.exception()
+
+            # [Task, 기다리는 호출 수]
+            shared = inflight[key] = [loop.create_task(send(None)), 0]
+            shared[0].add_done_callback(done)
+        else:
+            self.coalesced += 1
+        task = shared[0]
+        shared[1] += 1
+        try:
+            if deadline is None:
+                return await asyncio.shield(task)
+            return await asyncio.wait_for(asyncio.shield(task), deadline.remaining())
+        except asyncio.TimeoutError:
+            raise DeadlineExceededException(f"Deadline exceeded : {endpoint}")
+        finally:
+            shared[1] -= 1
+            if shared[1] == 0 and not task.done():
+                # 응답을 기다리는 호출이 없으면 제한 시간 없이 남지 않도록 취소합니다.
+                if inflight.get(key) is shared:
+                    inflight.pop(key)
+                task.cancel()
 
+    async def request_file_upload(
+        self,
+        data: aiohttp.FormData,
+        deadline: Union[None, float, Deadline] = None,
+    ) -> Dict[str, Any]:
         url = self.base_url + "/VideoParse"
-        async with aiohttp.ClientSession(headers=headers) as session:
-            async with session.request("POST", url=url, data=data) as response:
-                rescode = response.status
-                if rescode == 200:
-                    return await response.json()
-                else:
-                    text_data = await response.text()
-                    raise HTTPException(f"Error Code {rescode} : {text_data}")
-
-    async def get_analysis_data(self, data: Dict[str, Any], spoken: bool):
+        # FormData는 한 번만 직렬화할 수 있으므로, 다시 요청할 때를 위해 미리 payload로 만듭니다.
+        payload = data()
+        return await self._send(
+            "/VideoParse",
+            "POST",
+            url,
+            Deadline.of(deadline),
+            headers={},
+            data=payload,
+        )
+
+    async def _send(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        deadline: Optional[Deadline],
+        headers: Dict[str, str],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        started = time.monotonic()
+        attempt = throttled = 0
+        exhausted = None
+        while True:
+            if deadline is not None:
+                deadline.check(endpoint)
+            error = None
+            with self._lease() as key:
+                kwargs["headers"] = dict(headers, Authorization=key)
+                try:
+                    result = await self._attempt(
+                        key, endpoint, method, url, deadline, **kwargs
+                    )
+                except HTTPException as e:
+                    error = e
+            if error is None:
+                if self.key_pool is not None and self.key_pool.is_quota_error(result):
+                    reason = result.get("reason")
+                    if reason == exhausted:
+                        if self.key_pool.available <= 1:
+                            # 모든 키가 사용량 소진으로 응답했습니다.
+                            self.key_pool.exhaust(key)
+                            raise KeyPoolExhaustedException(
+                                f"All access keys are exhausted : {reason}"
+                            )
+                        # 다른 키도 같은 이유로 실패했으므로 키가 아닌 요청의 문제로 봅니다.
+                        return result
+                    # 하루 사용량이 소진된 키는 빼고 다른 키로 다시 보냅니다.
+                    self.key_pool.exhaust(key)
+                    exhausted = reason
+                    continue
+                if self._throttled(key, endpoint, 200, result, throttled):
+                    throttled += 1
+                    continue
+                return result
+            if self._throttled(key, endpoint, error.status, None, throttled):
+                throttled += 1
+                continue
+            attempt += 1
+            delay = self.retry.delay(error, attempt, started) if self.retry else None
+            if delay is None or (
+                deadline is not None and delay >= deadline.remaining()
+            ):
+                raise error
+            await asyncio.sleep(delay)
+
+    def _lease(self) -> ContextManager[str]:
+        if self.key_pool is None:
+            return nullcontext(self.access_key)
+        return self.key_pool.lease()
+
+    async def _attempt(
+        self,
+        key: str,
+        endpoint: str,
+        method: str,
+        url: str,
+        deadline: Optional[Deadline],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.wait(key, endpoint, deadline)
+        if self.hedge is not None and self.hedge.applies(endpoint):
+            return await self._send_hedged(
+                key, endpoint, method, url, deadline, **kwargs
+            )
+        return await self._send_once(endpoint, method, url, deadline, **kwargs)
+
+    async def _send_once(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        deadline: Optional[Deadline],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        if self.breaker is None:
+            return await self._request_once(endpoint, method, url, deadline, **kwargs)
+        self.breaker.before_call(endpoint)
+        try:
+            result = await self._request_once(endpoint, method, url, deadline, **kwargs)
+        except BaseException as e:
+            self.breaker.record(endpoint, e)
+            raise
+        self.breaker.record(endpoint)
+        return result
+
+    async def _request_once(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        deadline: Optional[Deadline],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        fields = kwargs.pop("fields", None)
+        sizes = kwargs.pop("sizes", None)
+        try:
+            async with self.limiter.acquire(endpoint, deadline):
+                if deadline is not None:
+                    kwargs["timeout"] = self._timeout(deadline)
+                async with self.session.request(method, url=url, **kwargs) as response:
+                    rescode = response.status
+                    if rescode == 200:
+                        body = await response.read()
+                    else:
+                        text_data = await response.text()
+        except asyncio.TimeoutError as e:
+            raise HTTPTimeoutException(f"Timeout : {endpoint}") from e
+        except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError) as e:
+            raise HTTPConnectionException(f"{type(e).__name__} : {e}") from e
+        if rescode == 200:
+            if sizes is not None:
+                sizes.append(len(body))
+            # 역직렬화는 연결과 동시 요청 수 제한을 돌려준 뒤에 합니다.
+            return await self._decode(body, fields)
+        raise HTTPStatusException.from_status(rescode, text_data)
+
+    async def _decode(
+        self, body: bytes, fields: Optional[FrozenSet[str]] = None
+    ) -> Any:
+        decoder = self.decoder
+        if decoder is None or len(body) < self.decode_threshold:
+            return project_analysis(self.codec.loads(body), fields)
+        loop = asyncio.get_running_loop()
+        if not isinstance(decoder, ProcessPoolExecutor):
+            return await loop.run_in_executor(decoder, decode, self.codec, body, fields)
+        # 큰 응답을 한 번에 되살리면 그동안 이벤트 루프가 멈추므로 문장 조각마다 양보합니다.
+        head, pieces = await loop.run_in_executor(
+            decoder, functools.partial(decode_pieces, self.codec, body, fields=fields)
+        )
+        result = pickle.loads(head)
+        for piece in pieces:
+            await asyncio.sleep(0)
+            result["return_object"]["sentence"].extend(pickle.loads(piece))
+        return result
+
+    async def _send_hedged(
+        self,
+        key: str,
+        endpoint: str,
+        method: str,
+        url: str,
+        deadline: Optional[Deadline],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        hedge = self.hedge
+        hedge.requests += 1
+
+        async def attempt(throttle: bool) -> Tuple[float, Dict[str, Any]]:
+            if throttle and self.rate_limiter is not None:
+                await self.rate_limiter.wait(key, endpoint, deadline)
+            started = time.monotonic()
+            result = await self._send_once(endpoint, method, url, deadline, **kwargs)
+            return time.monotonic() - started, result
+
+        started = time.monotonic()
+        primary = asyncio.ensure_future(attempt(False))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedge.delay(endpoint))
+            if not done and hedge.allow():
+                hedge.hedged += 1
+                tasks.add(asyncio.ensure_future(attempt(True)))
+            error = None
+            while tasks:
+                done, tasks = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        error = error or task.exception()
+                        continue
+                    latency, result = task.result()
+                    hedge.record(endpoint, latency)
+                    if task is not primary:
+                        hedge.hedge_wins += 1
+                        if not primary.done():
+                            # 느린 첫 요청을 표본에서 빼면 분위수가 낮아져 추가 요청이 늘어나므로,
+                            # 취소하기 전까지 걸린 시간을 첫 요청의 응답 시간으로 기록합니다.
+                            hedge.record(endpoint, time.monotonic() - started)
+                    return result
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _timeout(self, deadline: Deadline) -> aiohttp.ClientTimeout:
+        """마감 시각까지 남은 시간을 넘지 않는 요청 시간 제한을 만듭니다."""
+        remaining = deadline.remaining()
+        total = self.timeout.total
+        return aiohttp.ClientTimeout(
+            total=remaining if total is None else min(total, remaining),
+            connect=self.timeout.connect,
+            sock_read=self.timeout.sock_read,
+            sock_connect=self.timeout.sock_connect,
+        )
+
+    def _throttled(
+        self, key: str, endpoint: str, status: Optional[int], result: Any, count: int
+    ) -> bool:
+        return (
+            self.rate_limiter is not None
+            and count < self.rate_limiter.quota_retries
+            and self.rate_limiter.throttled(key, endpoint, status, result)
+        )
+
+    async def get_analysis_data(
+        self,
+        data: Dict[str, Any],
+        spoken: bool,
+        deadline: Union[None, float, Deadline] = None,
+        fields: Optional[FrozenSet[str]] = None,
+    ):
         if spoken:
             return await self.request(
-                method="POST", endpoint="/WiseNLU_spoken", data=data
+                method="POST",
+                endpoint="/WiseNLU_spoken",
+                data=data,
+                deadline=deadline,
+                fields=fields,
             )
         else:
-            return await self.request(method="POST", endpoint="/WiseNLU", data=data)
+            return await self.request(
+                method="POST",
+                endpoint="/WiseNLU",
+                data=data,
+                deadline=deadline,
+                fields=fields,
+            )
 
-    async def file_upload(self, upload_file_path: str):
-        file = open(upload_file_path, "rb")
-        file_content = file.read()
-        file.close()
+    async def file_upload(
+        self, upload_file_path: str, deadline: Union[None, float, Deadline] = None
+    ):
+        # 큰 파일을 읽는 동안 이벤트 루프가 멈추지 않도록 실행기에서 읽습니다.
+        loop = asyncio.get_running_loop()
+        file_content = await loop.run_in_executor(None, _read_bytes, upload_file_path)
 
         requestJson = {"argument": {}}
 
@@ -68,7 +568,7 @@ class EtriRequest:
         form_data.add_field(
             "uploadfile",
             file_content,
-            filename=os.path.basename(file.name),
+            filename=os.path.basename(upload_file_path),
             content_type="application/octet-stream",
         )
-        return await self.request_file_upload(data=form_data)
+        return await self.request_file_upload(data=form_data, deadline=deadline)
@@ -0,0 +1,282 @@
+import asyncio
+import functools
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import zlib
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from etripy.codec import JSONCodec, default_codec
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+_MAGIC = b"ETRILEX1"
+_HEADER = struct.Struct("<8sI")
+_ENTRY = struct.Struct("<QQI")
+_KEY_LEN = struct.Struct("<H")
+_RECORD = struct.Struct("<HI")
+
+LEXICON_KINDS = ("word", "homonym", "polysemy")
+"""저장할 수 있는 사전 정보 종류 (`wordinfo`, `homonym`, `polysemy`)"""
+
+
+def _hash(key: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+class LexiconStore:
+    """
+    어휘 정보(`wordinfo`), 동음이의어(`homonym`), 다의어(`polysemy`) 응답을 저장하는 로컬 사전 클래스입니다.\n
+    응답은 압축해 하나의 파일에 저장하고 `(종류, 어휘, 동음이의어 코드)`의 해시를 정렬한 색인으로 찾으며,
+    파일은 읽기 전용 메모리 맵(mmap)으로 열기 때문에 크기와 관계없이 바로 열리고 여러 프로세스가 같은 페이지를 공유합니다.
+    새로 받은 응답은 추가 전용 로그 파일(`path + ".log"`)에 덧붙여 두었다가 `save`(또는 `close`)에서 사전 파일에 합쳐 교체합니다.
+    로그에 남은 응답은 다음에 열 때 다시 읽어 들입니다.
+    `AnalysisClient`에 `lexicon`으로 전달하면 API를 호출하기 전에 먼저 찾아보며, 비동기 클라이언트에서는 파일 입출력을 실행기(executor)에서 처리합니다.
+
+    #### Parameter
+    `path` : 사전 파일 경로 (없으면 처음 저장할 때 만듭니다.)\n
+    `autosave` : 로그에 쌓인 응답이 이 수와 사전 파일의 항목 수보다 많아지면 자동으로 합칩니다. (0이면 자동으로 합치지 않음)\n
+    `codec` : 응답을 저장할 때 사용할 JSON 코덱
+    """
+
+    def __init__(
+        self, path: str, autosave: int = 1000, codec: Optional[JSONCodec] = None
+    ) -> None:
+        self.path = os.path.abspath(path)
+        self.autosave = autosave
+        self.codec = codec or default_codec()
+        self.log_path = self.path + ".log"
+        # 로그에 쓴 응답 (키 -> 압축된 응답)
+        self._pending: Dict[bytes, bytes] = {}
+        self._lock = threading.RLock()
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._count = 0
+        self._log = None
+        self._lock_file = None
+        self._open()
+        self._pending.update(self._read_log())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count + sum(
+                1 for key in self._pending if self._find(key) is None
+            )
+
+    def __contains__(self, key: Tuple[str, str, Optional[str]]) -> bool:
+        return self.get(*key) is not None
+
+    @staticmethod
+    def _key(kind: str, word: str, homonym_code: Optional[str] = None) -> bytes:
+        if kind not in LEXICON_KINDS:
+            raise ValueError(f"Unknown lexicon kind : {kind}")
+        return f"{kind}\x1f{word}\x1f{homonym_code or ''}".encode("utf-8")
+
+    def _open(self) -> None:
+        self._close_map()
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return
+        self._file = open(self.path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC:
+            self._close_map()
+            raise ValueError(f"Not a lexicon file : {self.path}")
+
+    def _close_map(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+        self._map = self._file = None
+        self._count = 0
+
+    def reload(self) -> None:
+        """다른 프로세스가 저장한 내용을 반영하도록 파일과 로그를 다시 읽습니다."""
+        with self._lock:
+            self._open()
+            self._pending.update(self._read_log())
+
+    @contextmanager
+    def _flock(self, exclusive: bool) -> Iterator[None]:
+        # 로그에 덧붙일 때는 공유 잠금을, 사전 파일에 합칠 때는 배타적 잠금을 잡습니다.
+        if self._lock_file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._lock_file = open(self.path + ".lock", "a")
+        if fcntl is None:
+            yield
+            return
+        fcntl.flock(self._lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    def _log_size(self) -> int:
+        try:
+            return os.path.getsize(self.log_path)
+        except FileNotFoundError:
+            return 0
+
+    def _read_log(self) -> Dict[bytes, bytes]:
+        try:
+            with open(self.log_path, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return {}
+        records = {}
+        offset = 0
+        # 기록하다 중단된 마지막 항목은 무시합니다.
+        while offset + _RECORD.size <= len(data):
+            key_len, value_len = _RECORD.unpack_from(data, offset)
+            start = offset + _RECORD.size
+            end = start + key_len + value_len
+            if end > len(data):
+                break
+            records[data[start : start + key_len]] = data[start + key_len : end]
+            offset = end
+        return records
+
+    def _entry(self, index: int) -> Tuple[int, int, int]:
+        return _ENTRY.unpack_from(self._map, _HEADER.size + index * _ENTRY.size)
+
+    def _find(self, key: bytes) -> Optional[bytes]:
+        if self._map is None:
+            return None
+        target = _hash(key)
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._entry(middle)[0] < target:
+                low = middle + 1
+            else:
+                high = middle
+        # 해시가 같은 항목은 저장된 키로 다시 확인합니다.
+        while low < self._count:
+            digest, offset, length = self._entry(low)
+            if digest != target:
+                break
+            (key_len,) = _KEY_LEN.unpack_from(self._map, offset)
+            start = offset + _KEY_LEN.size
+            if self._map[start : start + key_len] == key:
+                return self._map[start + key_len : offset + length]
+            low += 1
+        return None
+
+    def get(
+        self, kind: str, word: str, homonym_code: Optional[str] = None
+    ) -> Optional[Any]:
+        """저장된 응답을 반환합니다. (없으면 None)"""
+        key = self._key(kind, word, homonym_code)
+        with self._lock:
+            data = self._pending.get(key)
+            if data is None:
+                data = self._find(key)
+        if data is None:
+            return None
+        return self.codec.loads(zlib.decompress(data))
+
+    async def aget(
+        self, kind: str, word: str, homonym_code: Optional[str] = None
+    ) -> Optional[Any]:
+        """`get`의 비동기 버전입니다. (`AnalysisClient`에서 사용)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get, kind, word, homonym_code)
+
+    def put(
+        self, kind: str, word: str, result: Any, homonym_code: Optional[str] = None
+    ) -> None:
+        """API 응답을 저장합니다. 오류 응답은 저장하지 않습니다."""
+        if not isinstance(result, dict) or str(result.get("result", "0")) != "0":
+            return
+        key = self._key(kind, word, homonym_code)
+        data = zlib.compress(self.codec.dumps(result))
+        record = _RECORD.pack(len(key), len(data)) + key + data
+        with self._lock:
+            with self._flock(exclusive=False):
+                if self._log is None:
+                    self._log = open(self.log_path, "ab")
+                self._log.write(record)
+                self._log.flush()
+            self._pending[key] = data
+            # 사전 파일보다 로그가 커질 때만 합치므로, 파일을 다시 쓰는 비용은 전체 항목 수에 비례합니다.
+            if self.autosave and len(self._pending) >= max(self.autosave, self._count):
+                self.save()
+
+    async def aput(
+        self, kind: str, word: str, result: Any, homonym_code: Optional[str] = None
+    ) -> None:
+        """`put`의 비동기 버전입니다. (`AnalysisClient`에서 사용)"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, functools.partial(self.put, kind, word, result, homonym_code)
+        )
+
+    def _records(self) -> Iterator[Tuple[bytes, bytes]]:
+        for index in range(self._count):
+            _, offset, length = self._entry(index)
+            (key_len,) = _KEY_LEN.unpack_from(self._map, offset)
+            start = offset + _KEY_LEN.size
+            yield self._map[start : start + key_len], self._map[
+                start + key_len : offset + length
+            ]
+
+    def save(self) -> None:
+        """로그에 쌓인 응답을 사전 파일에 합치고 로그를 비웁니다. (임시 파일에 쓴 뒤 교체합니다)"""
+        with self._lock:
+            if not self._pending and not self._log_size():
+                return
+            with self._flock(exclusive=True):
+                # 다른 프로세스가 그 사이에 저장하거나 로그에 쓴 내용까지 합칩니다.
+                self._open()
+                records = dict(self._records())
+                records.update(self._read_log())
+                records.update(self._pending)
+                self._write(records)
+                if self._log_size():
+                    # 다른 프로세스가 열어 둔 로그도 계속 쓸 수 있도록 파일을 바꾸지 않고 비웁니다.
+                    os.truncate(self.log_path, 0)
+                self._pending.clear()
+                self._open()
+
+    def _write(self, records: Dict[bytes, bytes]) -> None:
+        entries = sorted((_hash(key), key) for key in records)
+        offset = _HEADER.size + len(entries) * _ENTRY.size
+        index, chunks = [], []
+        for digest, key in entries:
+            chunk = _KEY_LEN.pack(len(key)) + key + records[key]
+            index.append(_ENTRY.pack(digest, offset, len(chunk)))
+            chunks.append(chunk)
+            offset += len(chunk)
+        temp = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp, "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, len(entries)))
+            file.writelines(index)
+            file.writelines(chunks)
+            file.flush()
+            os.fsync(file.fileno())
+        self._close_map()
+        os.replace(temp, self.path)
+
+    def close(self) -> None:
+        """로그에 쌓인 응답을 사전 파일에 합치고 파일을 닫습니다."""
+        with self._lock:
+            self.save()
+            self._close_map()
+            for file in (self._log, self._lock_file):
+                if file is not None:
+                    file.close()
+            self._log = self._lock_file = None
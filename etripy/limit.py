@@ -0,0 +1,535 @@
+import asyncio
+import re
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
+
+from etripy.error import DeadlineExceededException, KeyPoolExhaustedException
+from etripy.policy import Deadline
+
+
+class _Slots:
+    """
+    크기를 바꿀 수 있는 `asyncio.Semaphore`입니다.\n
+    `resize`로 크기를 바꿔도 이미 자리를 차지한 요청은 그대로 세어지므로, 줄이면 자리가 반납될 때까지 새 요청이 기다립니다.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.in_use = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    async def acquire(self) -> None:
+        if self.in_use < self.limit and not self._waiters:
+            self.in_use += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        except BaseException:
+            if future.done() and not future.cancelled():
+                # 자리를 받은 직후에 취소되면 다음 요청에 넘겨줍니다.
+                self.release()
+            else:
+                try:
+                    self._waiters.remove(future)
+                except ValueError:
+                    pass
+            raise
+
+    def release(self) -> None:
+        self.in_use -= 1
+        self._wake()
+
+    def resize(self, limit: int) -> None:
+        self.limit = limit
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_use < self.limit:
+            future = self._waiters.popleft()
+            if not future.done():
+                self.in_use += 1
+                future.set_result(None)
+
+
+class ConcurrencyLimiter:
+    """
+    동시에 진행 중인(in-flight) 요청 수를 제한하는 클래스입니다.\n
+    같은 `access_key`를 사용하는 클라이언트는 `ConcurrencyLimiter.shared`로 하나의 제한기를 공유합니다.
+
+    #### Parameter
+    `max_concurrency` : 전체 동시 요청 수 제한 (None이면 제한 없음)\n
+    `endpoint_limits` : 엔드포인트별 동시 요청 수 제한 (예: `{"/WiseNLU": 8, "/ObjectDetect": 2}`)
+    """
+
+    _shared: Dict[Hashable, "ConcurrencyLimiter"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        endpoint_limits: Optional[Dict[str, int]] = None,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.endpoint_limits = dict(endpoint_limits or {})
+        # asyncio.Semaphore는 이벤트 루프에 묶이므로 루프마다 따로 만듭니다.
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def shared(
+        cls,
+        key: Hashable,
+        max_concurrency: Optional[int] = None,
+        endpoint_limits: Optional[Dict[str, int]] = None,
+    ) -> "ConcurrencyLimiter":
+        """
+        `key`(보통 `access_key`)에 묶인 제한기를 반환합니다.\n
+        다른 제한 값을 함께 넘기면 공유 중인 제한기의 설정을 그 자리에서 바꿉니다. (`configure` 참조)
+        """
+        with cls._shared_lock:
+            limiter = cls._shared.get(key)
+            if limiter is None:
+                limiter = cls._shared[key] = cls(max_concurrency, endpoint_limits)
+            elif max_concurrency or endpoint_limits:
+                limiter.configure(max_concurrency, endpoint_limits)
+            return limiter
+
+    def configure(
+        self,
+        max_concurrency: Optional[int] = None,
+        endpoint_limits: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """
+        제한 값을 바꿉니다. 값이 같으면 아무것도 하지 않습니다.\n
+        이미 만든 자리의 크기를 그 자리에서 바꾸므로, 진행 중인 요청도 새 제한에 계속 포함됩니다.
+        """
+        changed = (
+            max_concurrency is not None and max_concurrency != self.max_concurrency
+        )
+        changed = changed or any(
+            self.endpoint_limits.get(endpoint) != limit
+            for endpoint, limit in (endpoint_limits or {}).items()
+        )
+        if not changed:
+            return
+        if max_concurrency is not None:
+            self.max_concurrency = max_concurrency
+        if endpoint_limits:
+            self.endpoint_limits.update(endpoint_limits)
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        for loop, semaphores in list(self._semaphores.items()):
+            for endpoint, semaphore in semaphores.items():
+                limit = (
+                    self.max_concurrency
+                    if endpoint is None
+                    else self.endpoint_limits.get(endpoint)
+                )
+                if not limit:
+                    continue
+                if loop is running:
+                    semaphore.resize(limit)
+                elif not loop.is_closed():
+                    # 다른 루프의 대기자는 그 루프에서 깨워야 합니다.
+                    loop.call_soon_threadsafe(semaphore.resize, limit)
+
+    def _semaphore(self, endpoint: Optional[str], limit: int) -> _Slots:
+        loop = asyncio.get_running_loop()
+        semaphores = self._semaphores.get(loop)
+        if semaphores is None:
+            semaphores = self._semaphores[loop] = {}
+        semaphore = semaphores.get(endpoint)
+        if semaphore is None:
+            semaphore = semaphores[endpoint] = _Slots(limit)
+        return semaphore
+
+    @staticmethod
+    async def _wait(
+        semaphore: _Slots, endpoint: str, deadline: Optional[Deadline]
+    ) -> None:
+        if deadline is None:
+            await semaphore.acquire()
+            return
+        deadline.check(endpoint)
+        try:
+            await asyncio.wait_for(semaphore.acquire(), deadline.remaining())
+        except asyncio.TimeoutError:
+            raise DeadlineExceededException(f"Deadline exceeded : {endpoint}")
+
+    @asynccontextmanager
+    async def acquire(self, endpoint: str, deadline: Optional[Deadline] = None):
+        """
+        `endpoint`로 요청을 보낼 수 있을 때까지 대기한 뒤 자리를 차지합니다.\n
+        `deadline`까지 자리가 나지 않으면 `DeadlineExceededException`이 발생합니다.
+        """
+        acquired = []
+        try:
+            # 엔드포인트 자리를 먼저 잡아야 다른 엔드포인트의 전체 자리를 막지 않습니다.
+            limit = self.endpoint_limits.get(endpoint)
+            if limit:
+                semaphore = self._semaphore(endpoint, limit)
+                await self._wait(semaphore, endpoint, deadline)
+                acquired.append(semaphore)
+            if self.max_concurrency:
+                semaphore = self._semaphore(None, self.max_concurrency)
+                await self._wait(semaphore, endpoint, deadline)
+                acquired.append(semaphore)
+            yield
+        finally:
+            for semaphore in reversed(acquired):
+                semaphore.release()
+
+
+ENDPOINT_FAMILIES: Dict[str, str] = {
+    "/WiseNLU": "language",
+    "/ParaphraseQA": "language",
+    "/WiseWWN": "language",
+    "/NELinking": "language",
+    "/Coreference": "language",
+    "/WiseQAnal": "qa",
+    "/MRCServlet": "qa",
+    "/WikiQA": "qa",
+    "/LegalQA": "qa",
+    "/DocQA": "qa",
+    "/ObjectDetect": "visual",
+    "/HumanParsing": "visual",
+    "/FaceDeID": "visual",
+    "/HumanStatus": "visual",
+    "/VideoParse": "visual",
+    "/WiseASR": "voice",
+}
+"""엔드포인트 접두사별 API 분류 (language, qa, visual, voice)"""
+
+QUOTA_PATTERN = re.compile(
+    r"(daily|usage|call|request|rate|api)[\s_-]*(limit|quota|count)[\s_-]*"
+    r"(is\s+|has\s+been\s+)?(exceed|reach|over)"
+    r"|quota[\s_-]*(is\s+|has\s+been\s+)?(exceed|reach|over)"
+    r"|exceed(s|ed)?\s+(the\s+)?(daily|usage|call|request|rate)[\s_-]*(limit|quota)"
+    r"|too\s+many\s+requests"
+    r"|(일일|하루|일간|사용|호출)\s*(사용량|호출\s*(수|량|한도)|사용\s*한도|한도|허용량)[^.]{0,10}(초과|소진)",
+    re.IGNORECASE,
+)
+"""
+사용량(하루 호출 한도) 초과 응답의 `reason`을 판별하는 정규식입니다.\n
+"text length exceeded"처럼 입력 때문에 생긴 오류는 사용량 초과로 보지 않도록 한도/사용량을 가리키는 말과 함께 쓰인 경우만 찾습니다.
+"""
+
+
+def endpoint_family(endpoint: str) -> str:
+    """엔드포인트가 속한 API 분류를 반환합니다. (알 수 없으면 엔드포인트 자체)"""
+    for prefix, family in ENDPOINT_FAMILIES.items():
+        if endpoint.startswith(prefix):
+            return family
+    return endpoint
+
+
+class TokenBucket:
+    """
+    토큰 버킷 클래스입니다. 초당 `rate`개의 토큰이 채워지며 최대 `burst`개까지 모입니다.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None) -> None:
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고, 사용 가능해질 때까지 기다려야 하는 시간(초)을 반환합니다."""
+        with self._lock:
+            now = time.monotonic()
+            if self.rate > 0:
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+            self._updated = now
+            wait = self._paused_until - now
+            if self.rate > 0:
+                self._tokens -= 1
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens / self.rate)
+            return max(0.0, wait)
+
+    def refund(self) -> None:
+        """`reserve`로 예약했지만 사용하지 않은 토큰 하나를 돌려줍니다."""
+        with self._lock:
+            if self.rate > 0:
+                self._tokens = min(self.capacity, self._tokens + 1)
+
+    def pause(self, seconds: float) -> None:
+        """`seconds`초 동안 토큰을 내주지 않습니다."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = min(self._tokens, 0.0)
+
+
+class RateLimiter:
+    """
+    `access_key`와 API 분류별 토큰 버킷으로 호출 속도를 제한하는 클래스입니다.\n
+    `EtriRequest`와 `SyncEtriRequest`에서 함께 사용할 수 있으며, 사용량 초과 응답을 받으면 자동으로 잠시 멈춘 뒤 다시 요청합니다.
+
+    #### Parameter
+    `rates` : API 분류(또는 엔드포인트)별 `(초당 호출 수, 버스트)` (예: `{"language": (5, 5), "visual": (1, 1)}`)\n
+    `default_rate` : `rates`에 없는 분류에 적용할 `(초당 호출 수, 버스트)` (None이면 제한 없음)\n
+    `quota_pause` : 사용량 초과 응답을 받았을 때 멈출 시간(초)\n
+    `quota_retries` : 사용량 초과 응답 후 다시 요청할 최대 횟수\n
+    `quota_pattern` : 사용량 초과 응답의 `reason`을 판별하는 정규식
+    """
+
+    def __init__(
+        self,
+        rates: Optional[Dict[str, Tuple[float, int]]] = None,
+        default_rate: Optional[Tuple[float, int]] = None,
+        quota_pause: float = 60.0,
+        quota_retries: int = 3,
+        quota_pattern: Union[str, Pattern] = QUOTA_PATTERN,
+    ) -> None:
+        self.rates = dict(rates or {})
+        self.default_rate = default_rate
+        self.quota_pause = quota_pause
+        self.quota_retries = quota_retries
+        if isinstance(quota_pattern, str):
+            quota_pattern = re.compile(quota_pattern, re.IGNORECASE)
+        self.quota_pattern = quota_pattern
+        self._buckets: Dict[Tuple[Hashable, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, key: Hashable, endpoint: str) -> TokenBucket:
+        """
+        `key`와 `endpoint`에 해당하는 토큰 버킷을 반환합니다.\n
+        `rates`에 엔드포인트가 있으면 엔드포인트별 버킷을, 없으면 분류별 버킷을 사용합니다.
+        """
+        scope = endpoint if endpoint in self.rates else endpoint_family(endpoint)
+        with self._lock:
+            bucket = self._buckets.get((key, scope))
+            if bucket is None:
+                rate = self.rates.get(scope, self.default_rate)
+                bucket = TokenBucket(*rate) if rate else TokenBucket(0)
+                self._buckets[(key, scope)] = bucket
+            return bucket
+
+    def _delay(
+        self, key: Hashable, endpoint: str, deadline: Optional[Deadline]
+    ) -> float:
+        bucket = self.bucket(key, endpoint)
+        delay = bucket.reserve()
+        if deadline is not None and delay > deadline.remaining():
+            # 요청을 보내지 않으므로 예약한 토큰은 다음 요청을 위해 돌려줍니다.
+            bucket.refund()
+            raise DeadlineExceededException(f"Deadline exceeded : {endpoint}")
+        return delay
+
+    async def wait(
+        self, key: Hashable, endpoint: str, deadline: Optional[Deadline] = None
+    ) -> None:
+        """요청을 보낼 수 있을 때까지 비동기로 대기합니다."""
+        delay = self._delay(key, endpoint, deadline)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def wait_sync(
+        self, key: Hashable, endpoint: str, deadline: Optional[Deadline] = None
+    ) -> None:
+        """요청을 보낼 수 있을 때까지 현재 스레드를 멈춥니다."""
+        delay = self._delay(key, endpoint, deadline)
+        if delay > 0:
+            time.sleep(delay)
+
+    def is_quota_error(self, result: Any) -> bool:
+        """응답 본문이 사용량 초과 오류인지 확인합니다."""
+        if not isinstance(result, dict) or str(result.get("result", "0")) == "0":
+            return False
+        return bool(self.quota_pattern.search(str(result.get("reason", ""))))
+
+    def throttled(
+        self, key: Hashable, endpoint: str, status: int, result: Any = None
+    ) -> bool:
+        """
+        응답이 사용량 초과(HTTP 429 또는 사용량 초과 `reason`)이면 호출을 멈추고 True를 반환합니다.
+        """
+        if status == 429 or (status == 200 and self.is_quota_error(result)):
+            self.pause(key, endpoint)
+            return True
+        return False
+
+    def pause(
+        self, key: Hashable, endpoint: str, seconds: Optional[float] = None
+    ) -> None:
+        """사용량 초과 시 `key`의 해당 분류 호출을 잠시 멈춥니다."""
+        self.bucket(key, endpoint).pause(
+            self.quota_pause if seconds is None else seconds
+        )
+
+
+KST = timezone(timedelta(hours=9))
+"""ETRI 오픈 API의 하루 사용량이 초기화되는 기준 시간대"""
+
+
+class _KeyState:
+    __slots__ = ("key", "quota", "used", "in_flight", "exhausted")
+
+    def __init__(self, key: str, quota: Optional[int]) -> None:
+        self.key = key
+        self.quota = quota
+        self.used = 0
+        self.in_flight = 0
+        self.exhausted = False
+
+    @property
+    def remaining(self) -> Optional[int]:
+        return None if self.quota is None else max(0, self.quota - self.used)
+
+
+class KeyPool:
+    """
+    여러 `access_key`에 요청을 나누어 보내는 키 풀 클래스입니다.\n
+    모든 클라이언트에 `access_key` 문자열 대신 전달할 수 있으며, 남은 사용량이 많고 진행 중인 요청이 적은 키를 먼저 사용합니다.
+    하루 사용량이 소진된 키는 다음 날(`tz` 기준 자정)까지 사용하지 않고, 해당 요청은 다른 키로 다시 보냅니다.
+    다른 키도 같은 이유로 실패하면 더 이상 키를 소진 처리하지 않고 오류 응답을 그대로 반환합니다.
+    모든 키가 소진되거나, 남은 마지막 키까지 같은 이유로 실패하면 `KeyPoolExhaustedException`이 발생합니다.
+
+    #### Parameter
+    `keys` : ETRI 포털사이트에서 발급받은 키 목록\n
+    `daily_quota` : 키별 하루 호출 한도 (정수 또는 `{키: 한도}`, None이면 진행 중인 요청 수만 고려)\n
+    `quota_pattern` : 사용량 소진 응답의 `reason`을 판별하는 정규식\n
+    `tz` : 하루 사용량이 초기화되는 기준 시간대 (기본값 KST)
+    """
+
+    def __init__(
+        self,
+        keys: Iterable[str],
+        daily_quota: Union[None, int, Dict[str, int]] = None,
+        quota_pattern: Union[str, Pattern] = QUOTA_PATTERN,
+        tz: tzinfo = KST,
+    ) -> None:
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            raise ValueError("KeyPool requires at least one access key")
+        if not isinstance(daily_quota, dict):
+            daily_quota = dict.fromkeys(keys, daily_quota)
+        if isinstance(quota_pattern, str):
+            quota_pattern = re.compile(quota_pattern, re.IGNORECASE)
+        self.quota_pattern = quota_pattern
+        self.tz = tz
+        self._states = [_KeyState(key, daily_quota.get(key)) for key in keys]
+        self._by_key = {state.key: state for state in self._states}
+        quotas = [state.quota for state in self._states if state.quota]
+        self._max_quota = max(quotas) if quotas else None
+        self._day = self._today()
+        self._turn = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __repr__(self) -> str:
+        return f"<KeyPool keys={len(self)} available={self.available}>"
+
+    def _today(self) -> date:
+        return datetime.now(self.tz).date()
+
+    def _roll(self) -> None:
+        today = self._today()
+        if today != self._day:
+            self._day = today
+            for state in self._states:
+                state.used = 0
+                state.exhausted = False
+
+    def _load(self, state: _KeyState) -> float:
+        # 진행 중인 요청 수를 남은 사용량 비율로 나눈 값이 가장 작은 키를 고릅니다.
+        remaining = state.remaining
+        share = 1.0 if remaining is None else remaining / self._max_quota
+        return (state.in_flight + 1) / share if share > 0 else float("inf")
+
+    @property
+    def available(self) -> int:
+        """현재 사용할 수 있는 키 수"""
+        with self._lock:
+            self._roll()
+            return sum(1 for state in self._states if not state.exhausted)
+
+    def acquire(self) -> str:
+        """
+        요청에 사용할 키를 고르고 진행 중인 요청 수를 늘립니다.\n
+        사용이 끝나면 `release`를 호출하십시오. (`lease` 사용 권장)
+        """
+        with self._lock:
+            self._roll()
+            count = len(self._states)
+            order = self._states[self._turn :] + self._states[: self._turn]
+            candidates = [
+                state for state in order if not state.exhausted and state.remaining != 0
+            ]
+            if not candidates:
+                raise KeyPoolExhaustedException("All access keys are exhausted")
+            state = min(candidates, key=self._load)
+            state.in_flight += 1
+            state.used += 1
+            self._turn = (self._turn + 1) % count
+            return state.key
+
+    def release(self, key: str) -> None:
+        """`acquire`로 받은 키의 진행 중인 요청 수를 줄입니다."""
+        with self._lock:
+            state = self._by_key[key]
+            state.in_flight = max(0, state.in_flight - 1)
+
+    @contextmanager
+    def lease(self) -> Iterator[str]:
+        """요청 하나 동안 사용할 키를 빌려줍니다."""
+        key = self.acquire()
+        try:
+            yield key
+        finally:
+            self.release(key)
+
+    def exhaust(self, key: str) -> None:
+        """`key`를 다음 날까지 사용하지 않습니다."""
+        with self._lock:
+            self._by_key[key].exhausted = True
+
+    def is_quota_error(self, result: Any, status: Optional[int] = 200) -> bool:
+        """HTTP 200 응답 본문이 사용량 소진 오류인지 확인합니다."""
+        if status != 200 or not isinstance(result, dict):
+            return False
+        if str(result.get("result", "0")) == "0":
+            return False
+        return bool(self.quota_pattern.search(str(result.get("reason", ""))))
+
+    def status(self) -> List[Dict[str, Any]]:
+        """키별 사용 현황(`used`, `remaining`, `in_flight`, `exhausted`)을 반환합니다."""
+        with self._lock:
+            self._roll()
+            return [
+                {
+                    "key": state.key,
+                    "used": state.used,
+                    "remaining": state.remaining,
+                    "in_flight": state.in_flight,
+                    "exhausted": state.exhausted,
+                }
+                for state in self._states
+            ]
@@ -21,6 +21,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+from etripy.model.batch import *
 from etripy.model.etc import *
 from etripy.model.language import *
 from etripy.model.voice import *
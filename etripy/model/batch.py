@@ -0,0 +1,21 @@
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    """일괄 처리의 항목별 결과 (실패한 항목은 `error`에 예외가 담깁니다)"""
+
+    index: int = field(repr=True, compare=True)
+    """입력 순서 (0부터 시작)"""
+    input: Any = field(repr=False, compare=True, default=None)
+    """입력값"""
+    result: Optional[Any] = field(repr=False, compare=True, default=None)
+    """결과 (실패한 경우 None)"""
+    error: Optional[BaseException] = field(repr=True, compare=False, default=None)
+    """실패한 경우 발생한 예외"""
+
+    @property
+    def ok(self) -> bool:
+        """성공 여부"""
+        return self.error is None
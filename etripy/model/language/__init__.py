@@ -23,6 +23,7 @@ SOFTWARE.
 
 from etripy.model.language.analysis import AnalysisResult
 from etripy.model.language.base import BaseQAEtri
+from etripy.model.language.compact import *
 from etripy.model.language.etc import *
 from etripy.model.language.etcqa import *
 from etripy.model.language.wiseqa import *
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
 from .base import BaseLanguageEtri
@@ -151,7 +152,7 @@ class Srl:
     )
     """논항 정보"""
 
-    @property
+    @cached_property
     def Argument(self) -> List[SrlArgument]:
         """논항 정보"""
         if self.argument is None:
@@ -190,54 +191,54 @@ class Sentence:
     SA: Optional[List[Any]] = field(repr=True, compare=True, default=None)
     ZA: Optional[List[Any]] = field(repr=True, compare=True, default=None)
 
-    @property
+    @cached_property
     def Morp(self) -> List[Morp]:
         """형태소 분석 결과"""
         if self.morp is None:
             return []
         return [Morp(**morp) for morp in self.morp]
 
-    @property
+    @cached_property
     def MorpEval(self) -> List[MorpEval]:
         if self.morp_eval is None:
             return []
         return [MorpEval(**morp_eval) for morp_eval in self.morp_eval]
 
-    @property
+    @cached_property
     def Wsd(self) -> List[Wsd]:
         """어휘의미 분석 결과"""
         if self.WSD is None:
             return []
         return [Wsd(**wsd) for wsd in self.WSD]
 
-    @property
+    @cached_property
     def Word(self) -> List[Word]:
         """어절 정보 분석 결과"""
         if self.word is None:
             return []
         return [Word(**word) for word in self.word]
 
-    @property
+    @cached_property
     def Ne(self) -> List[Ne]:
         """개체명 정보 인식 결과"""
         if self.NE is None:
             return []
         return [Ne(**ne) for ne in self.NE]
 
-    @property
+    @cached_property
     def Dependency(self) -> List[Dependency]:
         """의존구문 분석 결과"""
         if self.dependency is None:
             return []
         return [Dependency(**dependency) for dependency in self.dependency]
 
-    @property
+    @cached_property
     def PhraseDependency(self) -> List[PhraseDependency]:
         if self.phrase_dependency is None:
             return []
         return [PhraseDependency(**pb) for pb in self.phrase_dependency]
 
-    @property
+    @cached_property
     def Srl(self) -> List[Srl]:
         """의미역 분석 결과"""
         if self.SRL is None:
@@ -259,13 +260,13 @@ class AnalysisResult(BaseLanguageEtri):
     )
     entity: Optional[List[Any]] = field(repr=True, compare=True, default=None)
 
-    @property
+    @cached_property
     def Sentence(self) -> List[Sentence]:
         if self.sentence is None:
             return []
         return [Sentence(**sentence) for sentence in self.sentence]
 
-    @property
+    @cached_property
     def Title(self) -> Title:
         if self.title is None:
             return Title()
@@ -0,0 +1,210 @@
+import sys
+from dataclasses import FrozenInstanceError, fields
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .analysis import (
+    AnalysisResult,
+    Dependency,
+    Morp,
+    Ne,
+    SrlArgument,
+    Word,
+    Wsd,
+)
+
+__all__ = [
+    "CompactMorp",
+    "CompactWord",
+    "CompactNe",
+    "CompactDependency",
+    "CompactWsd",
+    "CompactSrlArgument",
+    "CompactSrl",
+    "CompactSentence",
+    "compact_sentences",
+]
+
+
+def _slotted(cls: type, name: str, interned: Tuple[str, ...] = ()) -> type:
+    """
+    frozen dataclass `cls`와 같은 필드를 `__slots__`로 저장하는 클래스를 만듭니다.\n
+    인스턴스마다 `__dict__`가 없어 메모리를 적게 쓰며, `interned` 필드의 문자열은 `sys.intern`으로 공유합니다.
+    """
+    names = tuple(field.name for field in fields(cls))
+    namespace = {
+        key: value
+        for key, value in cls.__dict__.items()
+        if key not in names and key not in ("__dict__", "__weakref__")
+    }
+    init = cls.__init__
+
+    def __init__(self, *args, **kwargs) -> None:
+        init(self, *args, **kwargs)
+        for field_name in interned:
+            value = getattr(self, field_name)
+            if type(value) is str:
+                object.__setattr__(self, field_name, sys.intern(value))
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field '{key}'")
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, field_name) for field_name in names)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for field_name, value in zip(names, state):
+            if field_name in interned and type(value) is str:
+                value = sys.intern(value)
+            object.__setattr__(self, field_name, value)
+
+    namespace.update(
+        __slots__=names,
+        __init__=__init__,
+        __setattr__=__setattr__,
+        __getstate__=__getstate__,
+        __setstate__=__setstate__,
+        __qualname__=name,
+        __module__=__name__,
+    )
+    return type(cls)(name, cls.__bases__, namespace)
+
+
+CompactMorp = _slotted(Morp, "CompactMorp", ("lemma", "type"))
+"""`__slots__`를 사용하는 `Morp` (형태소와 태그 문자열 공유)"""
+CompactWord = _slotted(Word, "CompactWord", ("type",))
+"""`__slots__`를 사용하는 `Word` (어절 타입 문자열 공유)"""
+CompactNe = _slotted(Ne, "CompactNe", ("type",))
+"""`__slots__`를 사용하는 `Ne` (개체명 타입 문자열 공유)"""
+CompactDependency = _slotted(Dependency, "CompactDependency", ("label",))
+"""`__slots__`를 사용하는 `Dependency` (의존관계 문자열 공유, `mod`는 tuple)"""
+CompactWsd = _slotted(Wsd, "CompactWsd", ("text", "type", "scode"))
+"""`__slots__`를 사용하는 `Wsd` (어휘, 태그, 어깨번호 문자열 공유)"""
+CompactSrlArgument = _slotted(SrlArgument, "CompactSrlArgument", ("type",))
+"""`__slots__`를 사용하는 `SrlArgument` (논항 타입 문자열 공유)"""
+
+
+class CompactSrl:
+    """`__slots__`를 사용하는 의미역 분석 결과 (`argument`는 `CompactSrlArgument` tuple)"""
+
+    __slots__ = ("verb", "sense", "word_id", "weight", "argument")
+
+    def __init__(
+        self,
+        verb: Optional[str] = None,
+        sense: Optional[int] = None,
+        word_id: Optional[int] = None,
+        weight: Optional[float] = None,
+        argument: Iterable[Dict[str, Any]] = (),
+    ) -> None:
+        object.__setattr__(self, "verb", sys.intern(verb) if verb else verb)
+        object.__setattr__(self, "sense", sense)
+        object.__setattr__(self, "word_id", word_id)
+        object.__setattr__(self, "weight", weight)
+        object.__setattr__(
+            self,
+            "argument",
+            tuple(CompactSrlArgument(**item) for item in argument or ()),
+        )
+
+    __setattr__ = CompactMorp.__setattr__
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.__getstate__() == other.__getstate__()
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactSrl(verb={self.verb!r}, sense={self.sense!r}, "
+            f"word_id={self.word_id!r}, weight={self.weight!r}, "
+            f"argument={self.argument!r})"
+        )
+
+    @property
+    def Argument(self) -> Tuple[Any, ...]:
+        """논항 정보"""
+        return self.argument
+
+
+class CompactSentence:
+    """
+    형태소, 어절, 개체명, 의존구문, 어휘의미, 의미역 분석 결과를 `Compact*` 객체의 tuple로 가지는 문장입니다.\n
+    원본 응답(dict)을 들고 있지 않으므로 대량의 분석 결과를 메모리에 오래 보관할 때 사용합니다.
+    """
+
+    __slots__ = ("id", "text", "morp", "word", "NE", "dependency", "WSD", "SRL")
+
+    def __init__(self, sentence: Dict[str, Any]) -> None:
+        def build(key: str, factory: type) -> Tuple[Any, ...]:
+            return tuple(factory(**item) for item in sentence.get(key) or ())
+
+        dependency = []
+        for item in sentence.get("dependency") or ():
+            if isinstance(item.get("mod"), list):
+                item = dict(item, mod=tuple(item["mod"]))
+            dependency.append(CompactDependency(**item))
+        values = {
+            "id": sentence.get("id"),
+            "text": sentence.get("text"),
+            "morp": build("morp", CompactMorp),
+            "word": build("word", CompactWord),
+            "NE": build("NE", CompactNe),
+            "dependency": tuple(dependency),
+            "WSD": build("WSD", CompactWsd),
+            "SRL": build("SRL", CompactSrl),
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    __setattr__ = CompactMorp.__setattr__
+    __getstate__ = CompactSrl.__getstate__
+    __setstate__ = CompactSrl.__setstate__
+    __eq__ = CompactSrl.__eq__
+
+    def __repr__(self) -> str:
+        return f"CompactSentence(id={self.id!r}, text={self.text!r})"
+
+    @property
+    def Morp(self) -> Tuple[Any, ...]:
+        """형태소 분석 결과"""
+        return self.morp
+
+    @property
+    def Word(self) -> Tuple[Any, ...]:
+        """어절 정보 분석 결과"""
+        return self.word
+
+    @property
+    def Ne(self) -> Tuple[Any, ...]:
+        """개체명 정보 인식 결과"""
+        return self.NE
+
+    @property
+    def Dependency(self) -> Tuple[Any, ...]:
+        """의존구문 분석 결과"""
+        return self.dependency
+
+    @property
+    def Wsd(self) -> Tuple[Any, ...]:
+        """어휘의미 분석 결과"""
+        return self.WSD
+
+    @property
+    def Srl(self) -> Tuple[Any, ...]:
+        """의미역 분석 결과"""
+        return self.SRL
+
+
+def compact_sentences(result: AnalysisResult) -> List[CompactSentence]:
+    """
+    언어 분석 결과를 `CompactSentence` 목록으로 바꿉니다.\n
+    변환한 뒤 원래의 `AnalysisResult`를 버리면 원본 응답(dict)이 차지하던 메모리가 해제됩니다.
+    """
+    return [CompactSentence(sentence) for sentence in result.sentence or ()]
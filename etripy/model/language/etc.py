@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
 from .base import BaseLanguageEtri
@@ -58,7 +59,7 @@ class WordInfo:
     Antonym: Optional[List[str]] = field(repr=True, compare=True, default=None)
     """어휘의 반의어 어휘 정보"""
 
-    @property
+    @cached_property
     def WordInfoList(self) -> List[WordInfoList]:
         """어휘의 상세 정보"""
         if self.WordInfo is None:
@@ -70,12 +71,12 @@ class WordInfo:
 class WordResult(BaseLanguageEtri):
     """어휘 정보 결과"""
 
-    @property
+    @cached_property
     def MetaInfo(self) -> MetaInfo:
         """Open APIs의 정보"""
         return MetaInfo(**self.data["return_object"]["MetaInfo"])
 
-    @property
+    @cached_property
     def WordInfo(self) -> List[WordInfo]:
         """어휘의 상세 정보"""
         return [
@@ -108,7 +109,7 @@ class HomonymResult(BaseLanguageEtri):
     )
     """동음이의어 정보"""
 
-    @property
+    @cached_property
     def Homonym(self) -> List[Homonym]:
         """동음이의어 정보"""
         if self.homonym is None:
@@ -140,7 +141,7 @@ class PolysemyResult(BaseLanguageEtri):
     )
     """다의어 정보"""
 
-    @property
+    @cached_property
     def Polysemy(self) -> List[Polysemy]:
         """다의어 정보"""
         if self.polysemy is None:
@@ -168,7 +169,7 @@ class WordRelInfo_:
     )
     """어휘 간 거리 유사도"""
 
-    @property
+    @cached_property
     def SimilarityList(self) -> List[SimilarityList]:
         """어휘 간 거리 유사도"""
         if self.Similarity is None:
@@ -223,21 +224,21 @@ class WordRelInfo:
     WordRelInfo: Optional[Dict[str, Any]] = field(repr=True, compare=True, default=None)
     """어휘 간 유사도 분석 정보"""
 
-    @property
+    @cached_property
     def FirstWordInfo_(self) -> FirstWordInfo_:
         """첫 번째 어휘 정보"""
         if self.FirstWordInfo is None:
             return FirstWordInfo_()
         return FirstWordInfo_(**self.FirstWordInfo)
 
-    @property
+    @cached_property
     def SecondWordInfo_(self) -> SecondWordInfo_:
         """두 번째 어휘 정보"""
         if self.SecondWordInfo is None:
             return SecondWordInfo_()
         return SecondWordInfo_(**self.SecondWordInfo)
 
-    @property
+    @cached_property
     def WordRelInfo_(self) -> WordRelInfo_:
         """어휘 간 유사도 분석 정보"""
         if self.WordRelInfo is None:
@@ -249,12 +250,12 @@ class WordRelInfo:
 class WordRelResult(BaseLanguageEtri):
     """어휘 간 유사도 분석 결과"""
 
-    @property
+    @cached_property
     def MetaInfo(self) -> MetaInfo:
         """Open APIs의 정보"""
         return MetaInfo(**self.data["return_object"]["MetaInfo"])
 
-    @property
+    @cached_property
     def WordRelInfo(self) -> WordRelInfo:
         """어휘 간 유사도 분석 정보"""
         return WordRelInfo(**self.data["return_object"]["WWN WordRelInfo"])
@@ -282,7 +283,7 @@ class NELinkingResult(BaseLanguageEtri):
     t_sentence: Optional[str] = field(repr=True, compare=True, default=None)
     """번역 문장"""
 
-    @property
+    @cached_property
     def Mentions(self) -> List[NELinkingMention]:
         """개체명 연결 정보"""
         if self.mentions is None:
@@ -314,7 +315,7 @@ class CoreferenceResult(BaseLanguageEtri):
     )
     """코어퍼런스 분석 결과"""
 
-    @property
+    @cached_property
     def Entity(self) -> List[CoreferenceEntity]:
         """코어퍼런스 분석 결과"""
         if self.entity is None:
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
 from .base import BaseQAEtri
@@ -71,14 +72,14 @@ class WikiAnswerInfo:
 class WiKiResult(BaseQAEtri):
     """검색 정보 결과"""
 
-    @property
+    @cached_property
     def IRInfo(self) -> Optional[List[IRInfo]]:
         """검색 정보"""
         return [
             IRInfo(**wiki) for wiki in self.data["return_object"]["WikiInfo"]["IRInfo"]
         ]
 
-    @property
+    @cached_property
     def AnswerInfo(self) -> Optional[List[WikiAnswerInfo]]:
         """정답 정보"""
         return [
@@ -108,7 +109,7 @@ class LegalAnswerInfo:
 class LegalResult(BaseQAEtri):
     """법률 QA 결과"""
 
-    @property
+    @cached_property
     def AnswerInfo(self) -> List[LegalAnswerInfo]:
         """응답결과 정보"""
         return [
@@ -116,7 +117,7 @@ class LegalResult(BaseQAEtri):
             for answer in self.data["return_object"]["LegalInfo"]["AnswerInfo"]
         ]
 
-    @property
+    @cached_property
     def RelatedQs(self) -> List[str]:
         """유사질문의 리스트 (비어있을 수 있음)"""
         return [self.data["return_object"]["LegalInfo"]["RelatedQs"]]
@@ -153,7 +154,7 @@ class DocInfo:
 class DocResult(BaseQAEtri):
     """등록된 파일의 분석 결과"""
 
-    @property
+    @cached_property
     def DocInfo(self) -> List[DocInfo]:
         """문서 분석 결과"""
         return [DocInfo(**doc) for doc in self.data["return_object"]["DocInfo"]]
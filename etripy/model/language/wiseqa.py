@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
 from .analysis import AnalysisResult
@@ -90,7 +91,7 @@ class VTitleTopic:
     )
     """개체의 위키백과 정보"""
 
-    @property
+    @cached_property
     def VEntityInfo(self) -> List[VEntityInfo]:
         """개체의 위키백과 정보"""
         if self.vEntityInfo is None:
@@ -132,56 +133,56 @@ class OrgQUnit:
     dIntegrativeConf: Optional[float] = field(repr=True, compare=True, default=None)
     """LAT와 SAT의 통합 신뢰도 정보"""
 
-    @property
+    @cached_property
     def Ndoc(self) -> AnalysisResult:
         """질문의 언어분석 결과 객체"""
         if self.ndoc is None:
             return AnalysisResult(data={})
         return AnalysisResult(data=self.ndoc, **self.ndoc)
 
-    @property
+    @cached_property
     def VQTs(self) -> List[VQT]:
         """의문사기반 질문유형"""
         if self.vQTs is None:
             return []
         return [VQT(**vqt) for vqt in self.vQTs]
 
-    @property
+    @cached_property
     def VQFs(self) -> List[VQF]:
         """질문초점 객체 배열"""
         if self.vQFs is None:
             return []
         return [VQF(**vqf) for vqf in self.vQFs]
 
-    @property
+    @cached_property
     def VLATs(self) -> List[VLAT]:
         """어휘정답유형 객체 배열"""
         if self.vLATs is None:
             return []
         return [VLAT(**vlat) for vlat in self.vLATs]
 
-    @property
+    @cached_property
     def VSATs(self) -> List[VSAT]:
         """어휘정답유형 객체 배열"""
         if self.vSATs is None:
             return []
         return [VSAT(**vsat) for vsat in self.vSATs]
 
-    @property
+    @cached_property
     def VSATRoots(self) -> List[VSATRoot]:
         """대분류 의미정답유형 객체 배열"""
         if self.vSATRoots is None:
             return []
         return [VSATRoot(**vsatr) for vsatr in self.vSATRoots]
 
-    @property
+    @cached_property
     def VTitles(self) -> List[VTitleTopic]:
         """주요한 개체 정보 배열"""
         if self.vTitles is None:
             return []
         return [VTitleTopic(**vtitle) for vtitle in self.vTitles]
 
-    @property
+    @cached_property
     def VQTopic(self) -> List[VTitleTopic]:
         """위키백과 타이틀 중 가장 중요한 타이틀"""
         if self.vQTopic is None:
@@ -198,7 +199,7 @@ class OrgQInfo:
     )  # default_factory를 사용하여 기본값 설정
     """원질문 정보 객체"""
 
-    @property
+    @cached_property
     def OrgQUnit(self) -> OrgQUnit:
         """원질문 정보 객체"""
         if not self.orgQUnit:
@@ -243,14 +244,14 @@ class QClassification:
     )  # default_factory를 사용하여 기본값 설정
     """의미적 질문유형 객체"""
 
-    @property
+    @cached_property
     def AnsQType(self) -> AnsQType:
         """정답형태에 따른 질문유형 객체"""
         if not self.ansQType:
             return AnsQType()
         return AnsQType(**self.ansQType)
 
-    @property
+    @cached_property
     def VSemQType(self) -> VSemQType:
         """의미적 질문유형 객체"""
         if not self.vSemQType:
@@ -262,12 +263,12 @@ class QClassification:
 class WiseQAnalResult(BaseQAEtri):
     """질의응답 결과 객체"""
 
-    @property
+    @cached_property
     def OrgQInfo(self) -> OrgQInfo:
         """질문분석 기본정보"""
         return OrgQInfo(**self.data.get("return_object", {}).get("orgQInfo", {}))
 
-    @property
+    @cached_property
     def QClassification(self) -> QClassification:
         """질문분류 정보 객체"""
         return QClassification(
@@ -0,0 +1,324 @@
+import asyncio
+import glob
+import inspect
+import os
+from abc import ABC, abstractmethod
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
+
+from etripy.codec import JSONCodec, analysis_fields, default_codec
+from etripy.model import BatchItem
+
+_END = object()
+
+
+async def _call(func: Callable[[Any], Any], value: Any) -> Any:
+    result = func(value)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+class _Stage:
+    def __init__(self, func: Callable[[Any], Any], concurrency: int) -> None:
+        self.func = func
+        self.concurrency = max(1, concurrency)
+
+
+class Sink(ABC):
+    """
+    파이프라인의 결과(`BatchItem`)를 받는 출력 기본 클래스입니다.\n
+    `write`가 끝나야 다음 결과를 받으므로, 느린 출력은 앞 단계의 대기열을 채워 입력을 멈추게 합니다.
+    """
+
+    @abstractmethod
+    async def write(self, item: BatchItem) -> None:
+        ...
+
+    async def close(self) -> None:
+        pass
+
+
+class CallbackSink(Sink):
+    """결과마다 `callback(item)`을 호출합니다. (코루틴 함수도 가능)"""
+
+    def __init__(self, callback: Callable[[BatchItem], Any]) -> None:
+        self.callback = callback
+
+    async def write(self, item: BatchItem) -> None:
+        await _call(self.callback, item)
+
+
+class QueueSink(Sink):
+    """
+    결과를 `asyncio.Queue`에 넣습니다.\n
+    크기가 제한된 대기열이면 가득 찼을 때 파이프라인이 기다립니다. 끝나면 `sentinel`을 넣습니다.
+    """
+
+    def __init__(self, queue: asyncio.Queue, sentinel: Any = None) -> None:
+        self.queue = queue
+        self.sentinel = sentinel
+
+    async def write(self, item: BatchItem) -> None:
+        await self.queue.put(item)
+
+    async def close(self) -> None:
+        await self.queue.put(self.sentinel)
+
+
+class JsonlSink(Sink):
+    """
+    결과를 한 줄에 하나씩 JSON Lines 파일에 씁니다.\n
+    각 줄은 `{"index", "input", "result", "error"}`이며, `result`는 결과 객체의 `data`(API 응답)를 씁니다.
+
+    #### Parameter
+    `path` : 출력 파일 경로\n
+    `append` : 기존 파일 뒤에 이어 쓸지 여부\n
+    `errors` : 실패한 항목도 쓸지 여부\n
+    `codec` : JSON 코덱
+    """
+
+    def __init__(
+        self,
+        path: str,
+        append: bool = False,
+        errors: bool = True,
+        codec: Optional[JSONCodec] = None,
+    ) -> None:
+        self.path = path
+        self.errors = errors
+        self.codec = codec or default_codec()
+        self._file = open(path, "ab" if append else "wb")
+
+    @staticmethod
+    def _plain(value: Any) -> Any:
+        if isinstance(value, list):
+            return [JsonlSink._plain(item) for item in value]
+        return getattr(value, "data", value)
+
+    async def write(self, item: BatchItem) -> None:
+        if not item.ok and not self.errors:
+            return
+        record = {
+            "index": item.index,
+            "input": item.input,
+            "result": self._plain(item.result),
+            "error": None if item.ok else f"{type(item.error).__name__}: {item.error}",
+        }
+        # 파일 쓰기는 이벤트 루프를 막지 않도록 실행기에서 합니다. (`run`이 순서대로 기다리므로 줄 순서는 유지됩니다)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, self._file.write, self.codec.dumps(record) + b"\n"
+        )
+
+    async def close(self) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._file.close)
+
+
+class Pipeline:
+    """
+    입력 → 전처리 → ETRI API 호출 → 후처리 → 출력으로 이어지는 비동기 스트리밍 파이프라인 클래스입니다.\n
+    단계마다 `concurrency`개의 작업이 동시에 실행되고 단계 사이는 크기가 `queue_size`인 대기열로 연결되므로,
+    입력이 아무리 커도 메모리에는 대기열과 처리 중인 항목만 올라가며 느린 단계나 출력이 입력 속도를 늦춥니다.
+    각 항목은 `BatchItem`으로 전달되며, 한 단계에서 발생한 오류는 `error`에 담겨 이후 단계를 건너뜁니다.
+
+    #### Parameter
+    `source` : 입력 (`Iterable` 또는 `AsyncIterable`)\n
+    `queue_size` : 단계 사이 대기열의 최대 크기
+
+    #### Example
+    ```
+    pipeline = (
+        Pipeline.from_lines("corpus.txt")
+        .map(str.strip)
+        .analysis(client, AnalysisCode.ner, concurrency=8)
+    )
+    await pipeline.run(JsonlSink("result.jsonl"))
+    ```
+    """
+
+    def __init__(
+        self, source: Union[Iterable[Any], AsyncIterable[Any]], queue_size: int = 64
+    ) -> None:
+        if queue_size <= 0:
+            raise ValueError("queue_size must be positive")
+        self.source = source
+        self.queue_size = queue_size
+        self.stages: List[_Stage] = []
+
+    @classmethod
+    def from_lines(
+        cls, path: str, encoding: str = "utf-8", skip_blank: bool = True, **kwargs
+    ) -> "Pipeline":
+        """텍스트 파일을 한 줄씩 읽는 파이프라인을 만듭니다. (줄바꿈 문자는 제거)"""
+
+        def lines() -> Iterable[str]:
+            with open(path, encoding=encoding) as file:
+                for line in file:
+                    line = line.rstrip("\r\n")
+                    if line or not skip_blank:
+                        yield line
+
+        return cls(lines(), **kwargs)
+
+    @classmethod
+    def from_directory(
+        cls, path: str, pattern: str = "*", recursive: bool = False, **kwargs
+    ) -> "Pipeline":
+        """디렉토리에서 `pattern`과 일치하는 파일 경로를 이름 순으로 읽는 파이프라인을 만듭니다."""
+        if recursive:
+            pattern = os.path.join("**", pattern)
+
+        def paths() -> Iterable[str]:
+            for file_path in sorted(
+                glob.iglob(os.path.join(path, pattern), recursive=recursive)
+            ):
+                if os.path.isfile(file_path):
+                    yield file_path
+
+        return cls(paths(), **kwargs)
+
+    def map(
+        self, func: Callable[[Any], Union[Any, Awaitable[Any]]], concurrency: int = 1
+    ) -> "Pipeline":
+        """
+        각 항목에 `func`를 적용하는 단계를 추가합니다. (코루틴 함수도 가능)\n
+        `func`가 블로킹 작업이라면 `asyncio.to_thread` 등으로 감싸 주십시오.
+        """
+        self.stages.append(_Stage(func, concurrency))
+        return self
+
+    def analysis(
+        self,
+        client,
+        analysis_code,
+        spoken: bool = False,
+        concurrency: int = 8,
+        fields: Union[None, str, Iterable[str]] = None,
+    ) -> "Pipeline":
+        """`AnalysisClient.analysis`로 텍스트를 분석하는 단계를 추가합니다. (`fields`는 남길 문장 필드)"""
+        fields = analysis_fields(fields)
+        return self.map(
+            lambda text: client.analysis(
+                text, analysis_code, spoken=spoken, fields=fields
+            ),
+            concurrency,
+        )
+
+    def object_detect(
+        self, client, file_type: str = "auto", concurrency: int = 4
+    ) -> "Pipeline":
+        """`ImageClient.object_detect`로 이미지 경로의 객체를 검출하는 단계를 추가합니다."""
+        return self.map(
+            lambda file_path: client.object_detect(file_path, file_type=file_type),
+            concurrency,
+        )
+
+    def recognition(self, client, language_code, concurrency: int = 4) -> "Pipeline":
+        """`VoiceClient.recognition`으로 음성 파일 경로를 인식하는 단계를 추가합니다."""
+        return self.map(
+            lambda audio_path: client.recognition(language_code, audio_path),
+            concurrency,
+        )
+
+    async def _feed(self, output: asyncio.Queue) -> None:
+        index = 0
+        if isinstance(self.source, AsyncIterable):
+            async for value in self.source:
+                await output.put(BatchItem(index=index, input=value, result=value))
+                index += 1
+        else:
+            for value in self.source:
+                await output.put(BatchItem(index=index, input=value, result=value))
+                index += 1
+        await output.put(_END)
+
+    async def _work(
+        self,
+        stage: _Stage,
+        input: asyncio.Queue,
+        output: asyncio.Queue,
+        running: List[int],
+    ) -> None:
+        while True:
+            item = await input.get()
+            if item is _END:
+                # 같은 단계의 다른 작업도 끝나도록 되돌려 놓고, 마지막 작업이 다음 단계에 알립니다.
+                await input.put(_END)
+                running[0] -= 1
+                if running[0] == 0:
+                    await output.put(_END)
+                return
+            if item.ok:
+                try:
+                    result = await _call(stage.func, item.result)
+                except Exception as e:
+                    item = BatchItem(index=item.index, input=item.input, error=e)
+                else:
+                    item = BatchItem(index=item.index, input=item.input, result=result)
+            await output.put(item)
+
+    async def __aiter__(self) -> AsyncIterator[BatchItem]:
+        queues = [
+            asyncio.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)
+        ]
+        tasks = [asyncio.ensure_future(self._feed(queues[0]))]
+        for stage, input, output in zip(self.stages, queues, queues[1:]):
+            running = [stage.concurrency]
+            tasks.extend(
+                asyncio.ensure_future(self._work(stage, input, output, running))
+                for _ in range(stage.concurrency)
+            )
+        try:
+            feeder = tasks[0]
+            while True:
+                if feeder.done():
+                    feeder.result()
+                    item = await queues[-1].get()
+                else:
+                    # 입력을 읽다가 오류가 나면 결과를 기다리지 않고 바로 전달합니다.
+                    getter = asyncio.ensure_future(queues[-1].get())
+                    await asyncio.wait(
+                        [getter, feeder], return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if not getter.done():
+                        getter.cancel()
+                        continue
+                    item = getter.result()
+                if item is _END:
+                    break
+                yield item
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def run(
+        self, sink: Union[None, Sink, Callable[[BatchItem], Any]] = None
+    ) -> int:
+        """
+        파이프라인을 끝까지 실행하고 처리한 항목 수를 반환합니다.\n
+        `sink`는 `Sink` 객체 또는 결과마다 호출할 함수이며, 끝나면 `Sink.close`를 호출합니다.
+        """
+        if sink is not None and not isinstance(sink, Sink):
+            sink = CallbackSink(sink)
+        count = 0
+        try:
+            async for item in self:
+                if sink is not None:
+                    await sink.write(item)
+                count += 1
+        finally:
+            if sink is not None:
+                await sink.close()
+        return count
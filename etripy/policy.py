@@ -0,0 +1,278 @@
+import random
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, Optional, Union
+
+from etripy.error import CircuitOpenException, DeadlineExceededException, HTTPException
+
+
+class RetryPolicy:
+    """
+    실패한 요청을 다시 보내는 정책 클래스입니다.\n
+    `retryable`한 오류(연결 오류, 시간 초과, 429, 5xx)만 다시 요청하며,
+    4xx 응답과 ETRI `reason` 오류는 바로 발생시킵니다.
+    대기 시간은 지수 백오프에 full jitter를 적용합니다. (`0 ~ min(max_delay, base_delay * 2^n)`)
+
+    #### Parameter
+    `max_attempts` : 첫 요청을 포함한 최대 시도 횟수\n
+    `base_delay` : 백오프의 기준 대기 시간(초)\n
+    `max_delay` : 한 번에 대기할 최대 시간(초)\n
+    `total_timeout` : 첫 요청부터 잰 전체 재시도 시간 예산(초, None이면 제한 없음)
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        total_timeout: Optional[float] = None,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.total_timeout = total_timeout
+
+    def backoff(self, attempt: int) -> float:
+        """`attempt`번째 시도가 실패한 뒤 대기할 시간(초)을 반환합니다."""
+        return random.uniform(
+            0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        )
+
+    def delay(
+        self, error: BaseException, attempt: int, started: float
+    ) -> Optional[float]:
+        """
+        다시 요청해야 하면 대기할 시간(초)을, 아니면 None을 반환합니다.
+
+        #### Parameter
+        `error` : 발생한 예외\n
+        `attempt` : 지금까지 시도한 횟수\n
+        `started` : 첫 요청을 시작한 `time.monotonic()` 값
+        """
+        if not getattr(error, "retryable", False) or attempt >= self.max_attempts:
+            return None
+        delay = self.backoff(attempt)
+        if (
+            self.total_timeout is not None
+            and time.monotonic() - started + delay > self.total_timeout
+        ):
+            return None
+        return delay
+
+
+class Deadline:
+    """
+    호출 마감 시각을 나타내는 클래스입니다.\n
+    대기열, 속도 제한, 재시도를 거치는 동안 같은 마감 시각이 유지되며, 마감이 지난 요청은 보내지 않습니다.
+
+    #### Parameter
+    `at` : 마감 시각 (`time.monotonic()` 기준)
+    """
+
+    def __init__(self, at: float) -> None:
+        self.at = at
+
+    def __repr__(self) -> str:
+        return f"Deadline(remaining={self.remaining():.3f})"
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        """지금부터 `seconds`초 뒤에 마감되는 객체를 생성합니다."""
+        return cls(time.monotonic() + seconds)
+
+    @classmethod
+    def of(cls, value: Union[None, float, "Deadline"]) -> Optional["Deadline"]:
+        """초 단위 숫자나 `Deadline` 객체를 `Deadline`으로 변환합니다. (None은 그대로)"""
+        if value is None or isinstance(value, Deadline):
+            return value
+        return cls.after(value)
+
+    def remaining(self) -> float:
+        """마감까지 남은 시간(초)을 반환합니다. (지났으면 0)"""
+        return max(0.0, self.at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """마감 시각이 지났는지 여부"""
+        return time.monotonic() >= self.at
+
+    def check(self, endpoint: str) -> None:
+        """마감 시각이 지났으면 `DeadlineExceededException`을 발생시킵니다."""
+        if self.expired:
+            raise DeadlineExceededException(f"Deadline exceeded : {endpoint}")
+
+
+HEDGE_ENDPOINTS = (
+    "/WiseNLU",
+    "/WiseNLU_spoken",
+    "/WiseWWN/Word",
+    "/WiseWWN/Homonym",
+    "/WiseWWN/Polysemy",
+    "/WikiQA",
+)
+"""기본으로 헤징(hedging)을 적용하는 읽기 전용 엔드포인트"""
+
+
+class HedgePolicy:
+    """
+    느린 응답에 대비해 같은 요청을 한 번 더 보내는(hedged request) 정책 클래스입니다.\n
+    첫 요청이 최근 응답 시간의 `percentile` 분위수 안에 끝나지 않으면 같은 요청을 하나 더 보내고,
+    먼저 성공한 응답을 사용하며 나머지 요청은 취소합니다. 추가 요청도 속도 제한기와 동시 요청 제한을 거칩니다.
+
+    #### Parameter
+    `percentile` : 추가 요청을 보낼 기준이 되는 응답 시간 분위수 (0 ~ 1)\n
+    `initial_delay` : 응답 시간 표본이 부족할 때 사용할 대기 시간(초)\n
+    `min_samples` : 분위수를 계산하기 위한 최소 표본 수\n
+    `window` : 엔드포인트별로 보관할 최근 응답 시간 수\n
+    `endpoints` : 헤징을 적용할 엔드포인트 (멱등한 엔드포인트만 지정하십시오.)\n
+    `max_hedge_rate` : 추가 요청을 보내는 최대 비율 (0 ~ 1, 서버가 느려질 때 요청이 두 배로 늘지 않게 합니다.)
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        initial_delay: float = 1.0,
+        min_samples: int = 20,
+        window: int = 200,
+        endpoints: Iterable[str] = HEDGE_ENDPOINTS,
+        max_hedge_rate: float = 0.1,
+    ) -> None:
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.endpoints = frozenset(endpoints)
+        self.max_hedge_rate = max_hedge_rate
+        self.requests = 0
+        """헤징이 적용된 요청 수"""
+        self.hedged = 0
+        """추가 요청을 보낸 횟수"""
+        self.hedge_wins = 0
+        """추가 요청이 먼저 응답한 횟수"""
+        self._latencies: Dict[str, Deque[float]] = {}
+
+    def applies(self, endpoint: str) -> bool:
+        """`endpoint`에 헤징을 적용하는지 여부를 반환합니다."""
+        return endpoint in self.endpoints
+
+    def delay(self, endpoint: str) -> float:
+        """추가 요청을 보내기 전까지 기다릴 시간(초)을 반환합니다."""
+        latencies = self._latencies.get(endpoint)
+        if latencies is None or len(latencies) < self.min_samples:
+            return self.initial_delay
+        ordered = sorted(latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile))
+        return ordered[index]
+
+    def allow(self) -> bool:
+        """추가 요청을 보내도 `max_hedge_rate`를 넘지 않는지 여부를 반환합니다."""
+        return self.hedged < self.requests * self.max_hedge_rate
+
+    def record(self, endpoint: str, latency: float) -> None:
+        """요청의 응답 시간(또는 취소되기 전까지 걸린 시간)을 기록합니다."""
+        latencies = self._latencies.get(endpoint)
+        if latencies is None:
+            latencies = self._latencies[endpoint] = deque(maxlen=self.window)
+        latencies.append(latency)
+
+    @property
+    def hedge_rate(self) -> float:
+        """헤징이 적용된 요청 중 추가 요청을 보낸 비율"""
+        return self.hedged / self.requests if self.requests else 0.0
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "opened_at", "probes")
+
+    def __init__(self) -> None:
+        self.state = CircuitBreaker.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+
+
+class CircuitBreaker:
+    """
+    엔드포인트별 서킷 브레이커 클래스입니다.\n
+    연속 실패가 `failure_threshold`번 쌓이면 서킷이 열리고(open), `recovery_timeout`초 동안 해당 엔드포인트의 요청은
+    보내지 않고 바로 `CircuitOpenException`을 발생시킵니다. 이후 반열림(half-open) 상태에서 시험 요청이 성공하면 다시 닫힙니다(closed).
+    연결 오류, 시간 초과, 5xx 응답만 실패로 셉니다. (429는 실패로 세지 않습니다) 여러 클라이언트가 하나의 객체를 공유할 수 있습니다.
+
+    #### Parameter
+    `failure_threshold` : 서킷을 열기 위한 연속 실패 횟수\n
+    `recovery_timeout` : 서킷이 열린 뒤 시험 요청을 허용하기까지의 시간(초)\n
+    `half_open_max_calls` : 반열림 상태에서 동시에 허용할 시험 요청 수
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, endpoint: str) -> _Circuit:
+        circuit = self._circuits.get(endpoint)
+        if circuit is None:
+            circuit = self._circuits[endpoint] = _Circuit()
+        if (
+            circuit.state == self.OPEN
+            and time.monotonic() - circuit.opened_at >= self.recovery_timeout
+        ):
+            circuit.state = self.HALF_OPEN
+            circuit.probes = 0
+        return circuit
+
+    def state(self, endpoint: str) -> str:
+        """`endpoint`의 서킷 상태(closed, open, half_open)를 반환합니다."""
+        with self._lock:
+            return self._circuit(endpoint).state
+
+    def before_call(self, endpoint: str) -> None:
+        """요청을 보내기 전에 호출합니다. 서킷이 열려 있으면 `CircuitOpenException`이 발생합니다."""
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            if circuit.state == self.OPEN or (
+                circuit.state == self.HALF_OPEN
+                and circuit.probes >= self.half_open_max_calls
+            ):
+                raise CircuitOpenException(f"Circuit open : {endpoint}")
+            if circuit.state == self.HALF_OPEN:
+                circuit.probes += 1
+
+    def record(self, endpoint: str, error: Optional[BaseException] = None) -> None:
+        """
+        요청 결과를 기록합니다.\n
+        `error`가 None이거나 서버가 응답한 오류(4xx 등)면 성공, 연결 오류/시간 초과/5xx면 실패로 기록하고,
+        그 밖의 예외(마감 시각 초과, 취소 등)는 상태를 바꾸지 않습니다.
+        """
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            if circuit.state == self.HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
+            if error is not None and (
+                not isinstance(error, HTTPException)
+                or isinstance(error, DeadlineExceededException)
+            ):
+                return
+            if error is None or not error.retryable or error.status == 429:
+                circuit.state = self.CLOSED
+                circuit.failures = 0
+                return
+            circuit.failures += 1
+            if (
+                circuit.state == self.HALF_OPEN
+                or circuit.failures >= self.failure_threshold
+            ):
+                circuit.state = self.OPEN
+                circuit.opened_at = time.monotonic()
@@ -1,56 +1,493 @@
 import json
 import os
-from typing import Any, Dict, Union
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import nullcontext
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import requests
-from etripy.error import HTTPException
-from etripy.model import FileType
+from etripy.cache import ResponseCache
+from etripy.codec import (
+    DECODE_THRESHOLD,
+    JSONCodec,
+    decode,
+    default_codec,
+    project_analysis,
+)
+from etripy.error import (
+    HTTPConnectionException,
+    HTTPException,
+    HTTPStatusException,
+    HTTPTimeoutException,
+    KeyPoolExhaustedException,
+)
+from etripy.limit import KeyPool, RateLimiter
+from etripy.model import BatchItem, FileType
+from etripy.policy import CircuitBreaker, Deadline, RetryPolicy
+from requests.adapters import HTTPAdapter
+
+DEFAULT_CONNECT_TIMEOUT = 30.0
+"""기본 연결 시간 제한(초, `EtriRequest`가 사용하는 aiohttp 기본값과 같음)"""
+DEFAULT_TOTAL_TIMEOUT = 300.0
+"""기본 요청 한 번의 시간 제한(초, `EtriRequest`가 사용하는 aiohttp 기본값과 같음)"""
 
 
 class SyncEtriRequest:
+    """
+    ETRI 오픈 API 동기 HTTP 클래스입니다.\n
+    스레드마다 별도의 `requests.Session`을 사용하고, 연결 풀(`HTTPAdapter`)은 모든 스레드가 공유합니다.
+    `map`, `imap_unordered`는 `pool_maxsize`개의 스레드를 가진 스레드 풀에서 요청을 동시에 보냅니다.
+    사용이 끝나면 `with` 블록 또는 `close()`로 닫아주세요.
+
+    #### Parameter
+    `access_key` : ETRI 포털사이트에서 발급받은 키 (여러 키를 나누어 쓰려면 `KeyPool`)\n
+    `pool_maxsize` : 연결 풀에 유지할 최대 연결 수이자 `map` 스레드 풀의 스레드 수 (동시에 요청하는 스레드 수 이상 권장)\n
+    `pool_block` : 연결 풀이 가득 찼을 때 새 연결을 만들지 않고 대기할지 여부\n
+    `rate_limiter` : 호출 속도 제한기 (`RateLimiter`, 여러 클라이언트가 공유할 수 있음)\n
+    `retry` : 일시적인 오류를 다시 요청하는 정책 (`RetryPolicy`, None이면 다시 요청하지 않음)\n
+    `connect_timeout` : 연결 시간 제한(초, 기본값 30)\n
+    `read_timeout` : 응답 데이터를 읽는 시간 제한(초)\n
+    `total_timeout` : 요청 한 번의 시간 제한(초, 기본값 300). `requests`는 전체 시간 제한이 없으므로 연결/읽기 시간 제한의 상한으로 적용됩니다.\n
+    `breaker` : 엔드포인트별 서킷 브레이커 (`CircuitBreaker`)\n
+    `codec` : 요청/응답 본문 JSON 코덱 (기본값은 `orjson`이 설치되어 있으면 `OrjsonCodec`, 아니면 `JSONCodec`)\n
+    `cache` : 응답 캐시 (`MemoryCache`, `DiskCache`, 여러 클라이언트와 스레드가 공유할 수 있음)\n
+    `decode_executor` : 큰 응답을 역직렬화할 실행기로, `map`처럼 여러 스레드가 요청할 때 여러 CPU 코어에서 역직렬화합니다. (`"process"`면 CPU 코어 수만큼의 프로세스 풀을 만들어 사용)\n
+    `decode_threshold` : 이 크기(byte) 이상의 응답만 `decode_executor`에서 역직렬화합니다.
+    """
+
     base_url: str = "http://aiopen.etri.re.kr:8000"
 
-    def __init__(self, access_key: str) -> None:
+    def __init__(
+        self,
+        access_key: Union[str, KeyPool],
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        total_timeout: Optional[float] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        codec: Optional[JSONCodec] = None,
+        cache: Optional[ResponseCache] = None,
+        decode_executor: Union[None, str, Executor] = None,
+        decode_threshold: int = DECODE_THRESHOLD,
+    ) -> None:
+        if isinstance(decode_executor, str) and decode_executor != "process":
+            raise ValueError(f"Unknown decode executor : {decode_executor}")
         self.access_key = access_key
+        self.key_pool = access_key if isinstance(access_key, KeyPool) else None
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        # 전달하지 않은 시간 제한은 `EtriRequest`와 같은 기본값을 사용합니다.
+        self.connect_timeout = (
+            DEFAULT_CONNECT_TIMEOUT if connect_timeout is None else connect_timeout
+        )
+        self.read_timeout = read_timeout
+        self.total_timeout = (
+            DEFAULT_TOTAL_TIMEOUT if total_timeout is None else total_timeout
+        )
+        self.breaker = breaker
+        self.codec = codec or default_codec()
+        self.cache = cache
+        self.decode_executor = decode_executor
+        self.decode_threshold = decode_threshold
+        self._decoder: Optional[Executor] = None
+        self.pool_maxsize = pool_maxsize
+        self.adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=pool_maxsize, pool_block=pool_block
+        )
+        self._local = threading.local()
+        self._sessions = []
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """현재 스레드에서 사용할 세션을 반환합니다. (없으면 생성)"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("http://", self.adapter)
+            session.mount("https://", self.adapter)
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """`map`, `imap_unordered`에서 사용하는 스레드 풀을 반환합니다. (없으면 생성)"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.pool_maxsize,
+                    thread_name_prefix="etripy",
+                    initializer=self._mark_worker,
+                )
+            return self._executor
+
+    @property
+    def decoder(self) -> Optional[Executor]:
+        """큰 응답을 역직렬화할 실행기를 반환합니다. (`"process"`면 처음 사용할 때 생성)"""
+        if self.decode_executor != "process":
+            return self.decode_executor
+        with self._lock:
+            if self._decoder is None:
+                self._decoder = ProcessPoolExecutor()
+            return self._decoder
+
+    def _mark_worker(self) -> None:
+        self._local.worker = True
+
+    def close(self) -> None:
+        """스레드 풀과 직접 만든 프로세스 풀, 모든 스레드의 세션과 연결 풀을 닫습니다."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            decoder, self._decoder = self._decoder, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        if decoder is not None:
+            decoder.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            # 공유 어댑터는 마지막에 한 번만 닫습니다.
+            session.adapters.clear()
+            session.close()
+        self.adapter.close()
+        self._local = threading.local()
+
+    def map(
+        self,
+        func: Callable[..., Any],
+        *iterables: Iterable[Any],
+        concurrency: Optional[int] = None,
+        ordered: bool = True,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        ### - 병렬 호출
+        `func(*args)`를 스레드 풀에서 최대 `concurrency`개씩 동시에 호출하고 결과 목록을 반환합니다.
+        스레드들은 이 클라이언트의 연결 풀을 공유하므로 연결을 다시 맺지 않습니다.
+
+        #### Parameter
+        `func` : 호출할 함수 (예: `client.analysis`, 다른 인자는 `functools.partial`로 고정)\n
+        `iterables` : `func`에 전달할 인자 목록 (여러 개면 `zip`처럼 묶어서 전달)\n
+        `concurrency` : 동시에 호출할 수 (기본값과 최대값은 `pool_maxsize`)\n
+        `ordered` : True면 입력 순서대로, False면 끝난 순서대로 반환합니다.\n
+        `return_exceptions` : True면 실패한 호출의 예외를 결과 자리에 담고, False면 첫 예외를 발생시킵니다.
+        """
+        items = list(self.imap_unordered(func, *iterables, concurrency=concurrency))
+        if ordered:
+            items.sort(key=lambda item: item.index)
+        results = []
+        for item in items:
+            if not item.ok and not return_exceptions:
+                raise item.error
+            results.append(item.result if item.ok else item.error)
+        return results
+
+    def imap_unordered(
+        self,
+        func: Callable[..., Any],
+        *iterables: Iterable[Any],
+        concurrency: Optional[int] = None,
+    ) -> Iterator[BatchItem]:
+        """
+        ### - 병렬 호출 (스트리밍)
+        `map`과 같지만, 끝난 호출부터 바로 `BatchItem`으로 내보냅니다. 실패한 호출은 `BatchItem.error`에 담깁니다.
+        입력은 필요한 만큼만 읽으므로 큰 입력도 메모리에 모두 올리지 않습니다.
+
+        #### Parameter
+        `func` : 호출할 함수\n
+        `iterables` : `func`에 전달할 인자 목록\n
+        `concurrency` : 동시에 호출할 수 (기본값과 최대값은 `pool_maxsize`)
+        """
+        inputs = enumerate(zip(*iterables))
+        for (index, args), future in self._fan_out(
+            lambda pair: func(*pair[1]), inputs, concurrency
+        ):
+            value = args[0] if len(args) == 1 else args
+            try:
+                result = future.result()
+            except Exception as e:
+                yield BatchItem(index=index, input=value, error=e)
+            else:
+                yield BatchItem(index=index, input=value, result=result)
+
+    def _fan_out(
+        self,
+        func: Callable[[Any], Any],
+        inputs: Iterable[Any],
+        concurrency: Optional[int],
+    ) -> Iterator[Tuple[Any, Future]]:
+        """`inputs`를 스레드 풀에 최대 `concurrency`개씩 넘기고 끝난 순서대로 `(입력, Future)`를 내보냅니다."""
+        inputs = iter(inputs)
+        concurrency = max(1, min(concurrency or self.pool_maxsize, self.pool_maxsize))
+        # 스레드 풀 안에서 다시 호출하면 풀이 가득 차 멈출 수 있으므로 별도의 스레드를 사용합니다.
+        nested = getattr(self._local, "worker", False)
+        executor = ThreadPoolExecutor(concurrency) if nested else self.executor
+        pending: Dict[Future, Any] = {}
+        try:
+            while True:
+                for value in islice(inputs, concurrency - len(pending)):
+                    pending[executor.submit(func, value)] = value
+                if not pending:
+                    break
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    yield pending.pop(future), future
+        finally:
+            for future in pending:
+                future.cancel()
+            if nested:
+                executor.shutdown(wait=False, cancel_futures=True)
 
     def request(
-        self, method: str, endpoint: str, data: Dict[str, Union[str, int]]
+        self,
+        method: str,
+        endpoint: str,
+        data: Dict[str, Union[str, int]],
+        deadline: Union[None, float, Deadline] = None,
+        fields: Optional[FrozenSet[str]] = None,
     ) -> Dict[str, Any]:
-        headers = {
-            "Content-Type": "application/json; charset=UTF-8",
-            "Authorization": self.access_key,
-        }
+        headers = {"Content-Type": "application/json; charset=UTF-8"}
         url = self.base_url + endpoint
-        response = requests.request(method, url=url, headers=headers, json=data)
-        rescode = response.status_code
-        if rescode == 200:
-            return response.json()
-        else:
-            raise HTTPException(f"Error Code : {rescode} : {response.text}")
+        cache = self.cache
+        if cache is not None and not cache.cacheable(endpoint):
+            cache = None
+        if cache is not None:
+            # 일부 필드만 남긴 응답은 전체 응답과 따로 저장합니다.
+            key = self.codec.request_key(
+                endpoint, data if fields is None else dict(data, fields=sorted(fields))
+            )
+            result = cache.get(endpoint, key)
+            if result is not None:
+                return result
+        # 캐시 항목의 크기로 쓰도록 `_request_once`가 받은 응답 본문의 바이트 수를 담습니다.
+        sizes: List[int] = []
+        result = self._send(
+            endpoint,
+            method,
+            url,
+            Deadline.of(deadline),
+            headers=headers,
+            data=self.codec.dumps(data),
+            fields=fields,
+            sizes=sizes,
+        )
+        if cache is not None and cache.cacheable(endpoint, result):
+            cache.put(endpoint, key, result, sizes[-1])
+        return result
 
-    def request_file_upload(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        headers = {"Authorization": self.access_key}
+    def request_file_upload(
+        self, data: Dict[str, Any], deadline: Union[None, float, Deadline] = None
+    ) -> Dict[str, Any]:
         url = self.base_url + "/VideoParse"
-        response = requests.request(
+        return self._send(
+            "/VideoParse",
             "POST",
-            url=url,
-            headers=headers,
+            url,
+            Deadline.of(deadline),
+            headers={},
             data={"json": data["json"]},
             files={"uploadfile": data["uploadfile"]},
         )
+
+    def _send(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        deadline: Optional[Deadline],
+        headers: Dict[str, str],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        started = time.monotonic()
+        attempt = throttled = 0
+        exhausted = None
+        while True:
+            if deadline is not None:
+                deadline.check(endpoint)
+            error = None
+            with self._lease() as key:
+                kwargs["headers"] = dict(headers, Authorization=key)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.wait_sync(key, endpoint, deadline)
+                try:
+                    result = self._send_once(endpoint, method, url, deadline, **kwargs)
+                except HTTPException as e:
+                    error = e
+            if error is None:
+                if self.key_pool is not None and self.key_pool.is_quota_error(result):
+                    reason = result.get("reason")
+                    if reason == exhausted:
+                        if self.key_pool.available <= 1:
+                            # 모든 키가 사용량 소진으로 응답했습니다.
+                            self.key_pool.exhaust(key)
+                            raise KeyPoolExhaustedException(
+                                f"All access keys are exhausted : {reason}"
+                            )
+                        # 다른 키도 같은 이유로 실패했으므로 키가 아닌 요청의 문제로 봅니다.
+                        return result
+                    # 하루 사용량이 소진된 키는 빼고 다른 키로 다시 보냅니다.
+                    self.key_pool.exhaust(key)
+                    exhausted = reason
+                    continue
+                if self._throttled(key, endpoint, 200, result, throttled):
+                    throttled += 1
+                    continue
+                return result
+            if self._throttled(key, endpoint, error.status, None, throttled):
+                throttled += 1
+                continue
+            attempt += 1
+            delay = self.retry.delay(error, attempt, started) if self.retry else None
+            if delay is None or (
+                deadline is not None and delay >= deadline.remaining()
+            ):
+                raise error
+            time.sleep(delay)
+
+    def _lease(self) -> ContextManager[str]:
+        if self.key_pool is None:
+            return nullcontext(self.access_key)
+        return self.key_pool.lease()
+
+    def _send_once(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        deadline: Optional[Deadline],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        if self.breaker is None:
+            return self._request_once(endpoint, method, url, deadline, **kwargs)
+        self.breaker.before_call(endpoint)
+        try:
+            result = self._request_once(endpoint, method, url, deadline, **kwargs)
+        except BaseException as e:
+            self.breaker.record(endpoint, e)
+            raise
+        self.breaker.record(endpoint)
+        return result
+
+    def _request_once(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        deadline: Optional[Deadline],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        fields = kwargs.pop("fields", None)
+        sizes = kwargs.pop("sizes", None)
+        try:
+            response = self.session.request(
+                method, url=url, timeout=self._timeout(deadline), **kwargs
+            )
+        except requests.Timeout as e:
+            raise HTTPTimeoutException(f"Timeout : {endpoint}") from e
+        except (
+            requests.ConnectionError,
+            requests.exceptions.ChunkedEncodingError,
+        ) as e:
+            raise HTTPConnectionException(f"{type(e).__name__} : {e}") from e
         rescode = response.status_code
         if rescode == 200:
-            return response.json()
-        else:
-            raise HTTPException(f"Error Code : {rescode} : {response.text}")
+            if sizes is not None:
+                sizes.append(len(response.content))
+            return self._decode(response.content, fields)
+        raise HTTPStatusException.from_status(rescode, response.text)
+
+    def _decode(self, body: bytes, fields: Optional[FrozenSet[str]] = None) -> Any:
+        decoder = self.decoder
+        if decoder is None or len(body) < self.decode_threshold:
+            return project_analysis(self.codec.loads(body), fields)
+        return decoder.submit(decode, self.codec, body, fields).result()
+
+    def _timeout(
+        self, deadline: Optional[Deadline]
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """`(연결, 읽기)` 시간 제한을 마감 시각과 전체 시간 제한에 맞춰 계산합니다."""
+        limits = [self.total_timeout]
+        if deadline is not None:
+            limits.append(deadline.remaining())
+        limits = [limit for limit in limits if limit is not None]
+        cap = min(limits) if limits else None
+
+        def capped(value: Optional[float]) -> Optional[float]:
+            if cap is None:
+                return value
+            return cap if value is None else min(value, cap)
+
+        return capped(self.connect_timeout), capped(self.read_timeout)
+
+    def _throttled(
+        self, key: str, endpoint: str, status: Optional[int], result: Any, count: int
+    ) -> bool:
+        return (
+            self.rate_limiter is not None
+            and count < self.rate_limiter.quota_retries
+            and self.rate_limiter.throttled(key, endpoint, status, result)
+        )
 
-    def get_analysis_data(self, data: Dict[str, Union[str, int]], spoken: bool):
+    def get_analysis_data(
+        self,
+        data: Dict[str, Union[str, int]],
+        spoken: bool,
+        deadline: Union[None, float, Deadline] = None,
+        fields: Optional[FrozenSet[str]] = None,
+    ):
         if spoken:
-            return self.request(method="POST", endpoint="/WiseNLU_spoken", data=data)
+            return self.request(
+                method="POST",
+                endpoint="/WiseNLU_spoken",
+                data=data,
+                deadline=deadline,
+                fields=fields,
+            )
         else:
-            return self.request(method="POST", endpoint="/WiseNLU", data=data)
+            return self.request(
+                method="POST",
+                endpoint="/WiseNLU",
+                data=data,
+                deadline=deadline,
+                fields=fields,
+            )
 
-    def file_upload(self, upload_file_path: str):
+    def file_upload(
+        self, upload_file_path: str, deadline: Union[None, float, Deadline] = None
+    ):
         with open(upload_file_path, "rb") as file:
             file_content = file.read()
 
@@ -60,4 +497,4 @@ class SyncEtriRequest:
             "json": json.dumps(requestJson),
             "uploadfile": (os.path.basename(upload_file_path), file_content),
         }
-        return self.request_file_upload(data=data)
+        return self.request_file_upload(data=data, deadline=deadline)
@@ -7,8 +7,10 @@ from etripy.error import (
     VoicePronunciationException,
     VoiceRecognitionException,
 )
+from etripy.limit import KeyPool
 from etripy.model import LanguageCodeType
 from etripy.model.voice import PronunciationResult, RecognitionResult
+from etripy.policy import Deadline
 from etripy.sync.http import SyncEtriRequest
 from pydub import AudioSegment
 
@@ -17,11 +19,13 @@ class VoiceClient(SyncEtriRequest):
     """
     ETRI 음성지능 클라이언트 클래스입니다. (동기 처리)
     #### access_key
-    [ETRI 포털사이트](https://aiopen.etri.re.kr/)에서 발급받은 `access_key`를 입력합니다.
+    [ETRI 포털사이트](https://aiopen.etri.re.kr/)에서 발급받은 `access_key`를 입력합니다. 여러 키를 나누어 쓰려면 `KeyPool`을 전달합니다.
+    #### kwargs
+    연결 풀 등 HTTP 설정은 `SyncEtriRequest`의 인자를 참조하십시오.
     """
 
-    def __init__(self, access_key: str) -> None:
-        super().__init__(access_key=access_key)
+    def __init__(self, access_key: Union[str, KeyPool], **kwargs) -> None:
+        super().__init__(access_key=access_key, **kwargs)
 
     def __convert_to_raw(self, audioFilePath) -> bytes:
         """오디오 파일을 API가 지원하는 파일의 형식으로 변환합니다."""
@@ -33,7 +37,10 @@ class VoiceClient(SyncEtriRequest):
         return raw_data.getvalue()
 
     def recognition(
-        self, language_code: Union[LanguageCodeType, str], audio_path: str
+        self,
+        language_code: Union[LanguageCodeType, str],
+        audio_path: str,
+        deadline: Union[None, float, Deadline] = None,
     ) -> Optional[RecognitionResult]:
         """
         ### - 음성인식 기술
@@ -41,7 +48,8 @@ class VoiceClient(SyncEtriRequest):
 
         #### Parameter
         `language_code` : 음성인식의 입력 음성 언어 코드입니다. 요청할 수 있는 언어 코드는 LanguageCodeType 클래스를 참조하십시오.\n
-        `audio_path` : 음성인식을 할 녹음된 음성파일의 경로입니다.
+        `audio_path` : 음성인식을 할 녹음된 음성파일의 경로입니다.\n
+        `deadline` : 호출 제한 시간(초) 또는 `Deadline` 객체로, 대기열과 재시도 시간을 모두 포함합니다. (필수 X)
         """
         try:
             audioContents = base64.b64encode(self.__convert_to_raw(audio_path)).decode(
@@ -52,7 +60,9 @@ class VoiceClient(SyncEtriRequest):
 
         data = {"argument": {"language_code": language_code, "audio": audioContents}}
 
-        result = self.request(method="POST", endpoint="/WiseASR/Recognition", data=data)
+        result = self.request(
+            method="POST", endpoint="/WiseASR/Recognition", data=data, deadline=deadline
+        )
         try:
             if result["return_object"] == {}:
                 return None
@@ -67,6 +77,7 @@ class VoiceClient(SyncEtriRequest):
         speaker_language_code: Union[LanguageCodeType, str],
         audio_path: str,
         script: Optional[str] = None,
+        deadline: Union[None, float, Deadline] = None,
     ) -> Optional[PronunciationResult]:
         """
         ### - 발음평가 기술
@@ -76,7 +87,8 @@ class VoiceClient(SyncEtriRequest):
         `language_code` : 발음평가의 입력 음성 언어 코드입니다. 요청할 수 있는 언어 코드는 korean, english입니다.\n
         `speaker_language_code` : 화자의 음성 언어 코드입니다. 요청할 수 있는 언어 코드는 korean, english입니다.\n
         `audio_path` : 음성인식을 할 녹음된 음성파일의 경로입니다.\n
-        `script` : 녹음된 음성파일의 제시 문장입니다. API 요청 시 script가 포함되지 않는 경우 비원어민 영어 음성인식을 수행한 이후 인식 결과에 대한 발음평가 점수를 제공합니다.
+        `script` : 녹음된 음성파일의 제시 문장입니다. API 요청 시 script가 포함되지 않는 경우 비원어민 영어 음성인식을 수행한 이후 인식 결과에 대한 발음평가 점수를 제공합니다.\n
+        `deadline` : 호출 제한 시간(초) 또는 `Deadline` 객체로, 대기열과 재시도 시간을 모두 포함합니다. (필수 X)
         """
         if (
             language_code != LanguageCodeType.korean
@@ -106,7 +118,9 @@ class VoiceClient(SyncEtriRequest):
             }
         }
 
-        result = self.request(method="POST", endpoint=f"/WiseASR/{endpoint}", data=data)
+        result = self.request(
+            method="POST", endpoint=f"/WiseASR/{endpoint}", data=data, deadline=deadline
+        )
         try:
             if result["return_object"] == {}:
                 return None
@@ -0,0 +1,441 @@
+import array
+import math
+from itertools import islice, repeat
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+from etripy.model.language import AnalysisResult
+
+_MISSING = -1
+"""값이 없는 정수 열(ID, 코드, 위치)에 저장하는 값"""
+_UNKNOWN = -2
+"""어휘 표에 없는 문자열 조건의 코드 (어떤 행과도 같지 않음)"""
+
+_MORP_COLUMNS = (
+    ("doc", "q"),
+    ("sentence", "i"),
+    ("word", "i"),
+    ("id", "i"),
+    ("lemma", "i"),
+    ("type", "i"),
+    ("position", "q"),
+    ("weight", "f"),
+)
+_WORD_COLUMNS = (
+    ("doc", "q"),
+    ("sentence", "i"),
+    ("id", "i"),
+    ("text", "i"),
+    ("begin", "i"),
+    ("end", "i"),
+)
+_NE_COLUMNS = (
+    ("doc", "q"),
+    ("sentence", "i"),
+    ("id", "i"),
+    ("text", "i"),
+    ("type", "i"),
+    ("begin", "i"),
+    ("end", "i"),
+    ("weight", "f"),
+)
+_TABLES = {"morp": _MORP_COLUMNS, "word": _WORD_COLUMNS, "NE": _NE_COLUMNS}
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("CorpusTable requires the 'numpy' package") from None
+    return numpy
+
+
+def _values(items: Sequence[Dict[str, Any]], key: str) -> List[Any]:
+    try:
+        return list(map(itemgetter(key), items))
+    except KeyError:
+        return [item.get(key) for item in items]
+
+
+def _ints(items: Sequence[Dict[str, Any]], key: str) -> List[int]:
+    values = _values(items, key)
+    if None in values:
+        return [_MISSING if value is None else value for value in values]
+    return values
+
+
+def _floats(items: Sequence[Dict[str, Any]], key: str) -> List[float]:
+    values = _values(items, key)
+    if None in values:
+        return [math.nan if value is None else value for value in values]
+    return values
+
+
+def _word_of(
+    morp_ids: List[int], word_ids: List[int], begins: List[int], ends: List[int]
+) -> List[int]:
+    # 어절이 형태소를 ID 순서대로 빈틈없이 덮는 보통의 경우에는 어절마다 한 번씩만 펼칩니다.
+    if not morp_ids:
+        return []
+    first = expected = morp_ids[0]
+    expanded: List[int] = []
+    for word_id, begin, end in zip(word_ids, begins, ends):
+        if begin != expected or end < begin:
+            break
+        expanded.extend(repeat(word_id, end - begin + 1))
+        expected = end + 1
+    else:
+        if len(expanded) == len(morp_ids) and morp_ids == list(
+            range(first, first + len(morp_ids))
+        ):
+            return expanded
+    word_of: Dict[int, int] = {}
+    for word_id, begin, end in zip(word_ids, begins, ends):
+        if begin != _MISSING and end != _MISSING:
+            for morp_id in range(begin, end + 1):
+                word_of[morp_id] = word_id
+    return [word_of.get(morp_id, _MISSING) for morp_id in morp_ids]
+
+
+class Vocabulary:
+    """
+    문자열과 정수 코드를 서로 바꾸는 어휘 표입니다.\n
+    코드는 처음 나온 순서대로 0부터 붙으며, 값이 없으면(`None`) `-1`입니다.
+    """
+
+    def __init__(self) -> None:
+        self._codes: Dict[str, int] = {}
+        self._strings: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __contains__(self, value: str) -> bool:
+        return value in self._codes
+
+    def __getitem__(self, code: int) -> Optional[str]:
+        return None if code < 0 else self.strings[code]
+
+    @property
+    def strings(self) -> List[str]:
+        """코드 순서의 문자열 목록"""
+        if len(self._strings) != len(self._codes):
+            self._strings.extend(islice(self._codes, len(self._strings), None))
+        return self._strings
+
+    def add(self, value: Optional[str]) -> int:
+        """`value`의 코드를 반환합니다. (처음 나온 문자열이면 새 코드를 붙입니다.)"""
+        if value is None:
+            return _MISSING
+        return self._codes.setdefault(value, len(self._codes))
+
+    def encode(self, values: Iterable[Optional[str]]) -> List[int]:
+        """`add`를 문자열 목록에 한 번에 적용합니다."""
+        codes = self._codes
+        return [
+            _MISSING if value is None else codes.setdefault(value, len(codes))
+            for value in values
+        ]
+
+    def code(self, value: Optional[str]) -> int:
+        """`value`의 코드를 반환합니다. (없는 문자열이면 `-1`)"""
+        if value is None:
+            return _MISSING
+        return self._codes.get(value, _MISSING)
+
+    def decode(self, codes: Iterable[int]) -> List[Optional[str]]:
+        """코드 목록을 문자열 목록으로 바꿉니다."""
+        strings = self.strings
+        return [None if code < 0 else strings[code] for code in codes]
+
+
+class Columns:
+    """
+    같은 길이의 NumPy 배열을 열 이름으로 묶은 표입니다.\n
+    문자열 열은 `Vocabulary`의 정수 코드로 저장되며, `where`와 `count_by`는 문자열 조건을 코드로 바꿔
+    배열 연산으로 처리합니다. `columns["lemma"]`처럼 열 배열을, `columns[mask]`처럼 행을 고른 표를 얻을 수 있습니다.
+    """
+
+    def __init__(self, columns: Dict[str, Any], vocab: Dict[str, Vocabulary]) -> None:
+        self.columns = columns
+        """열 이름과 배열"""
+        self.vocab = vocab
+        """문자열 열의 이름과 어휘 표"""
+
+    def __len__(self) -> int:
+        for column in self.columns.values():
+            return len(column)
+        return 0
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, str):
+            return self.columns[key]
+        return Columns(
+            {name: column[key] for name, column in self.columns.items()}, self.vocab
+        )
+
+    def __repr__(self) -> str:
+        return f"Columns(rows={len(self)}, columns={list(self.columns)})"
+
+    @property
+    def names(self) -> List[str]:
+        """열 이름 목록"""
+        return list(self.columns)
+
+    @property
+    def nbytes(self) -> int:
+        """배열이 차지하는 메모리 크기(byte)"""
+        return sum(column.nbytes for column in self.columns.values())
+
+    def _code(self, name: str, value: Any) -> Any:
+        vocab = self.vocab.get(name)
+        if vocab is None:
+            return value
+        if isinstance(value, str):
+            # 값이 없는 행(`-1`)과 섞이지 않도록 어휘 표에 없는 문자열은 `_UNKNOWN`으로 바꿉니다.
+            return vocab.code(value) if value in vocab else _UNKNOWN
+        if value is None:
+            return _MISSING
+        return value
+
+    def mask(self, **conditions: Any) -> Any:
+        """
+        모든 조건을 만족하는 행의 bool 배열을 반환합니다.\n
+        조건 값은 하나의 값(같음), `range`(시작 이상 끝 미만), 값의 list/tuple/set(그중 하나)일 수 있습니다.
+        문자열 열에서 `None`은 값이 없는 행과 같고, 어휘 표에 없는 문자열은 어떤 행과도 같지 않습니다.
+        """
+        np = _numpy()
+        mask = np.ones(len(self), dtype=bool)
+        for name, value in conditions.items():
+            column = self.columns[name]
+            if isinstance(value, range) and value.step == 1:
+                mask &= (column >= value.start) & (column < value.stop)
+            elif isinstance(value, (range, list, tuple, set, frozenset)):
+                codes = [self._code(name, item) for item in value]
+                mask &= np.isin(column, codes)
+            else:
+                mask &= column == self._code(name, value)
+        return mask
+
+    def where(self, **conditions: Any) -> "Columns":
+        """
+        조건을 만족하는 행만 고른 표를 반환합니다. (조건은 `mask`와 같습니다.)
+
+        #### Example
+        ```
+        table.morp.where(type="NNP", doc=range(100, 5001)).decode("lemma")
+        ```
+        """
+        return self[self.mask(**conditions)]
+
+    def decode(self, name: str) -> List[Any]:
+        """열을 Python 목록으로 반환합니다. (문자열 열은 문자열로 바꿉니다.)"""
+        column = self.columns[name]
+        vocab = self.vocab.get(name)
+        if vocab is None:
+            return column.tolist()
+        return vocab.decode(column.tolist())
+
+    def to_dict(self, decode: bool = True) -> Dict[str, List[Any]]:
+        """열 이름과 Python 목록의 dict로 반환합니다."""
+        if decode:
+            return {name: self.decode(name) for name in self.columns}
+        return {name: column.tolist() for name, column in self.columns.items()}
+
+    def count_by(self, *names: str) -> "Columns":
+        """
+        `names` 열의 값 조합별 행 수를 `count` 열로 가지는 표를 반환합니다. (값 조합 순으로 정렬)
+
+        #### Example
+        ```
+        table.ne.count_by("doc", "type").to_dict()
+        ```
+        """
+        np = _numpy()
+        if not names:
+            return Columns({"count": np.array([len(self)], dtype=np.int64)}, {})
+        # 열 값을 하나의 정수 키로 합쳐 한 번의 정렬로 세고, 너무 크면 행 단위로 셉니다.
+        keys = [self.columns[name].astype(np.int64) - _MISSING for name in names]
+        dims = [int(key.max()) + 1 if len(key) else 1 for key in keys]
+        if math.prod(dims) < 1 << 62:
+            unique, counts = np.unique(
+                np.ravel_multi_index(keys, dims), return_counts=True
+            )
+            unique = np.unravel_index(unique, dims)
+        else:
+            unique, counts = np.unique(
+                np.stack(keys, axis=1), axis=0, return_counts=True
+            )
+            unique = unique.T
+        columns = {
+            name: (key + _MISSING).astype(self.columns[name].dtype)
+            for name, key in zip(names, unique)
+        }
+        columns["count"] = counts.astype(np.int64)
+        return Columns(
+            columns, {name: self.vocab[name] for name in names if name in self.vocab}
+        )
+
+
+class CorpusTable:
+    """
+    많은 언어 분석 결과(`AnalysisResult`)의 형태소, 어절, 개체명을 열 단위 배열로 모아 두는 표입니다.\n
+    형태소와 태그, 어휘는 `Vocabulary`의 정수 코드로, 문서/문장/어절 ID와 byte position, 신뢰도는 숫자 배열로 저장하므로
+    문서 수천 개에 걸친 필터와 집계를 `Sentence.Morp` 객체를 순회하지 않고 NumPy 배열 연산으로 처리합니다.
+    `add`는 표준 라이브러리 `array`에 값을 쌓기만 하며, `morp`, `word`, `ne`로 표를 처음 읽을 때 NumPy 배열로 옮깁니다.
+    (`pip install numpy` 필요)
+
+    #### Example
+    ```
+    table = CorpusTable.from_results(results)
+    table.morp.where(type="NNP", doc=range(100, 5001)).decode("lemma")
+    table.ne.count_by("doc", "type").to_dict()
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.documents = 0
+        """추가한 문서 수"""
+        self.lemmas = Vocabulary()
+        """형태소 어휘 표"""
+        self.tags = Vocabulary()
+        """형태소 태그 표"""
+        self.texts = Vocabulary()
+        """어절과 개체명 텍스트 표"""
+        self.ne_types = Vocabulary()
+        """개체명 타입 표"""
+        self._vocab = {
+            "morp": {"lemma": self.lemmas, "type": self.tags},
+            "word": {"text": self.texts},
+            "NE": {"text": self.texts, "type": self.ne_types},
+        }
+        self._buffers = {
+            table: {name: array.array(typecode) for name, typecode in columns}
+            for table, columns in _TABLES.items()
+        }
+        self._arrays: Dict[str, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return self.documents
+
+    def __repr__(self) -> str:
+        rows = {
+            table: len(self._buffers[table]["doc"])
+            + len(self._arrays.get(table, {}).get("doc", ()))
+            for table in _TABLES
+        }
+        return f"CorpusTable(documents={self.documents}, rows={rows})"
+
+    @classmethod
+    def from_results(
+        cls, results: Iterable[Union[AnalysisResult, Sequence[Dict[str, Any]]]]
+    ) -> "CorpusTable":
+        """분석 결과를 순서대로 문서 ID 0, 1, 2, ...로 추가한 표를 만듭니다."""
+        table = cls()
+        table.extend(results)
+        return table
+
+    def extend(
+        self, results: Iterable[Union[AnalysisResult, Sequence[Dict[str, Any]]]]
+    ) -> None:
+        """분석 결과를 순서대로 추가합니다."""
+        for result in results:
+            self.add(result)
+
+    def add(
+        self,
+        result: Union[AnalysisResult, Sequence[Dict[str, Any]]],
+        doc: Optional[int] = None,
+    ) -> int:
+        """
+        분석 결과 하나를 문서로 추가하고 문서 ID를 반환합니다.
+
+        #### Parameter
+        `result` : 언어 분석 결과 (또는 `sentence` 목록)\n
+        `doc` : 문서 ID (없으면 추가한 순서)
+        """
+        if doc is None:
+            doc = self.documents
+        sentences = result.sentence if isinstance(result, AnalysisResult) else result
+        for index, sentence in enumerate(sentences or ()):
+            sentence_id = sentence.get("id")
+            if sentence_id is None:
+                sentence_id = index
+            self._add_sentence(doc, sentence_id, sentence)
+        self.documents += 1
+        return doc
+
+    def _add_sentence(
+        self, doc: int, sentence_id: int, sentence: Dict[str, Any]
+    ) -> None:
+        morps = sentence.get("morp") or ()
+        words = sentence.get("word") or ()
+        entities = sentence.get("NE") or ()
+
+        morp_ids = _ints(morps, "id")
+        word_ids = _ints(words, "id")
+        begins = _ints(words, "begin")
+        ends = _ints(words, "end")
+
+        buffers = self._buffers["morp"]
+        buffers["doc"].extend(repeat(doc, len(morps)))
+        buffers["sentence"].extend(repeat(sentence_id, len(morps)))
+        buffers["word"].extend(_word_of(morp_ids, word_ids, begins, ends))
+        buffers["id"].extend(morp_ids)
+        buffers["lemma"].extend(self.lemmas.encode(_values(morps, "lemma")))
+        buffers["type"].extend(self.tags.encode(_values(morps, "type")))
+        buffers["position"].extend(_ints(morps, "position"))
+        buffers["weight"].extend(_floats(morps, "weight"))
+
+        buffers = self._buffers["word"]
+        buffers["doc"].extend(repeat(doc, len(words)))
+        buffers["sentence"].extend(repeat(sentence_id, len(words)))
+        buffers["id"].extend(word_ids)
+        buffers["text"].extend(self.texts.encode(_values(words, "text")))
+        buffers["begin"].extend(begins)
+        buffers["end"].extend(ends)
+
+        buffers = self._buffers["NE"]
+        buffers["doc"].extend(repeat(doc, len(entities)))
+        buffers["sentence"].extend(repeat(sentence_id, len(entities)))
+        buffers["id"].extend(_ints(entities, "id"))
+        buffers["text"].extend(self.texts.encode(_values(entities, "text")))
+        buffers["type"].extend(self.ne_types.encode(_values(entities, "type")))
+        buffers["begin"].extend(_ints(entities, "begin"))
+        buffers["end"].extend(_ints(entities, "end"))
+        buffers["weight"].extend(_floats(entities, "weight"))
+
+    def _columns(self, table: str) -> Columns:
+        np = _numpy()
+        buffers = self._buffers[table]
+        arrays = self._arrays.get(table)
+        if arrays is None or len(buffers["doc"]):
+            # 쌓아 둔 값을 배열 뒤에 붙이고 버퍼를 비웁니다.
+            fresh = {
+                name: np.frombuffer(buffer, dtype=buffer.typecode).copy()
+                for name, buffer in buffers.items()
+            }
+            if arrays is not None:
+                fresh = {
+                    name: np.concatenate((arrays[name], column))
+                    for name, column in fresh.items()
+                }
+            arrays = self._arrays[table] = fresh
+            for name, typecode in _TABLES[table]:
+                buffers[name] = array.array(typecode)
+        return Columns(dict(arrays), self._vocab[table])
+
+    @property
+    def morp(self) -> Columns:
+        """형태소 표 (`doc`, `sentence`, `word`, `id`, `lemma`, `type`, `position`, `weight`)"""
+        return self._columns("morp")
+
+    @property
+    def word(self) -> Columns:
+        """어절 표 (`doc`, `sentence`, `id`, `text`, `begin`, `end`)"""
+        return self._columns("word")
+
+    @property
+    def ne(self) -> Columns:
+        """개체명 표 (`doc`, `sentence`, `id`, `text`, `type`, `begin`, `end`, `weight`)"""
+        return self._columns("NE")
@@ -12,6 +12,7 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/VoidAsMad/ETRI",
     packages=setuptools.find_packages(),
-    python_requires=">=3.6",
+    python_requires=">=3.8",
     install_requires=["requests", "aiohttp", "pydub"],
+    extras_require={"speed": ["orjson"], "cache": ["zstandard"], "table": ["numpy"]},
 )
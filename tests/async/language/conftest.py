@@ -1,14 +1,16 @@
-import pytest
+import pytest_asyncio
 from etripy import client
 
 access_key = ""  # 엑세스 키
 
 
-@pytest.fixture
-def analysis():
-    return client.AnalysisClient(access_key=access_key)
+@pytest_asyncio.fixture
+async def analysis():
+    async with client.AnalysisClient(access_key=access_key) as analysis_client:
+        yield analysis_client
 
 
-@pytest.fixture
-def qa():
-    return client.QAClient(access_key=access_key)
+@pytest_asyncio.fixture
+async def qa():
+    async with client.QAClient(access_key=access_key) as qa_client:
+        yield qa_client
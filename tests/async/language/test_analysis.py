@@ -1,5 +1,6 @@
 import pytest
 from etripy.client import AnalysisClient, AnalysisCode
+from etripy.pipeline import Pipeline
 
 analysis_text = "엑소브레인은 내 몸 바깥에 있는 인공 두뇌라는 뜻으로, 세계 최고인공지능 기술 선도라는 비전을 달성하기 위한 과학기술정보통신부 소프트웨어 분야의 국가 혁신기술 개발형 연구개발 과제이다."
 sentences = (
@@ -19,6 +20,54 @@ async def test_analysis(analysis: AnalysisClient):
     assert r.data
 
 
+# 언어 분석 (필드 선택)
+@pytest.mark.asyncio
+async def test_analysis_fields(analysis: AnalysisClient):
+    r = await analysis.analysis(
+        text=analysis_text, analysis_code=AnalysisCode.ner, fields=["morp", "NE"]
+    )
+    assert r.Sentence[0].Ne
+    assert all(sentence.SRL is None for sentence in r.Sentence)
+
+
+# 언어 분석 (일괄 처리)
+@pytest.mark.asyncio
+async def test_analysis_many(analysis: AnalysisClient):
+    r = await analysis.analysis_many(
+        texts=sentences, analysis_code=AnalysisCode.morp, concurrency=2
+    )
+    assert [item.index for item in r] == [0, 1]
+    assert all(item.ok and item.result.data for item in r)
+
+
+# 언어 분석 (일괄 처리, 묶음 요청)
+@pytest.mark.asyncio
+async def test_analysis_many_pack(analysis: AnalysisClient):
+    r = await analysis.analysis_many(
+        texts=sentences, analysis_code=AnalysisCode.morp, pack=True
+    )
+    assert [item.index for item in r] == [0, 1]
+    assert all(item.ok and item.result.Sentence for item in r)
+
+
+# 언어 분석 (파이프라인)
+@pytest.mark.asyncio
+async def test_analysis_pipeline(analysis: AnalysisClient):
+    r = []
+    n = await Pipeline(sentences).analysis(analysis, AnalysisCode.morp).run(r.append)
+    assert n == 2
+    assert all(item.ok and item.result.data for item in r)
+
+
+# 언어 분석 (긴 문서)
+@pytest.mark.asyncio
+async def test_analysis_document(analysis: AnalysisClient):
+    r = await analysis.analysis_document(
+        text=NE_text, analysis_code=AnalysisCode.morp, max_chars=200
+    )
+    assert [sentence.id for sentence in r.Sentence] == list(range(len(r.Sentence)))
+
+
 # 문장 패러프레이즈 인식
 @pytest.mark.asyncio
 async def test_paraphrase(analysis: AnalysisClient):
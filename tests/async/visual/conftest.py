@@ -1,14 +1,16 @@
-import pytest
+import pytest_asyncio
 from etripy import client
 
 access_key = ""  # 엑세스 키
 
 
-@pytest.fixture
-def image():
-    return client.ImageClient(access_key=access_key)
+@pytest_asyncio.fixture
+async def image():
+    async with client.ImageClient(access_key=access_key) as image_client:
+        yield image_client
 
 
-@pytest.fixture
-def video():
-    return client.VideoClient(access_key=access_key)
+@pytest_asyncio.fixture
+async def video():
+    async with client.VideoClient(access_key=access_key) as video_client:
+        yield video_client
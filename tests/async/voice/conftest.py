@@ -1,9 +1,10 @@
-import pytest
+import pytest_asyncio
 from etripy import client
 
 access_key = ""  # 엑세스 키
 
 
-@pytest.fixture
-def voice():
-    return client.VoiceClient(access_key=access_key)
+@pytest_asyncio.fixture
+async def voice():
+    async with client.VoiceClient(access_key=access_key) as voice_client:
+        yield voice_client
@@ -6,9 +6,11 @@ access_key = ""  # 엑세스 키
 
 @pytest.fixture
 def analysis():
-    return sync.AnalysisClient(access_key=access_key)
+    with sync.AnalysisClient(access_key=access_key) as analysis_client:
+        yield analysis_client
 
 
 @pytest.fixture
 def qa():
-    return sync.QAClient(access_key=access_key)
+    with sync.QAClient(access_key=access_key) as qa_client:
+        yield qa_client
@@ -18,6 +18,48 @@ def test_analysis(analysis: AnalysisClient):
     assert r.data
 
 
+# 언어 분석 (필드 선택)
+def test_analysis_fields(analysis: AnalysisClient):
+    r = analysis.analysis(
+        text=analysis_text, analysis_code=AnalysisCode.ner, fields=["morp", "NE"]
+    )
+    assert r.Sentence[0].Ne
+    assert all(sentence.SRL is None for sentence in r.Sentence)
+
+
+# 언어 분석 (일괄 처리)
+def test_analysis_many(analysis: AnalysisClient):
+    r = analysis.analysis_many(
+        texts=sentences, analysis_code=AnalysisCode.morp, concurrency=2
+    )
+    assert [item.index for item in r] == [0, 1]
+    assert all(item.ok and item.result.data for item in r)
+
+
+# 언어 분석 (일괄 처리, 묶음 요청)
+def test_analysis_many_pack(analysis: AnalysisClient):
+    r = analysis.analysis_many(
+        texts=sentences, analysis_code=AnalysisCode.morp, pack=True
+    )
+    assert [item.index for item in r] == [0, 1]
+    assert all(item.ok and item.result.Sentence for item in r)
+
+
+# 병렬 호출
+def test_map(analysis: AnalysisClient):
+    r = analysis.map(analysis.analysis, sentences, [AnalysisCode.morp] * 2)
+    assert len(r) == 2
+    assert all(result.data for result in r)
+
+
+# 언어 분석 (긴 문서)
+def test_analysis_document(analysis: AnalysisClient):
+    r = analysis.analysis_document(
+        text=NE_text, analysis_code=AnalysisCode.morp, max_chars=200
+    )
+    assert [sentence.id for sentence in r.Sentence] == list(range(len(r.Sentence)))
+
+
 # 문장 패러프레이즈 인식
 def test_paraphrase(analysis: AnalysisClient):
     r = analysis.paraphrase(sentences[0], sentences[1])
@@ -6,9 +6,11 @@ access_key = ""  # 엑세스 키
 
 @pytest.fixture
 def image():
-    return sync.ImageClient(access_key=access_key)
+    with sync.ImageClient(access_key=access_key) as image_client:
+        yield image_client
 
 
 @pytest.fixture
 def video():
-    return sync.VideoClient(access_key=access_key)
+    with sync.VideoClient(access_key=access_key) as video_client:
+        yield video_client
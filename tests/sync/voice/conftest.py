@@ -6,4 +6,5 @@ access_key = ""  # 엑세스 키
 
 @pytest.fixture
 def voice():
-    return sync.VoiceClient(access_key=access_key)
+    with sync.VoiceClient(access_key=access_key) as voice_client:
+        yield voice_client
@@ -0,0 +1,206 @@
+import copy
+import hashlib
+import json
+
+import pytest
+import requests
+from etripy.cache import DiskCache, FileIdCache, MemoryCache, ResponseCache
+from etripy.client.visual import VideoClient
+from etripy.error import VisualVideoException
+from etripy.model.language import AnalysisResult
+from etripy.sync.http import SyncEtriRequest
+from requests.adapters import BaseAdapter
+
+
+class FakeAdapter(BaseAdapter):
+    """요청마다 같은 본문을 200으로 응답하는 가짜 전송 계층"""
+
+    def __init__(self, body: bytes) -> None:
+        super().__init__()
+        self.body = body
+        self.calls = 0
+
+    def send(self, request, **kwargs):
+        self.calls += 1
+        response = requests.Response()
+        response.status_code = 200
+        response._content = self.body
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+# 크기 한도를 넘으면 가장 오래 사용하지 않은 항목부터 지웁니다.
+def test_memory_cache_lru():
+    cache = MemoryCache(max_bytes=10)
+    cache.put("/WiseNLU", "a", 1, 4)
+    cache.put("/WiseNLU", "b", 2, 4)
+    assert cache.get("/WiseNLU", "a") == 1
+    cache.put("/WiseNLU", "c", 3, 4)
+    assert "b" not in cache and "a" in cache and "c" in cache
+    assert (cache.size, cache.evictions) == (8, 1)
+    cache.put("/WiseNLU", "d", 4, 11)
+    assert "d" not in cache
+    cache.put("/WiseNLU", "a", 5, 2)
+    assert (cache.get("/WiseNLU", "a"), cache.size) == (5, 6)
+
+
+# 유지 시간이 지난 항목과 유지 시간이 0인 엔드포인트는 반환하지 않습니다.
+def test_memory_cache_ttl(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("time.monotonic", lambda: now[0])
+    cache = MemoryCache(ttl=10, endpoint_ttls={"/WiseWWN": 100})
+    cache.put("/WiseNLU", "a", 1, 1)
+    cache.put("/WiseWWN/Word", "b", 2, 1)
+    cache.put("/WiseASR/Recognition", "c", 3, 1)
+    now[0] = 10.0
+    assert cache.get("/WiseNLU", "a") is None
+    assert cache.get("/WiseWWN/Word", "b") == 2
+    assert cache.get("/WiseASR/Recognition", "c") is None
+    assert cache.stats()["expirations"] == 1
+    assert not cache.cacheable("/WiseNLU", {"result": -1, "reason": "error"})
+
+
+# 캐시 항목의 크기는 응답을 다시 직렬화하지 않고 받은 본문의 바이트 수로 셉니다.
+def test_request_cache_size():
+    body = json.dumps({"result": 0, "return_object": {"text": "윤동주"}}, indent=4)
+    adapter = FakeAdapter(body.encode())
+    cache = MemoryCache()
+    with SyncEtriRequest("key", cache=cache) as client:
+        client.adapter = adapter
+        for _ in range(2):
+            result = client.request("POST", "/WiseNLU", {"text": "윤동주"})
+            assert result["return_object"] == {"text": "윤동주"}
+    assert adapter.calls == 1
+    assert cache.size == len(adapter.body)
+
+
+# 기본 클래스의 저장 메서드를 모두 구현하지 않은 캐시는 만들 수 없습니다.
+def test_response_cache_abstract():
+    class Incomplete(ResponseCache):
+        def get(self, endpoint, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+# 메모리 캐시는 저장된 응답을 복사하지 않고 반환하며, 모델 객체는 응답을 수정하지 않습니다.
+def test_memory_cache_shared_response():
+    body = {
+        "result": 0,
+        "return_object": {
+            "sentence": [{"id": 0, "text": "윤동주", "morp": [], "word": []}]
+        },
+    }
+    adapter = FakeAdapter(json.dumps(body).encode())
+    with SyncEtriRequest("key", cache=MemoryCache()) as client:
+        client.adapter = adapter
+        first = client.request("POST", "/WiseNLU", {"text": "윤동주"})
+        snapshot = copy.deepcopy(first)
+        analysis = AnalysisResult(data=first, **first["return_object"])
+        assert [sentence.text for sentence in analysis.Sentence] == ["윤동주"]
+        assert client.request("POST", "/WiseNLU", {"text": "윤동주"}) is first
+    assert first == snapshot
+
+
+# 압축된 크기의 합이 한도를 넘으면 가장 오래 사용하지 않은 항목부터 지웁니다.
+def test_disk_cache_eviction(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("time.time", lambda: now[0])
+    value = {"result": 0, "text": "윤동주" * 50}
+    cache = DiskCache(str(tmp_path / "cache.db"), memory_bytes=0)
+    cache.put("/WiseNLU", "probe", value, 0)
+    limit = cache.size * 2
+    cache.close()
+
+    cache = DiskCache(str(tmp_path / "evict.db"), max_bytes=limit, memory_bytes=0)
+    try:
+        for key in "abc":
+            now[0] += DiskCache._TOUCH_INTERVAL
+            cache.put("/WiseNLU", key, value, 0)
+            if key == "b":
+                now[0] += DiskCache._TOUCH_INTERVAL
+                assert cache.get("/WiseNLU", "a") == value
+        assert "a" in cache and "b" not in cache and "c" in cache
+        assert cache.evictions == 1
+        assert cache.size <= limit
+    finally:
+        cache.close()
+
+
+# 다른 프로세스처럼 파일을 새로 열어도 저장된 응답을 읽고, 만료된 항목은 지웁니다.
+def test_disk_cache_persistent(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("time.time", lambda: now[0])
+    path = str(tmp_path / "cache.db")
+    cache = DiskCache(path, ttl=10)
+    cache.put("/WiseNLU", "a", {"result": 0, "text": "윤동주"}, 0)
+    cache.close()
+
+    cache = DiskCache(path, ttl=10)
+    try:
+        assert cache.get("/WiseNLU", "a") == {"result": 0, "text": "윤동주"}
+        now[0] += 10
+        assert cache.memory.pop("a") is not None
+        assert cache.get("/WiseNLU", "a") is None
+        assert cache.expirations == 1
+    finally:
+        cache.close()
+
+
+# 같은 내용의 파일은 경로가 달라도 같은 `file_id`를 쓰고, 내용이 바뀌면 다시 해시합니다.
+def test_file_id_cache(tmp_path, monkeypatch):
+    video, copy = tmp_path / "video.mp4", tmp_path / "copy.mp4"
+    video.write_bytes(b"video")
+    copy.write_bytes(b"video")
+    path = str(tmp_path / "file_ids.json")
+    file_ids = FileIdCache(path)
+    assert file_ids.get(str(video)) is None
+    file_ids.put(str(video), "file-1")
+    assert file_ids.get(str(copy)) == "file-1"
+
+    # 크기와 수정 시각이 같으면 해시를 다시 계산하지 않습니다.
+    hashed = []
+    sha256 = hashlib.sha256
+    monkeypatch.setattr("hashlib.sha256", lambda: hashed.append(1) or sha256())
+    assert file_ids.get(str(video)) == "file-1"
+    assert hashed == []
+
+    video.write_bytes(b"other video")
+    assert file_ids.get(str(video)) is None
+    assert hashed == [1]
+    file_ids = FileIdCache(path)
+    assert len(file_ids) == 1
+    assert file_ids.get(str(copy)) == "file-1"
+    file_ids.discard(str(copy))
+    assert len(FileIdCache(path)) == 0
+
+
+# 서버에서 만료된 `file_id`는 실행기에서 지우고 한 번 다시 업로드합니다.
+@pytest.mark.asyncio
+async def test_video_parse_expired_file_id(tmp_path, monkeypatch):
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"video")
+    file_ids = FileIdCache(str(tmp_path / "file_ids.json"))
+    file_ids.put(str(video), "expired")
+    uploads, parses = [], []
+
+    async def video_upload(video_path, deadline=None):
+        uploads.append(video_path)
+        return "file-2"
+
+    async def video_parse(file_id, deadline=None):
+        parses.append(file_id)
+        if file_id == "expired":
+            raise VisualVideoException("expired")
+        return []
+
+    async with VideoClient("key", file_ids=file_ids) as client:
+        monkeypatch.setattr(client, "video_upload", video_upload)
+        monkeypatch.setattr(client, "video_parse", video_parse)
+        assert await client.video_parse_for_path(str(video)) == []
+    assert (uploads, parses) == ([str(video)], ["expired", "file-2"])
+    assert file_ids.get(str(video)) == "file-2"
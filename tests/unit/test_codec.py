@@ -0,0 +1,46 @@
+import pickle
+
+from etripy.codec import JSONCodec, analysis_fields, decode_pieces
+
+
+def _assemble(head: bytes, pieces: list) -> dict:
+    result = pickle.loads(head)
+    for piece in pieces:
+        result["return_object"]["sentence"].extend(pickle.loads(piece))
+    return result
+
+
+def _response(count: int) -> dict:
+    sentences = [
+        {"id": i, "text": f"문장{i}", "morp": [{"id": 0}], "NE": [], "SRL": [{}]}
+        for i in range(count)
+    ]
+    return {"result": 0, "return_object": {"sentence": sentences, "entity": []}}
+
+
+# 문장 목록을 `piece_size`개씩 나눈 조각을 다시 이으면 원래 응답과 같습니다.
+def test_decode_pieces():
+    codec = JSONCodec()
+    body = codec.dumps(_response(10))
+    head, pieces = decode_pieces(codec, body, piece_size=4)
+    assert [len(pickle.loads(piece)) for piece in pieces] == [4, 4, 2]
+    assert pickle.loads(head)["return_object"] == {"sentence": [], "entity": []}
+    assert _assemble(head, pieces) == _response(10)
+
+
+# `fields`에 없는 문장 필드는 조각에 담지 않습니다.
+def test_decode_pieces_fields():
+    codec = JSONCodec()
+    head, pieces = decode_pieces(
+        codec, codec.dumps(_response(3)), fields=analysis_fields(["morp"])
+    )
+    sentences = _assemble(head, pieces)["return_object"]["sentence"]
+    assert [sorted(sentence) for sentence in sentences] == [["id", "morp", "text"]] * 3
+
+
+# 문장 목록이 없는 응답은 조각 없이 통째로 반환합니다.
+def test_decode_pieces_without_sentences():
+    codec = JSONCodec()
+    for response in ({"result": -1, "reason": "error"}, [1, 2]):
+        head, pieces = decode_pieces(codec, codec.dumps(response))
+        assert (pickle.loads(head), pieces) == (response, [])
@@ -0,0 +1,66 @@
+import pickle
+import sys
+from dataclasses import FrozenInstanceError
+
+import etripy.model.language as language
+import pytest
+from etripy.model.language import AnalysisResult, CompactSentence, compact_sentences
+
+SENTENCE = {
+    "id": 0,
+    "text": "윤동주는 시인이다.",
+    "morp": [
+        {"id": 0, "lemma": "윤동주", "type": "NNP", "position": 0, "weight": 0.9},
+        {"id": 1, "lemma": "는", "type": "JX", "position": 9, "weight": 0.8},
+    ],
+    "word": [{"id": 0, "text": "윤동주는", "type": "", "begin": 0, "end": 1}],
+    "NE": [{"id": 0, "text": "윤동주", "type": "PS_NAME", "begin": 0, "end": 0}],
+    "dependency": [
+        {
+            "id": 0,
+            "text": "윤동주는",
+            "head": 1,
+            "label": "NP_SBJ",
+            "mod": [],
+            "weight": 0.7,
+        }
+    ],
+    "SRL": [
+        {
+            "verb": "이",
+            "sense": 1,
+            "word_id": 1,
+            "weight": 0.5,
+            "argument": [{"type": "ARG1", "word_id": 0, "text": "윤동주는"}],
+        }
+    ],
+}
+
+
+# pickle로 프로세스 사이에 주고받아도 값과 문자열 공유가 유지됩니다.
+def test_pickle():
+    (sentence,) = compact_sentences(AnalysisResult(data={}, sentence=[SENTENCE]))
+    restored = pickle.loads(pickle.dumps(sentence, pickle.HIGHEST_PROTOCOL))
+    assert restored == sentence
+    assert restored.Morp == sentence.Morp
+    assert restored.Srl[0].Argument[0].type == "ARG1"
+    assert restored.dependency[0].mod == ()
+    tag = "".join(["N", "NP"])
+    assert restored.Morp[0].type is sys.intern(tag)
+
+
+# 인스턴스는 바꿀 수 없고 `__dict__`가 없습니다.
+def test_frozen():
+    sentence = CompactSentence(SENTENCE)
+    with pytest.raises(FrozenInstanceError):
+        sentence.text = ""
+    with pytest.raises(FrozenInstanceError):
+        sentence.Morp[0].lemma = ""
+    assert not hasattr(sentence.Morp[0], "__dict__")
+
+
+# `etripy.model.language`에는 `Compact*` 이름만 내보냅니다.
+def test_exports():
+    assert "CompactMorp" in language.__dict__
+    assert "Morp" not in language.__dict__
+    assert "sys" not in language.__dict__
@@ -0,0 +1,86 @@
+import pytest
+from etripy.document import PackPolicy, merge_analysis, pack_spans, split_analysis
+from etripy.model.language import AnalysisResult
+from etripy.sync.language import AnalysisClient
+
+
+def _sentence(number: int, ids: range, position: int = 0) -> dict:
+    return {
+        "id": number,
+        "morp": [{"id": i, "position": position + i} for i in ids],
+        "word": [{"id": i, "begin": i, "end": i} for i in ids],
+    }
+
+
+def _result(*sentences: dict) -> dict:
+    return {"result": 0, "return_object": {"sentence": list(sentences)}}
+
+
+# ID가 문서 전체에서 이어지는지는 문장이 여러 개인 조각으로 한 번만 정하고 모든 조각에 적용합니다.
+def test_merge_analysis_id_scope():
+    merged = merge_analysis(
+        [
+            (0, _result(_sentence(0, range(3)))),
+            (10, _result(_sentence(0, range(3)))),
+            (20, _result(_sentence(0, range(2)), _sentence(1, range(2, 4)))),
+        ]
+    )
+    sentences = merged["return_object"]["sentence"]
+    assert [sentence["id"] for sentence in sentences] == [0, 1, 2, 3]
+    ids = [[morp["id"] for morp in sentence["morp"]] for sentence in sentences]
+    assert ids == [[0, 1, 2], [3, 4, 5], [6, 7], [8, 9]]
+    assert [word["begin"] for word in sentences[3]["word"]] == [8, 9]
+    assert [morp["position"] for morp in sentences[1]["morp"]] == [10, 11, 12]
+
+
+# 문장마다 ID가 0부터 시작하는 응답은 ID를 옮기지 않습니다.
+def test_merge_analysis_sentence_scope():
+    merged = merge_analysis(
+        [
+            (0, _result(_sentence(0, range(3)))),
+            (10, _result(_sentence(0, range(2)), _sentence(1, range(2)))),
+            (20, None),
+        ]
+    )
+    sentences = merged["return_object"]["sentence"]
+    ids = [[morp["id"] for morp in sentence["morp"]] for sentence in sentences]
+    assert ids == [[0, 1, 2], [0, 1], [0, 1]]
+
+
+# 묶어서 분석한 응답을 텍스트별로 나누고 ID와 position을 각 텍스트 기준으로 다시 매깁니다.
+def test_split_analysis():
+    _, spans = pack_spans(["가나", "다라"])
+    parts = split_analysis(
+        _result(_sentence(0, range(2)), _sentence(1, range(2, 4), spans[1][0] - 2)),
+        spans,
+    )
+    assert [part["return_object"]["sentence"][0]["id"] for part in parts] == [0, 0]
+    morp = parts[1]["return_object"]["sentence"][0]["morp"]
+    assert [(item["id"], item["position"]) for item in morp] == [(0, 0), (1, 1)]
+
+
+# 문장이 경계 문자열에 걸치거나 문장을 받지 못한 텍스트가 있으면 나누지 않습니다.
+def test_split_analysis_mismatch():
+    _, spans = pack_spans(["가나", "다라"])
+    with pytest.raises(ValueError):
+        split_analysis(_result(_sentence(0, range(2), spans[0][1])), spans)
+    with pytest.raises(ValueError):
+        split_analysis(_result(_sentence(0, range(2))), spans)
+
+
+# 묶음 응답을 나눌 수 없으면 텍스트별로 다시 요청합니다.
+def test_analysis_batch_fallback(monkeypatch):
+    requests = []
+
+    def analysis(text, *args, **kwargs):
+        requests.append(text)
+        data = _result(_sentence(0, range(2)))
+        return AnalysisResult(data=data, **data["return_object"])
+
+    with AnalysisClient("key") as client:
+        monkeypatch.setattr(client, "analysis", analysis)
+        batch = [(0, "가나"), (1, "다라")]
+        items = client._analysis_batch(batch, "morp", False, PackPolicy(), None, None)
+    assert requests == ["가나\n\n다라", "가나", "다라"]
+    assert [item.index for item in items] == [0, 1]
+    assert all(item.error is None and item.result is not None for item in items)
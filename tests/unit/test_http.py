@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+from etripy.error import DeadlineExceededException
+from etripy.http import EtriRequest
+from etripy.policy import Deadline
+from etripy.sync.http import SyncEtriRequest
+
+
+# 같은 요청을 동시에 여러 번 호출해도 실제로는 한 번만 보냅니다.
+@pytest.mark.asyncio
+async def test_coalesce(monkeypatch):
+    deadlines = []
+
+    async def send(endpoint, method, url, deadline, **kwargs):
+        deadlines.append(deadline)
+        await asyncio.sleep(0.01)
+        return {"result": 0}
+
+    async with EtriRequest("key", coalesce=True) as client:
+        monkeypatch.setattr(client, "_send", send)
+        results = await asyncio.gather(
+            *(client.request("POST", "/WiseNLU", {"text": "윤동주"}) for _ in range(5))
+        )
+    assert results == [{"result": 0}] * 5
+    assert (deadlines, client.coalesced) == ([None], 4)
+
+
+# 공유한 요청은 먼저 호출한 쪽의 `deadline`과 상관없이 진행되고,
+# 각 호출의 `deadline`은 응답을 기다리는 시간에만 적용됩니다.
+@pytest.mark.asyncio
+async def test_coalesce_deadlines(monkeypatch):
+    sent = []
+
+    async def send(endpoint, method, url, deadline, **kwargs):
+        sent.append(deadline)
+        await asyncio.sleep(0.05)
+        return {"result": 0}
+
+    async with EtriRequest("key", coalesce=True) as client:
+        monkeypatch.setattr(client, "_send", send)
+        short = client.request("POST", "/WiseNLU", {"text": "윤동주"}, deadline=0.01)
+        long = client.request("POST", "/WiseNLU", {"text": "윤동주"}, deadline=1)
+        results = await asyncio.gather(short, long, return_exceptions=True)
+    assert isinstance(results[0], DeadlineExceededException)
+    assert results[1] == {"result": 0}
+    assert sent == [None]
+
+
+# 기다리는 호출이 모두 떠나면 공유한 요청을 취소합니다.
+@pytest.mark.asyncio
+async def test_coalesce_abandoned(monkeypatch):
+    cancelled = []
+
+    async def send(endpoint, method, url, deadline, **kwargs):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async with EtriRequest("key", coalesce=True) as client:
+        monkeypatch.setattr(client, "_send", send)
+        with pytest.raises(DeadlineExceededException):
+            await client.request("POST", "/WiseNLU", {"text": "윤동주"}, deadline=0.01)
+        await asyncio.sleep(0)
+        assert cancelled == [True]
+        assert client._inflight[asyncio.get_running_loop()] == {}
+
+
+# 세션은 이벤트 루프마다 하나를 다시 사용하고, 루프가 바뀌면 이전 세션을 닫습니다.
+def test_session_per_loop(recwarn):
+    client = EtriRequest("key")
+
+    async def session():
+        session = client.session
+        assert client.session is session
+        await asyncio.sleep(0)
+        return session
+
+    first = asyncio.run(session())
+    second = asyncio.run(session())
+    assert first is not second
+    assert first.closed and not second.closed
+    asyncio.run(client.aclose())
+    assert second.closed
+    assert not [w for w in recwarn if "Unclosed" in str(w.message)]
+
+
+# 시간 제한을 전달하지 않으면 동기/비동기 클라이언트 모두 같은 기본값을 사용합니다.
+def test_default_timeouts():
+    client = EtriRequest("key")
+    with SyncEtriRequest("key") as sync_client:
+        assert sync_client._timeout(None) == (
+            client.timeout.sock_connect,
+            client.timeout.total,
+        )
+        assert sync_client._timeout(Deadline.after(10)) == pytest.approx((10, 10))
+    with SyncEtriRequest("key", connect_timeout=5, read_timeout=60) as sync_client:
+        assert sync_client._timeout(None) == (5, 60)
@@ -0,0 +1,49 @@
+import asyncio
+
+import pytest
+from etripy.client.language import AnalysisClient
+from etripy.model import BatchItem
+
+
+def _client(monkeypatch, produced: list) -> AnalysisClient:
+    client = AnalysisClient("key")
+
+    async def analysis_batch(batch, *args):
+        produced.extend(index for index, _ in batch)
+        await asyncio.sleep(0)
+        return [BatchItem(index=index, input=text) for index, text in batch]
+
+    monkeypatch.setattr(client, "_analysis_batch", analysis_batch)
+    return client
+
+
+# 소비하는 쪽이 느리면 작업자도 대기열 크기만큼만 앞서 나갑니다.
+@pytest.mark.asyncio
+async def test_analysis_stream_backpressure(monkeypatch):
+    produced = []
+    async with _client(monkeypatch, produced) as client:
+        consumed = 0
+        async for _ in client.analysis_stream(
+            map(str, range(100)), "morp", concurrency=4
+        ):
+            consumed += 1
+            await asyncio.sleep(0.001)
+            assert len(produced) - consumed <= 2 * 4
+        assert consumed == 100
+
+
+# 스트림을 중간에 닫으면 작업자가 멈추지 않고 모두 취소됩니다.
+@pytest.mark.asyncio
+async def test_analysis_stream_close(monkeypatch):
+    produced = []
+    async with _client(monkeypatch, produced) as client:
+        stream = client.analysis_stream(map(str, range(100)), "morp", concurrency=2)
+        async for _ in stream:
+            break
+        await stream.aclose()
+        await asyncio.sleep(0.01)
+        assert len(produced) < 10
+        tasks = [
+            task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+        ]
+        assert tasks == []
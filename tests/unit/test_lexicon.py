@@ -0,0 +1,75 @@
+import os
+
+import pytest
+from etripy.lexicon import LexiconStore
+
+
+def _result(word: str) -> dict:
+    return {"result": 0, "return_object": {"WWN WordInfo": [{"Word": word}]}}
+
+
+# 저장한 응답은 파일을 닫았다가 다시 열어도 그대로 찾을 수 있습니다.
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "lexicon.bin")
+    with LexiconStore(path) as store:
+        store.put("word", "사과", _result("사과"))
+        store.put("polysemy", "사과", _result("사과"), homonym_code="01")
+        store.put("homonym", "배", {"result": -1, "reason": "error"})
+        assert store.get("word", "사과") == _result("사과")
+    assert os.path.getsize(path + ".log") == 0
+
+    with LexiconStore(path) as store:
+        assert len(store) == 2
+        assert store.get("word", "사과") == _result("사과")
+        assert store.get("polysemy", "사과", "01") == _result("사과")
+        assert store.get("polysemy", "사과") is None
+        assert ("homonym", "배", None) not in store
+        with pytest.raises(ValueError):
+            store.get("sentence", "사과")
+
+
+# 합치기 전에 종료되어도 로그에 남은 응답을 다시 읽고, 기록하다 중단된 항목은 무시합니다.
+def test_log_replay(tmp_path):
+    path = str(tmp_path / "lexicon.bin")
+    store = LexiconStore(path)
+    store.put("word", "사과", _result("사과"))
+    store.put("word", "배", _result("배"))
+    assert not os.path.exists(path)
+    with open(path + ".log", "ab") as log:
+        log.write(b"\x10\x00\x00")
+
+    with LexiconStore(path) as other:
+        assert len(other) == 2
+        assert other.get("word", "배") == _result("배")
+    store.close()
+    with LexiconStore(path) as store:
+        assert len(store) == 2
+
+
+# 로그가 사전 파일보다 커질 때만 합치므로 파일을 다시 쓰는 횟수는 로그 수준으로 늘어납니다.
+def test_autosave(tmp_path, monkeypatch):
+    path = str(tmp_path / "lexicon.bin")
+    writes = []
+    store = LexiconStore(path, autosave=4)
+    write = store._write
+
+    def counted(records):
+        writes.append(len(records))
+        write(records)
+
+    monkeypatch.setattr(store, "_write", counted)
+    for i in range(64):
+        store.put("word", f"어휘{i}", _result(f"어휘{i}"))
+    assert writes == [4, 8, 16, 32, 64]
+    store.close()
+    with LexiconStore(path) as store:
+        assert len(store) == 64
+
+
+# 비동기 클라이언트에서는 실행기에서 읽고 씁니다.
+@pytest.mark.asyncio
+async def test_async(tmp_path):
+    with LexiconStore(str(tmp_path / "lexicon.bin")) as store:
+        await store.aput("homonym", "배", _result("배"))
+        assert await store.aget("homonym", "배") == _result("배")
+        assert await store.aget("homonym", "사과") is None
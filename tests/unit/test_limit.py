@@ -0,0 +1,207 @@
+import asyncio
+
+import pytest
+from etripy.error import DeadlineExceededException, KeyPoolExhaustedException
+from etripy.http import EtriRequest
+from etripy.limit import ConcurrencyLimiter, KeyPool, RateLimiter, TokenBucket
+from etripy.policy import Deadline
+from etripy.sync.http import SyncEtriRequest
+
+
+async def _peak(limiter: ConcurrencyLimiter, count: int, endpoint: str = "/WiseNLU"):
+    running = peak = 0
+
+    async def call():
+        nonlocal running, peak
+        async with limiter.acquire(endpoint):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(call() for _ in range(count)))
+    return peak
+
+
+# 동시 요청 수 제한
+@pytest.mark.asyncio
+async def test_concurrency_limit():
+    limiter = ConcurrencyLimiter(max_concurrency=2, endpoint_limits={"/WiseNLU": 1})
+    assert await _peak(limiter, 6) == 1
+    assert await _peak(limiter, 6, "/ObjectDetect") == 2
+
+
+# 같은 키를 공유하는 클라이언트가 같은 제한 값으로 만들어져도 진행 중인 요청을 계속 셉니다.
+@pytest.mark.asyncio
+async def test_shared_same_limits():
+    running = peak = 0
+
+    async def call(limiter: ConcurrencyLimiter):
+        nonlocal running, peak
+        async with limiter.acquire("/WiseNLU"):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    first = ConcurrencyLimiter.shared("test-shared", max_concurrency=2)
+    tasks = [asyncio.ensure_future(call(first)) for _ in range(4)]
+    await asyncio.sleep(0)
+    second = ConcurrencyLimiter.shared("test-shared", max_concurrency=2)
+    assert second is first
+    await asyncio.gather(*tasks, *(call(second) for _ in range(4)))
+    assert peak == 2
+
+
+# 다른 제한 값은 진행 중인 자리의 크기를 그 자리에서 바꿉니다.
+@pytest.mark.asyncio
+async def test_configure_resizes_in_place():
+    limiter = ConcurrencyLimiter(max_concurrency=3)
+    running = peak = 0
+    release = asyncio.Event()
+
+    async def call():
+        nonlocal running, peak
+        async with limiter.acquire("/WiseNLU"):
+            running += 1
+            peak = max(peak, running)
+            await release.wait()
+            running -= 1
+
+    tasks = [asyncio.ensure_future(call()) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    limiter.configure(max_concurrency=1)
+    late = [asyncio.ensure_future(call()) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    assert running == 3
+    peak = 0
+    release.set()
+    await asyncio.gather(*tasks, *late)
+    assert peak == 1
+
+
+# 자리를 기다리다 취소되어도 자리가 새지 않습니다.
+@pytest.mark.asyncio
+async def test_cancelled_waiter():
+    limiter = ConcurrencyLimiter(max_concurrency=1)
+    async with limiter.acquire("/WiseNLU"):
+        waiter = asyncio.ensure_future(_peak(limiter, 1))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+    assert await _peak(limiter, 3) == 1
+
+
+# 토큰 버킷은 `burst`개까지 바로 내주고 그 뒤로는 `rate`에 맞춰 기다리게 합니다.
+def test_token_bucket():
+    bucket = TokenBucket(10, 2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert 0 < bucket.reserve() <= 0.1
+    bucket.pause(5)
+    assert bucket.reserve() > 4
+
+
+# 마감 시각 안에 토큰을 받을 수 없어 요청하지 않으면 예약한 토큰을 돌려줍니다.
+def test_rate_limiter_deadline_refund(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("time.monotonic", lambda: now[0])
+    limiter = RateLimiter(default_rate=(1, 1))
+    limiter.wait_sync("key", "/WiseNLU")
+    for _ in range(3):
+        with pytest.raises(DeadlineExceededException):
+            limiter.wait_sync("key", "/WiseNLU", Deadline.after(0.5))
+    now[0] = 1.0
+    assert limiter.bucket("key", "/WiseNLU").reserve() == 0
+
+
+# 엔드포인트에 따로 지정한 속도는 같은 분류의 다른 엔드포인트와 버킷을 나누지 않습니다.
+def test_rate_limiter_bucket_scope():
+    limiter = RateLimiter(rates={"language": (5, 5), "/WiseNLU": (1, 1)})
+    nlu = limiter.bucket("key", "/WiseNLU")
+    spoken = limiter.bucket("key", "/WiseNLU_spoken")
+    assert nlu is not spoken
+    assert (nlu.rate, spoken.rate) == (1, 5)
+    assert limiter.bucket("key", "/WiseNLU") is nlu
+    assert limiter.bucket("key", "/WiseNLU_spoken") is spoken
+    assert limiter.bucket("other", "/WiseNLU") is not nlu
+
+
+# 입력 때문에 생긴 오류는 사용량 초과로 보지 않고 호출도 멈추지 않습니다.
+def test_rate_limiter_quota():
+    limiter = RateLimiter(quota_pause=5)
+    for reason in ("text length exceeded", "허용 길이 초과", "request body limit"):
+        assert not limiter.throttled("key", "/WiseNLU", 200, _error(reason))
+    assert limiter.bucket("key", "/WiseNLU").reserve() == 0
+    assert not limiter.throttled("key", "/WiseNLU", 200, {"result": 0})
+    assert limiter.throttled("key", "/WiseNLU", 200, _error("Daily limit exceeded"))
+    assert limiter.bucket("key", "/WiseNLU").reserve() > 4
+    assert limiter.throttled("key", "/ObjectDetect", 429)
+    assert limiter.is_quota_error(_error("일일 사용량을 초과하였습니다."))
+
+
+def _error(reason: str) -> dict:
+    return {"result": -1, "reason": reason}
+
+
+# 남은 사용량이 많은 키를 먼저 쓰고, 소진된 키는 건너뜁니다.
+def test_key_pool():
+    pool = KeyPool(["a", "b"], daily_quota={"a": 1, "b": 10})
+    assert pool.acquire() == "b"
+    pool.release("b")
+    pool.exhaust("b")
+    assert pool.available == 1
+    with pool.lease() as key:
+        assert key == "a"
+    with pytest.raises(KeyPoolExhaustedException):
+        pool.acquire()
+
+
+# 사용량 소진은 HTTP 200 응답의 `reason`으로만 판별합니다.
+def test_key_pool_quota_error():
+    pool = KeyPool(["a"])
+    assert pool.is_quota_error(_error("Daily limit exceeded"))
+    assert not pool.is_quota_error(_error("Daily limit exceeded"), 500)
+    assert not pool.is_quota_error(_error("text length exceeded"))
+    assert not pool.is_quota_error({"result": 0, "reason": "Daily limit exceeded"})
+
+
+# 두 번째 키도 같은 이유로 실패하면 나머지 키를 소진시키지 않고 오류 응답을 반환합니다.
+def test_key_pool_no_cascade(monkeypatch):
+    pool = KeyPool(["a", "b", "c"])
+    client = SyncEtriRequest(pool)
+    keys = []
+
+    def send_once(endpoint, method, url, deadline, headers, **kwargs):
+        keys.append(headers["Authorization"])
+        return _error("Daily limit exceeded")
+
+    monkeypatch.setattr(client, "_send_once", send_once)
+    try:
+        result = client._send("/WiseNLU", "POST", "", None, {})
+    finally:
+        client.close()
+    assert result == _error("Daily limit exceeded")
+    assert len(keys) == 2
+    assert pool.available == 2
+
+
+# 두 키가 모두 사용량 소진으로 응답하면 오류 응답 대신 `KeyPoolExhaustedException`이 발생합니다.
+@pytest.mark.asyncio
+async def test_key_pool_all_exhausted(monkeypatch):
+    pool = KeyPool(["a", "b"])
+    keys = []
+
+    async def send_once(endpoint, method, url, deadline, headers, **kwargs):
+        keys.append(headers["Authorization"])
+        return _error("Daily limit exceeded")
+
+    async with EtriRequest(pool) as client:
+        monkeypatch.setattr(client, "_send_once", send_once)
+        with pytest.raises(KeyPoolExhaustedException, match="Daily limit exceeded"):
+            await client._send("/WiseNLU", "POST", "", None, {})
+    assert sorted(keys) == ["a", "b"]
+    assert pool.available == 0
+    with pytest.raises(KeyPoolExhaustedException):
+        pool.acquire()
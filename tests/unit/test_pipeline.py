@@ -0,0 +1,64 @@
+import base64
+import json
+
+import pytest
+from etripy.client.visual import ImageClient
+from etripy.pipeline import JsonlSink, Pipeline, Sink
+
+
+# 결과마다 한 줄씩 쓰고, 실패한 항목은 `error`에 예외를 씁니다.
+@pytest.mark.asyncio
+async def test_jsonl_sink(tmp_path):
+    path = tmp_path / "result.jsonl"
+    count = await Pipeline(["1", "2", "x"]).map(int).run(JsonlSink(str(path)))
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert count == 3
+    assert [line["result"] for line in lines] == [1, 2, None]
+    assert lines[2]["error"].startswith("ValueError")
+
+
+# `write`를 구현하지 않은 출력은 만들 수 없습니다.
+def test_sink_abstract():
+    class Incomplete(Sink):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+# 객체 검출 단계는 이미지 파일을 실행기에서 읽어 요청합니다.
+@pytest.mark.asyncio
+async def test_object_detect_stage(tmp_path, monkeypatch):
+    image = tmp_path / "image.jpg"
+    image.write_bytes(b"image")
+    requests = []
+
+    async def request(method, endpoint, data, deadline=None):
+        requests.append(data["argument"])
+        return {"result": 0, "return_object": {"data": []}}
+
+    async with ImageClient("key") as client:
+        monkeypatch.setattr(client, "request", request)
+        items = [item async for item in Pipeline([str(image)]).object_detect(client)]
+    assert [item.result for item in items] == [[]]
+    assert requests == [{"type": "jpg", "file": base64.b64encode(b"image").decode()}]
+
+
+# 업로드할 파일은 실행기에서 읽고 파일 이름을 그대로 보냅니다.
+@pytest.mark.asyncio
+async def test_file_upload(tmp_path, monkeypatch):
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"video")
+    forms = []
+
+    async def request_file_upload(data, deadline=None):
+        forms.append(data)
+        return {"result": 0}
+
+    async with ImageClient("key") as client:
+        monkeypatch.setattr(client, "request_file_upload", request_file_upload)
+        assert await client.file_upload(str(video)) == {"result": 0}
+    upload = [field for field in forms[0]._fields if field[0]["name"] == "uploadfile"]
+    assert [(field[0]["filename"], field[2]) for field in upload] == [
+        ("video.mp4", b"video")
+    ]
@@ -0,0 +1,188 @@
+import asyncio
+
+import pytest
+from etripy.error import (
+    CircuitOpenException,
+    DeadlineExceededException,
+    HTTPClientException,
+    HTTPConnectionException,
+    HTTPServerException,
+    HTTPStatusException,
+    HTTPTimeoutException,
+    HTTPTooManyRequestsException,
+)
+from etripy.http import EtriRequest
+from etripy.policy import CircuitBreaker, HedgePolicy, RetryPolicy
+from etripy.sync.http import SyncEtriRequest
+
+
+# 상태 코드별 예외 종류와 재시도 여부
+def test_retry_taxonomy():
+    assert type(HTTPStatusException.from_status(429)) is HTTPTooManyRequestsException
+    assert type(HTTPStatusException.from_status(404)) is HTTPClientException
+    assert type(HTTPStatusException.from_status(503)) is HTTPServerException
+    policy = RetryPolicy(max_attempts=3)
+    for error in (
+        HTTPStatusException.from_status(429),
+        HTTPStatusException.from_status(503),
+        HTTPConnectionException(),
+        HTTPTimeoutException(),
+    ):
+        assert policy.delay(error, 1, 0) is not None
+    assert policy.delay(HTTPStatusException.from_status(400), 1, 0) is None
+    assert policy.delay(ValueError(), 1, 0) is None
+    assert policy.delay(HTTPTimeoutException(), 3, 0) is None
+
+
+# 대기 시간은 `0 ~ min(max_delay, base_delay * 2^n)` 범위이고, 전체 시간 예산을 넘지 않습니다.
+def test_retry_backoff(monkeypatch):
+    policy = RetryPolicy(max_attempts=10, base_delay=1, max_delay=5)
+    monkeypatch.setattr("random.uniform", lambda low, high: high)
+    assert [policy.backoff(attempt) for attempt in range(1, 6)] == [1, 2, 4, 5, 5]
+    policy = RetryPolicy(max_attempts=10, base_delay=1, total_timeout=3)
+    monkeypatch.setattr("time.monotonic", lambda: 100.0)
+    assert policy.delay(HTTPTimeoutException(), 2, 98.0) is None
+    assert policy.delay(HTTPTimeoutException(), 1, 99.0) == 1
+
+
+def _client(monkeypatch, errors, **kwargs):
+    client = SyncEtriRequest("key", **kwargs)
+    calls = []
+
+    def send_once(endpoint, method, url, deadline, **kwargs):
+        calls.append(endpoint)
+        if errors:
+            raise errors.pop(0)
+        return {"result": 0}
+
+    monkeypatch.setattr(client, "_send_once", send_once)
+    return client, calls
+
+
+# 일시적인 오류만 다시 요청합니다.
+def test_retry_send(monkeypatch):
+    retry = RetryPolicy(max_attempts=3, base_delay=0)
+    errors = [HTTPStatusException.from_status(503), HTTPTimeoutException()]
+    client, calls = _client(monkeypatch, errors, retry=retry)
+    with client:
+        assert client._send("/WiseNLU", "POST", "", None, {}) == {"result": 0}
+    assert len(calls) == 3
+
+    errors = [HTTPStatusException.from_status(400)]
+    client, calls = _client(monkeypatch, errors, retry=retry)
+    with client, pytest.raises(HTTPClientException):
+        client._send("/WiseNLU", "POST", "", None, {})
+    assert len(calls) == 1
+
+
+# 표본이 모이기 전에는 `initial_delay`를, 그 뒤에는 최근 응답 시간의 분위수를 기다립니다.
+def test_hedge_delay():
+    hedge = HedgePolicy(percentile=0.9, initial_delay=2, min_samples=10, window=10)
+    assert hedge.applies("/WiseNLU") and not hedge.applies("/VideoParse")
+    for latency in range(20):
+        hedge.record("/WiseNLU", latency / 10)
+    assert hedge.delay("/WiseNLU") == 1.9
+    assert hedge.delay("/WiseNLU_spoken") == 2
+
+
+# 대기 시간은 최근 응답 시간을 정렬한 뒤 `percentile` 위치의 값입니다.
+def test_hedge_percentile():
+    hedge = HedgePolicy(percentile=0.95, initial_delay=3, min_samples=51)
+    for latency in range(100, 50, -1):
+        hedge.record("/WiseNLU", latency)
+    assert hedge.delay("/WiseNLU") == 3
+    for latency in range(1, 51):
+        hedge.record("/WiseNLU", latency)
+    assert hedge.delay("/WiseNLU") == 96
+    hedge.percentile = 1.0
+    assert hedge.delay("/WiseNLU") == 100
+
+
+# 첫 요청이 늦으면 추가 요청의 응답을 사용하고 늦은 요청은 취소합니다.
+@pytest.mark.asyncio
+async def test_hedge_send(monkeypatch):
+    hedge = HedgePolicy(initial_delay=0.01)
+    cancelled = []
+
+    async def send_once(endpoint, method, url, deadline, **kwargs):
+        if not cancelled:
+            cancelled.append(False)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled[0] = True
+                raise
+        return {"result": 0}
+
+    async with EtriRequest("key", hedge=hedge) as client:
+        monkeypatch.setattr(client, "_send_once", send_once)
+        result = await client._send_hedged("key", "/WiseNLU", "POST", "", None)
+    await asyncio.sleep(0)
+    assert result == {"result": 0}
+    assert (hedge.requests, hedge.hedged, hedge.hedge_wins) == (1, 1, 1)
+    assert cancelled == [True]
+    # 추가 요청의 응답 시간과, 취소되기 전까지 걸린 첫 요청의 시간을 함께 기록합니다.
+    hedged, primary = hedge._latencies["/WiseNLU"]
+    assert hedged < 0.01 <= primary
+
+
+# 추가 요청의 비율이 `max_hedge_rate`에 이르면 첫 요청의 응답을 기다립니다.
+@pytest.mark.asyncio
+async def test_hedge_rate_limit(monkeypatch):
+    hedge = HedgePolicy(initial_delay=0, max_hedge_rate=0.5)
+    calls = []
+
+    async def send_once(endpoint, method, url, deadline, **kwargs):
+        calls.append(endpoint)
+        await asyncio.sleep(0.01)
+        return {"result": 0}
+
+    async with EtriRequest("key", hedge=hedge) as client:
+        monkeypatch.setattr(client, "_send_once", send_once)
+        for _ in range(4):
+            await client._send_hedged("key", "/WiseNLU", "POST", "", None)
+    assert (hedge.requests, hedge.hedged) == (4, 2)
+    assert len(calls) == 6
+    assert hedge.hedge_rate == 0.5
+
+
+# 연속 실패로 열린 서킷은 `recovery_timeout` 뒤 시험 요청 하나만 허용하고, 성공하면 다시 닫힙니다.
+def test_circuit_breaker(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+    breaker.record("/WiseNLU", HTTPTimeoutException())
+    breaker.record("/WiseNLU")
+    breaker.record("/WiseNLU", HTTPTimeoutException())
+    assert breaker.state("/WiseNLU") == CircuitBreaker.CLOSED
+    breaker.record("/WiseNLU", HTTPStatusException.from_status(503))
+    assert breaker.state("/WiseNLU") == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenException):
+        breaker.before_call("/WiseNLU")
+    breaker.before_call("/ObjectDetect")
+
+    now[0] = 10.0
+    assert breaker.state("/WiseNLU") == CircuitBreaker.HALF_OPEN
+    breaker.before_call("/WiseNLU")
+    with pytest.raises(CircuitOpenException):
+        breaker.before_call("/WiseNLU")
+    breaker.record("/WiseNLU", HTTPConnectionException())
+    assert breaker.state("/WiseNLU") == CircuitBreaker.OPEN
+
+    now[0] = 20.0
+    breaker.before_call("/WiseNLU")
+    breaker.record("/WiseNLU")
+    assert breaker.state("/WiseNLU") == CircuitBreaker.CLOSED
+
+
+# 429, 4xx, 마감 시각 초과는 실패로 세지 않습니다.
+def test_circuit_breaker_ignored_errors():
+    breaker = CircuitBreaker(failure_threshold=1)
+    for error in (
+        HTTPStatusException.from_status(429),
+        HTTPStatusException.from_status(400),
+        DeadlineExceededException(),
+        ValueError(),
+    ):
+        breaker.record("/WiseNLU", error)
+    assert breaker.state("/WiseNLU") == CircuitBreaker.CLOSED
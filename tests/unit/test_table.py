@@ -0,0 +1,75 @@
+import pytest
+from etripy.model.language import AnalysisResult
+from etripy.table import CorpusTable, Vocabulary
+
+pytest.importorskip("numpy")
+
+
+def _sentence(number: int, morps: list, entities: list = ()) -> dict:
+    return {
+        "id": number,
+        "morp": [
+            {"id": i, "lemma": lemma, "type": tag, "position": i * 3}
+            for i, (lemma, tag) in enumerate(morps)
+        ],
+        "word": [{"id": 0, "text": "어절", "begin": 0, "end": len(morps) - 1}],
+        "NE": [
+            {"id": i, "text": text, "type": kind, "begin": 0, "end": 0}
+            for i, (text, kind) in enumerate(entities)
+        ],
+    }
+
+
+def _table() -> CorpusTable:
+    return CorpusTable.from_results(
+        [
+            AnalysisResult(
+                data={},
+                sentence=[
+                    _sentence(0, [("윤동주", "NNP"), ("는", "JX")], [("윤동주", "PS_NAME")]),
+                    _sentence(1, [("시인", "NNG"), ("이", None)]),
+                ],
+            ),
+            [_sentence(0, [("서울", "NNP")], [("서울", "LCP_CITY"), ("한국", None)])],
+        ]
+    )
+
+
+# 코드는 처음 나온 순서대로 붙고, 값이 없으면 `-1`입니다.
+def test_vocabulary():
+    vocab = Vocabulary()
+    assert vocab.encode(["NNP", None, "JX", "NNP"]) == [0, -1, 1, 0]
+    assert (vocab.code("JX"), vocab.code("VV"), vocab.code(None)) == (1, -1, -1)
+    assert vocab.decode([1, -1]) == ["JX", None]
+
+
+# 문자열 조건은 코드로 바꿔 배열 연산으로 고르고, 행을 추가하면 다음에 읽을 때 반영됩니다.
+def test_where():
+    table = _table()
+    assert len(table) == 2
+    assert table.morp.where(type="NNP").decode("lemma") == ["윤동주", "서울"]
+    assert table.morp.where(type="NNP", doc=range(1, 2)).decode("lemma") == ["서울"]
+    assert table.morp.where(type=["JX", "NNG"]).decode("lemma") == ["는", "시인"]
+    assert table.morp.where(type=None).decode("lemma") == ["이"]
+    assert table.morp.where(doc=0)["word"].tolist() == [0, 0, 0, 0]
+    table.add([_sentence(0, [("부산", "NNP")])])
+    assert table.morp.where(type="NNP").decode("lemma") == ["윤동주", "서울", "부산"]
+
+
+# 어휘 표에 없는 문자열은 값이 없는 행과 섞이지 않고 아무 행도 고르지 않습니다.
+def test_unknown_string():
+    table = _table()
+    assert len(table.morp.where(type="VV")) == 0
+    assert len(table.morp.where(type=["VV", "JX"])) == 1
+    assert not table.ne.mask(type="DT_YEAR").any()
+    assert table.ne.where(type=None).decode("text") == ["한국"]
+
+
+# 값 조합별 행 수를 값이 없는 행까지 셉니다.
+def test_count_by():
+    counts = _table().ne.count_by("doc", "type").to_dict()
+    assert counts == {
+        "doc": [0, 1, 1],
+        "type": ["PS_NAME", None, "LCP_CITY"],
+        "count": [1, 1, 1],
+    }
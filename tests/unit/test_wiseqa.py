@@ -0,0 +1,18 @@
+from etripy.model.language.wiseqa import OrgQUnit, WiseQAnalResult
+
+NDOC = {"sentence": [{"id": 0, "text": "윤동주는 누구인가?", "morp": []}]}
+
+
+# 질문의 언어분석 결과는 처음 접근할 때 한 번만 만듭니다.
+def test_ndoc_cached():
+    unit = OrgQUnit(ndoc=NDOC)
+    assert unit.Ndoc is unit.Ndoc
+    assert unit.Ndoc.Sentence is unit.Ndoc.Sentence
+    assert OrgQUnit().Ndoc is not None
+
+
+# 질문분류 정보도 처음 접근할 때 한 번만 만듭니다.
+def test_qclassification_cached():
+    result = WiseQAnalResult(data={"return_object": {"QClassification": {}}})
+    assert result.QClassification is result.QClassification
+    assert result.OrgQInfo is result.OrgQInfo